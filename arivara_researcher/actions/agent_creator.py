@@ -46,6 +46,9 @@ async def choose_agent(
             llm_kwargs=cfg.llm_kwargs,
             cost_callback=cost_callback,
             token_tracker=token_tracker,
+            cache_site="choose_agent",
+            cache_query=query,
+            fallback=True,
             **kwargs
         )
 
@@ -2,6 +2,8 @@ import re
 import markdown
 from typing import List, Dict
 
+from ..utils.urls import canonicalize_url
+
 def extract_headers(markdown_text: str) -> List[Dict]:
     """
     Extract headers from markdown text.
@@ -104,7 +106,12 @@ def add_references(report_markdown: str, visited_urls: set) -> str:
     """
     try:
         url_markdown = "\n\n\n## References\n\n"
-        url_markdown += "".join(f"- [{url}]({url})\n" for url in visited_urls)
+        # One entry per page, however many variants of its url were visited; cite the
+        # first variant as it was found rather than its canonical form
+        urls = {}
+        for url in visited_urls:
+            urls.setdefault(canonicalize_url(url), url)
+        url_markdown += "".join(f"- [{url}]({url})\n" for url in urls.values())
         updated_markdown_report = report_markdown + url_markdown
         return updated_markdown_report
     except Exception as e:
@@ -3,6 +3,7 @@ import json_repair
 from arivara_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
 from ..prompts import PromptFamily
+from ..retrievers.cache import cached_search
 from typing import Any, List, Dict
 from ..config import Config
 import logging
@@ -13,6 +14,8 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
     """
     Get web search results for a given query.
 
+    Non-MCP retrievers go through the shared search result cache.
+
     Args:
         query: The search query
         retriever: The retriever instance
@@ -29,10 +32,10 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
             query_domains=query_domains,
             researcher=researcher  # Pass researcher instance for MCP retrievers
         )
-    else:
-        search_retriever = retriever(query, query_domains=query_domains)
-    
-    return search_retriever.search()
+        return search_retriever.search()
+
+    cfg = researcher.cfg if researcher is not None else None
+    return cached_search(retriever, query, query_domains=query_domains, cfg=cfg)
 
 async def generate_sub_queries(
     query: str,
@@ -82,6 +85,8 @@ async def generate_sub_queries(
             reasoning_effort=ReasoningEfforts.Medium.value,
             cost_callback=cost_callback,
             token_tracker=token_tracker,
+            cache_site="generate_sub_queries",
+            cache_query=query,
             **kwargs
         )
     except Exception as e:
@@ -95,6 +100,8 @@ async def generate_sub_queries(
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
                 token_tracker=token_tracker,
+                cache_site="generate_sub_queries",
+                cache_query=query,
                 **kwargs
             )
             logger.warning(f"Retrying with max_tokens={cfg.strategic_token_limit} successful.")
@@ -110,6 +117,9 @@ async def generate_sub_queries(
                 llm_kwargs=cfg.llm_kwargs,
                 cost_callback=cost_callback,
                 token_tracker=token_tracker,
+                cache_site="generate_sub_queries",
+                cache_query=query,
+                fallback=True,
                 **kwargs
             )
 
@@ -3,57 +3,70 @@ from typing import List, Dict, Any
 from ..config.config import Config
 from ..utils.llm import create_chat_completion
 from ..utils.logger import get_formatted_logger
+from ..utils.tokenizer import count_tokens
+from ..context.packer import ContextPacker
 from ..prompts import PromptFamily, get_prompt_by_report_type
 from ..utils.enum import Tone, ReportType
 
 logger = get_formatted_logger()
 
 
-def estimate_tokens(text: str) -> int:
+MAX_CONTEXT_TOKENS = 20000
+DEEP_RESEARCH_MAX_CONTEXT_TOKENS = 35000  # 35k context + 16k output stays clear of rate limits
+
+
+def estimate_tokens(text: str, model: str | None = None) -> int:
     """
-    Rough estimation of tokens (1 token ≈ 4 characters for English text).
-    This is a conservative estimate to avoid token limit errors.
+    Number of tokens in ``text``, counted with ``model``'s tokenizer when it is available.
     """
-    if not text:
-        return 0
-    # Rough estimate: 1 token ≈ 4 characters
-    return len(text) // 4
+    return count_tokens(text, model)
+
+
+def context_token_budget(report_type: str) -> int:
+    """Maximum research context tokens sent with a report prompt of ``report_type``."""
+    if report_type == "deep" or report_type == ReportType.DeepResearch.value:
+        return DEEP_RESEARCH_MAX_CONTEXT_TOKENS
+    return MAX_CONTEXT_TOKENS
 
 
-def truncate_context_for_tokens(context: str, max_tokens: int = 20000) -> str:
+def truncate_context_for_tokens(context: str, max_tokens: int = 20000, model: str | None = None) -> str:
     """
-    Truncate context to stay within token limit.
-    Keeps the beginning and end of context to preserve important information.
-    
+    Fit context into a token limit by dropping whole source blocks, keeping their order.
+
     Args:
         context: The context string to truncate
         max_tokens: Maximum tokens allowed (default 20000 to leave room for output)
-    
+        model: Model whose tokenizer counts the tokens
+
     Returns:
         Truncated context string
     """
-    if not context:
-        return context
-    
-    estimated_tokens = estimate_tokens(context)
-    
-    if estimated_tokens <= max_tokens:
-        return context
-    
-    # Truncate: keep first 40% and last 40% to preserve important info
-    # This ensures we keep both introduction and conclusion
-    target_chars = max_tokens * 4  # Convert tokens back to chars
-    first_part = int(target_chars * 0.4)
-    last_part = int(target_chars * 0.4)
-    
-    if len(context) <= target_chars:
-        return context
-    
-    truncated = context[:first_part] + "\n\n[... Context truncated due to size limit ...]\n\n" + context[-last_part:]
-    
-    logger.warning(f"Context truncated: {estimated_tokens} tokens -> ~{estimate_tokens(truncated)} tokens (original length: {len(context)}, truncated: {len(truncated)})")
-    
-    return truncated
+    return ContextPacker(model=model).pack(context, max_tokens)
+
+
+async def pack_context_for_tokens(
+    context: str, query: str, max_tokens: int, model: str | None = None, embeddings=None
+) -> str:
+    """
+    Fit context into a token limit, keeping the source blocks most relevant to ``query``.
+
+    Args:
+        context: The context string to pack
+        query: The research query blocks are ranked against
+        max_tokens: Maximum tokens allowed
+        model: Model whose tokenizer counts the tokens
+        embeddings: Embeddings used for ranking; without them blocks are kept in order
+
+    Returns:
+        Packed context string
+    """
+    packed = await ContextPacker(embeddings, model).apack(context, query, max_tokens)
+    if packed is not context:
+        logger.warning(
+            f"Context packed: {estimate_tokens(context, model)} tokens -> {estimate_tokens(packed, model)} tokens "
+            f"(original length: {len(context)}, packed: {len(packed)})"
+        )
+    return packed
 
 
 async def write_report_introduction(
@@ -294,45 +307,35 @@ async def generate_report(
     import logging
     report_logger = logging.getLogger(__name__)
     
-    # Truncate context if it's too large to avoid token limit errors
-    # For deep research, allow much more context to generate comprehensive 20+ page reports
+    # Fit the context into the token budget, keeping the sources most relevant to the query
+    # Deep research gets a larger budget to generate comprehensive 20+ page reports
     if isinstance(context, str):
-        original_context_length = len(context)
-        estimated_context_tokens = estimate_tokens(context)
-        
-        # For deep research, use moderate context limit to avoid rate limits
-        # Reduce context size to prevent hitting rate limits while still maintaining quality
-        if report_type == "deep" or report_type == ReportType.DeepResearch.value:
-            max_context_tokens = 35000  # Reduced from 50k to 35k to avoid rate limits (50k + 16k output = 66k was too close to limits)
-            if estimated_context_tokens > max_context_tokens:
-                report_logger.warning(f"Deep research context very large ({estimated_context_tokens} tokens), truncating to {max_context_tokens} to avoid rate limits...")
-                context = truncate_context_for_tokens(context, max_tokens=max_context_tokens)
-                if websocket:
-                    try:
-                        await websocket.send_json({
-                            "type": "logs",
-                            "content": "context_truncated",
-                            "output": f"⚠️ Deep research context was very large ({estimated_context_tokens} tokens). Truncated to {max_context_tokens} tokens to prevent rate limits while ensuring comprehensive report generation."
-                        })
-                    except:
-                        pass
-            else:
-                report_logger.info(f"Deep research context size: {estimated_context_tokens} tokens (within {max_context_tokens} limit)")
-        else:
-            # For regular reports, use lower limit
-            max_context_tokens = 20000
-            if estimated_context_tokens > max_context_tokens:
-                report_logger.warning(f"Context too large ({estimated_context_tokens} tokens), truncating to avoid rate limit...")
-                context = truncate_context_for_tokens(context, max_tokens=max_context_tokens)
-                if websocket:
-                    try:
-                        await websocket.send_json({
-                            "type": "logs",
-                            "content": "context_truncated",
-                            "output": f"⚠️ Context was very large ({estimated_context_tokens} tokens). Truncated to fit within API limits."
-                        })
-                    except:
-                        pass
+        estimated_context_tokens = estimate_tokens(context, cfg.smart_llm_model)
+        max_context_tokens = context_token_budget(report_type)
+        is_deep = report_type == "deep" or report_type == ReportType.DeepResearch.value
+
+        if estimated_context_tokens > max_context_tokens:
+            report_logger.warning(f"Context too large ({estimated_context_tokens} tokens), packing to {max_context_tokens} to avoid rate limits...")
+            researcher = kwargs.get("researcher")
+            embeddings = researcher.memory.get_embeddings() if researcher is not None else None
+            context = await pack_context_for_tokens(
+                context, query, max_context_tokens, model=cfg.smart_llm_model, embeddings=embeddings
+            )
+            if websocket:
+                if is_deep:
+                    output = f"⚠️ Deep research context was very large ({estimated_context_tokens} tokens). Kept the most relevant sources within {max_context_tokens} tokens to prevent rate limits while ensuring comprehensive report generation."
+                else:
+                    output = f"⚠️ Context was very large ({estimated_context_tokens} tokens). Kept the most relevant sources to fit within API limits."
+                try:
+                    await websocket.send_json({
+                        "type": "logs",
+                        "content": "context_truncated",
+                        "output": output
+                    })
+                except:
+                    pass
+        elif is_deep:
+            report_logger.info(f"Deep research context size: {estimated_context_tokens} tokens (within {max_context_tokens} limit)")
     
     generate_prompt = get_prompt_by_report_type(report_type, prompt_family)
     report = ""
@@ -354,7 +357,7 @@ async def generate_report(
         content = f"{generate_prompt(query, context, report_source, report_format=cfg.report_format, tone=tone, total_words=total_words, language=cfg.language)}"
     
     # Estimate total tokens for the request and adjust max_tokens if needed
-    estimated_input_tokens = estimate_tokens(content) + estimate_tokens(agent_role_prompt)
+    estimated_input_tokens = estimate_tokens(content, cfg.smart_llm_model) + estimate_tokens(agent_role_prompt, cfg.smart_llm_model)
     
     # For deep research, use maximum output tokens to allow for comprehensive reports (targeting 16-20 pages)
     if report_type == "deep" or report_type == ReportType.DeepResearch.value:
@@ -2,13 +2,36 @@ from typing import Any
 from colorama import Fore, Style
 
 from arivara_researcher.utils.workers import WorkerPool
-from ..scraper import Scraper
+from ..scraper import NoDriverScraper, Scraper
+from ..scraper.browser.driver_pool import get_driver_pool
+from ..scraper.http_client import get_http_client
+from ..scraper.page_cache import get_page_cache
+from ..utils.pdf_ingest import get_pdf_ingestor
 from ..config.config import Config
 from ..utils.logger import get_formatted_logger
 
 logger = get_formatted_logger()
 
 
+def configure_browser_pool(cfg: Config) -> None:
+    """Apply the browser pool settings from the config to the shared NoDriver and Selenium pools."""
+    NoDriverScraper.configure(
+        max_browsers=cfg.browser_pool_max_browsers,
+        max_tabs_per_browser=cfg.browser_pool_max_tabs,
+        browser_load_threshold=cfg.browser_pool_load_threshold,
+        idle_timeout=cfg.browser_pool_idle_timeout,
+        min_browsers=cfg.browser_pool_prewarm,
+        reuse_tabs=cfg.browser_pool_reuse_tabs,
+        blocked_resource_types=cfg.browser_blocked_resources,
+        headless=cfg.browser_headless,
+    )
+    get_driver_pool().configure(
+        max_drivers=cfg.selenium_pool_size,
+        max_uses=cfg.selenium_pool_max_uses,
+        headless=cfg.browser_headless,
+    )
+
+
 async def scrape_urls(
     urls, cfg: Config, worker_pool: WorkerPool
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
@@ -31,7 +54,22 @@ async def scrape_urls(
     )
 
     try:
-        scraper = Scraper(urls, user_agent, cfg.scraper, worker_pool=worker_pool)
+        get_http_client(cfg)
+        get_page_cache(cfg)
+        get_pdf_ingestor(cfg)
+        configure_browser_pool(cfg)
+        scraper = Scraper(
+            urls,
+            user_agent,
+            cfg.scraper,
+            worker_pool=worker_pool,
+            min_pages=cfg.scraper_min_pages,
+            completion_ratio=cfg.scraper_completion_ratio,
+            deadline=cfg.scraper_deadline,
+            straggler_policy=cfg.scraper_straggler_policy,
+            tiers=cfg.scraper_tiers,
+            tier_min_content=cfg.scraper_tier_min_content,
+        )
         scraped_data = await scraper.run()
         for item in scraped_data:
             if 'image_urls' in item:
@@ -42,6 +80,45 @@ async def scrape_urls(
     return scraped_data, images
 
 
+async def scrape_urls_stream(urls, cfg: Config, worker_pool: WorkerPool):
+    """
+    Scrapes the urls, yielding each page as soon as it is scraped
+    Args:
+        urls: List of urls
+        cfg: Config (optional)
+
+    Yields:
+        dict[str, Any]: scraped content of a single page
+    """
+    user_agent = (
+        cfg.user_agent
+        if cfg
+        else "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
+    )
+
+    try:
+        get_http_client(cfg)
+        get_page_cache(cfg)
+        get_pdf_ingestor(cfg)
+        configure_browser_pool(cfg)
+        scraper = Scraper(
+            urls,
+            user_agent,
+            cfg.scraper,
+            worker_pool=worker_pool,
+            min_pages=cfg.scraper_min_pages,
+            completion_ratio=cfg.scraper_completion_ratio,
+            deadline=cfg.scraper_deadline,
+            straggler_policy=cfg.scraper_straggler_policy,
+            tiers=cfg.scraper_tiers,
+            tier_min_content=cfg.scraper_tier_min_content,
+        )
+        async for item in scraper.stream():
+            yield item
+    except Exception as e:
+        print(f"{Fore.RED}Error in scrape_urls_stream: {e}{Style.RESET_ALL}")
+
+
 async def filter_urls(urls: list[str], config: Config) -> list[str]:
     """
     Filter URLs based on configuration settings.
@@ -4,8 +4,15 @@ import os
 
 from .config import Config
 from .memory import Memory
+from .memory.embedding_cache import get_embedding_cache
 from .utils.enum import ReportSource, ReportType, Tone
-from .llm_provider import GenericLLMProvider
+from .llm_provider import (
+    GenericLLMProvider,
+    get_llm_governor,
+    get_llm_resilience,
+    get_llm_response_cache,
+    get_provider_registry,
+)
 from .prompts import get_prompt_family
 from .vector_store import VectorStoreWrapper
 
@@ -16,6 +23,9 @@ from .skills.context_manager import ContextManager
 from .skills.browser import BrowserManager
 from .skills.curator import SourceCurator
 from .skills.deep_research import DeepResearchSkill
+from .scraper.single_flight import InFlightScrapes
+from .context.chunk_store import ChunkStore
+from .context.written_sections import WrittenSectionIndex
 
 from .actions import (
     add_references,
@@ -59,6 +69,8 @@ class Arivara_researcher:
         mcp_configs: list[dict] | None = None,
         mcp_max_iterations: int | None = None,
         mcp_strategy: str | None = None,
+        inflight_scrapes: InFlightScrapes | None = None,
+        chunk_store: ChunkStore | None = None,
         **kwargs
     ):
         """
@@ -113,6 +125,10 @@ class Arivara_researcher:
                 - "fast" (default): Run MCP once with original query for best performance
                 - "deep": Run MCP for all sub-queries for maximum thoroughness  
                 - "disabled": Skip MCP entirely, use only web retrievers
+            inflight_scrapes (InFlightScrapes, optional): In-flight scrape registry to share,
+                e.g. the parent's when this is a nested researcher.
+            chunk_store (ChunkStore, optional): Store of page chunks and their embeddings to
+                share, e.g. the parent's when this is a nested researcher.
         """
         self.kwargs = kwargs
         self.query = query
@@ -130,7 +146,9 @@ class Arivara_researcher:
         self.research_sources = []  # The list of scraped sources including title, content and images
         self.research_images = []  # The list of selected research images
         self.documents = documents
-        self.vector_store = VectorStoreWrapper(vector_store) if vector_store else None
+        # Pages are split and embedded once per research, shared with nested researchers
+        self.chunk_store = chunk_store or ChunkStore()
+        self.vector_store = VectorStoreWrapper(vector_store, self.chunk_store) if vector_store else None
         self.vector_store_filter = vector_store_filter
         self.websocket = websocket
         self.agent = agent
@@ -138,6 +156,10 @@ class Arivara_researcher:
         self.parent_query = parent_query
         self.subtopics = subtopics or []
         self.visited_urls = visited_urls or set()
+        # Concurrent scrapes of one page by this researcher and its nested researchers are single-flighted
+        self.inflight_scrapes = inflight_scrapes or (
+            InFlightScrapes() if self.cfg.scrape_single_flight == "researcher" else None
+        )
         self.verbose = verbose
         self.context = context or []
         self.headers = headers or {}
@@ -155,6 +177,11 @@ class Arivara_researcher:
             self._process_mcp_configs(mcp_configs)
         
         self.retrievers = get_retrievers(self.headers, self.cfg)
+        get_embedding_cache(self.cfg)
+        get_provider_registry(self.cfg)
+        get_llm_response_cache(self.cfg)
+        get_llm_governor(self.cfg)
+        get_llm_resilience(self.cfg)
         self.memory = Memory(
             self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
         )
@@ -430,13 +457,15 @@ class Arivara_researcher:
         current_subtopic: str,
         draft_section_titles: list[str],
         written_contents: list[dict],
-        max_results: int = 10
+        max_results: int = 10,
+        written_index: WrittenSectionIndex | None = None,
     ) -> list[str]:
         return await self.context_manager.get_similar_written_contents_by_draft_section_titles(
             current_subtopic,
             draft_section_titles,
             written_contents,
-            max_results
+            max_results,
+            written_index=written_index,
         )
 
     # Utility methods
@@ -25,13 +25,55 @@ class BaseConfig(TypedDict):
     LANGUAGE: str
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
+    SCRAPER_TIERS: List[str]
+    SCRAPER_TIER_MIN_CONTENT: int
     MAX_SCRAPER_WORKERS: int
     SCRAPER_RATE_LIMIT_DELAY: float
+    RATE_LIMITS: Dict[str, Dict[str, float]]
+    SCRAPER_PARSE_EXECUTOR: str
+    SCRAPER_PARSE_WORKERS: int
+    SCRAPER_MIN_PAGES: int
+    SCRAPER_COMPLETION_RATIO: float
+    SCRAPER_DEADLINE: float
+    SCRAPER_STRAGGLER_POLICY: str
+    SCRAPE_SINGLE_FLIGHT: str
+    BROWSER_POOL_MAX_BROWSERS: int
+    BROWSER_POOL_MAX_TABS: int
+    BROWSER_POOL_LOAD_THRESHOLD: int
+    BROWSER_POOL_IDLE_TIMEOUT: float
+    BROWSER_POOL_PREWARM: int
+    BROWSER_POOL_REUSE_TABS: bool
+    BROWSER_BLOCKED_RESOURCES: List[str]
+    BROWSER_HEADLESS: bool
+    SELENIUM_POOL_SIZE: int
+    SELENIUM_POOL_MAX_USES: int
+    HTTP_MAX_CONNECTIONS: int
+    HTTP_MAX_CONNECTIONS_PER_HOST: int
+    HTTP_DNS_CACHE_TTL: int
+    HTTP_MAX_RESPONSE_BYTES: int
+    HTTP_TIMEOUT: float
+    PDF_MAX_BYTES: int
+    PDF_MAX_CHARS: int
+    PDF_PARSE_WORKERS: int
+    PDF_TIMEOUT: float
+    NEAR_DUPLICATE_FILTER: bool
+    NEAR_DUPLICATE_THRESHOLD: float
+    URL_STRIP_PARAMS: Union[List[str], None]
+    URL_DOMAIN_RULES: Dict[str, Dict[str, Any]]
     MAX_SUBTOPICS: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
     PROMPT_FAMILY: str
     LLM_KWARGS: dict
+    LLM_PROVIDER_CACHE_SIZE: int
+    LLM_MAX_CONCURRENCY: int
+    LLM_RATE_LIMITS: Dict[str, Dict[str, float]]
+    LLM_MAX_RETRIES: int
+    LLM_RETRY_BASE_DELAY: float
+    LLM_RETRY_MAX_DELAY: float
+    LLM_CIRCUIT_BREAKER_THRESHOLD: int
+    LLM_CIRCUIT_BREAKER_RESET: float
+    LLM_FALLBACK: str
     EMBEDDING_KWARGS: dict
     DEEP_RESEARCH_CONCURRENCY: int
     DEEP_RESEARCH_DEPTH: int
@@ -42,3 +84,27 @@ class BaseConfig(TypedDict):
     MCP_ALLOWED_ROOT_PATHS: List[str]
     MCP_STRATEGY: str
     REASONING_EFFORT: str
+    RETRIEVER_TIMEOUT: float
+    RETRIEVER_TIMEOUTS: dict
+    RETRIEVER_HEDGE_DELAY: float
+    RETRIEVER_MIN_URLS: int
+    STREAMING_PIPELINE: bool
+    PIPELINE_EMBED_BATCH_SIZE: int
+    PIPELINE_EMBED_WORKERS: int
+    CACHE_DIR: str
+    SEARCH_CACHE_ENABLED: bool
+    SEARCH_CACHE_DISK: bool
+    SEARCH_CACHE_TTL: int
+    SEARCH_CACHE_TTLS: dict
+    SEARCH_CACHE_MAX_ENTRIES: int
+    PAGE_CACHE_ENABLED: bool
+    PAGE_CACHE_TTL: int
+    PAGE_CACHE_MAX_BYTES: int
+    EMBEDDING_CACHE_ENABLED: bool
+    EMBEDDING_CACHE_MAX_ENTRIES: int
+    EMBEDDING_CACHE_BATCH_SIZE: int
+    LLM_RESPONSE_CACHE: bool
+    LLM_RESPONSE_CACHE_TTL: int
+    LLM_RESPONSE_CACHE_TTLS: Dict[str, int]
+    LLM_RESPONSE_CACHE_SEMANTIC: bool
+    LLM_RESPONSE_CACHE_SIMILARITY: float
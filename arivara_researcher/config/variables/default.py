@@ -21,15 +21,57 @@ DEFAULT_CONFIG: BaseConfig = {
     "REPORT_FORMAT": "APA",
     "MAX_ITERATIONS": 3,
     "AGENT_ROLE": None,
-    "SCRAPER": "bs",
+    "SCRAPER": "bs",  # Scraper for every page, or "tiered" to escalate through SCRAPER_TIERS per page
+    "SCRAPER_TIERS": ["lxml", "nodriver"],  # Scrapers tried in order in tiered mode, cheapest first
+    "SCRAPER_TIER_MIN_CONTENT": 500,  # In tiered mode, pages with less text than this go to the next tier
     "MAX_SCRAPER_WORKERS": 15,
-    "SCRAPER_RATE_LIMIT_DELAY": 0.0,  # Minimum seconds between scraper requests globally (0 = no limit)
+    "SCRAPER_RATE_LIMIT_DELAY": 0.0,  # Minimum seconds between scraper requests to the same host or API provider (0 = no limit)
+    "RATE_LIMITS": {},  # Token buckets per host or provider, e.g. {"firecrawl": {"rate": 0.16, "burst": 1}}
+    "SCRAPER_PARSE_EXECUTOR": "thread",  # Run HTML extraction in "thread"s or a shared "process" pool
+    "SCRAPER_PARSE_WORKERS": 0,  # Extraction processes for the "process" executor (0 = one per CPU)
+    "SCRAPER_MIN_PAGES": 0,  # Return once this many pages scraped successfully (0 = wait for all)
+    "SCRAPER_COMPLETION_RATIO": 1.0,  # Return once this fraction of URLs finished, success or not
+    "SCRAPER_DEADLINE": 0.0,  # Wall-clock seconds before returning whatever has been scraped (0 = no deadline)
+    "SCRAPER_STRAGGLER_POLICY": "cancel",  # What to do with unfinished scrapes: "cancel" or "background"
+    "SCRAPE_SINGLE_FLIGHT": "researcher",  # Share in-flight scrapes of a url per "researcher" tree, per "process", or "off"
+    "BROWSER_POOL_MAX_BROWSERS": 3,  # Headless browsers the nodriver scraper may run at once
+    "BROWSER_POOL_MAX_TABS": 8,  # Pages a single browser loads concurrently
+    "BROWSER_POOL_LOAD_THRESHOLD": 5,  # Open pages at which another browser is started (up to the max)
+    "BROWSER_POOL_IDLE_TIMEOUT": 300.0,  # Seconds an idle browser is kept warm (0 = stop as soon as idle)
+    "BROWSER_POOL_PREWARM": 0,  # Browsers started at server startup and kept warm
+    "BROWSER_POOL_REUSE_TABS": True,  # Reuse finished tabs instead of opening new ones
+    "BROWSER_BLOCKED_RESOURCES": ["Image", "Font", "Media"],  # CDP resource types the browser never downloads
+    "BROWSER_HEADLESS": False,  # Run the nodriver and selenium browsers headless
+    "SELENIUM_POOL_SIZE": 4,  # Reusable WebDrivers for the "browser" scraper
+    "SELENIUM_POOL_MAX_USES": 50,  # Pages a WebDriver loads before it is replaced
+    "HTTP_MAX_CONNECTIONS": 100,  # Total pooled connections for the async scrapers (0 = unlimited)
+    "HTTP_MAX_CONNECTIONS_PER_HOST": 4,  # Pooled connections to a single host (0 = unlimited)
+    "HTTP_DNS_CACHE_TTL": 300,  # Seconds DNS lookups are cached
+    "HTTP_MAX_RESPONSE_BYTES": 10485760,  # Page bodies are truncated after this many decompressed bytes
+    "HTTP_TIMEOUT": 4.0,  # Total seconds allowed for a single page request
+    "PDF_MAX_BYTES": 33554432,  # PDF downloads are cut off after this many bytes
+    "PDF_MAX_CHARS": 8000,  # Characters extracted from a scraped PDF (0 = whole document)
+    "PDF_PARSE_WORKERS": 0,  # Processes parsing page ranges of full local/online documents (0 = inline)
+    "PDF_TIMEOUT": 10.0,  # Total seconds allowed for a PDF download
+    "NEAR_DUPLICATE_FILTER": True,  # Skip scraped pages that near-duplicate a page already scraped
+    "NEAR_DUPLICATE_THRESHOLD": 0.8,  # Estimated shingle (Jaccard) similarity at which two pages are duplicates
+    "URL_STRIP_PARAMS": None,  # Query params (glob patterns allowed) dropped from canonical urls (None = built-in tracking list)
+    "URL_DOMAIN_RULES": {},  # Per-domain url rules, e.g. {"example.com": {"keep_params": ["id"], "keep_trailing_slash": true}}
     "MAX_SUBTOPICS": 3,
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
     "DOC_PATH": "./my-docs",
     "PROMPT_FAMILY": "default",
     "LLM_KWARGS": {},
+    "LLM_PROVIDER_CACHE_SIZE": 32,  # LLM clients kept for reuse per event loop (0 = build one per call)
+    "LLM_MAX_CONCURRENCY": 16,  # Upper bound of concurrent calls per model; lowered adaptively on 429s (0 = ungoverned)
+    "LLM_RATE_LIMITS": {},  # Per-model budgets, e.g. {"openai:gpt-4.1": {"rpm": 500, "tpm": 30000, "concurrency": 8}}
+    "LLM_MAX_RETRIES": 3,  # Retries of LLM calls failing with rate limits, timeouts or 5xx errors
+    "LLM_RETRY_BASE_DELAY": 1.0,  # Backoff cap of the first retry in seconds (doubles per retry, full jitter)
+    "LLM_RETRY_MAX_DELAY": 30.0,  # Largest backoff between retries in seconds
+    "LLM_CIRCUIT_BREAKER_THRESHOLD": 5,  # Consecutive failures after which a provider fails fast
+    "LLM_CIRCUIT_BREAKER_RESET": 30.0,  # Seconds a failing provider is skipped before it is probed again
+    "LLM_FALLBACK": "",  # "<provider>:<model>" answering planning calls when their LLM is down (e.g. the FAST_LLM)
     "EMBEDDING_KWARGS": {},
     "VERBOSE": False,
     # Deep research specific settings - optimized for 16-20 page comprehensive reports
@@ -43,4 +85,34 @@ DEFAULT_CONFIG: BaseConfig = {
     "MCP_ALLOWED_ROOT_PATHS": [],  # List of allowed root paths for local file access
     "MCP_STRATEGY": "fast",  # MCP execution strategy: "fast", "deep", "disabled"
     "REASONING_EFFORT": "medium",
+
+    # Multi-retriever fan-out
+    "RETRIEVER_TIMEOUT": 20.0,  # Per-retriever search deadline in seconds (0 = no deadline)
+    "RETRIEVER_TIMEOUTS": {},  # Per-retriever deadline overrides, e.g. {"google": 5}
+    "RETRIEVER_HEDGE_DELAY": 0.0,  # Send a second request to a retriever slower than this (0 = no hedging)
+    "RETRIEVER_MIN_URLS": 0,  # Stop waiting for slower retrievers once this many URLs arrived (0 = wait for all)
+
+    # Streaming scrape -> chunk -> embed pipeline per sub-query
+    "STREAMING_PIPELINE": True,  # Embed pages as their scrape finishes instead of after all scrapes
+    "PIPELINE_EMBED_BATCH_SIZE": 64,  # Max chunks per embedding request
+    "PIPELINE_EMBED_WORKERS": 2,  # Concurrent embedding requests per sub-query
+
+    # Caching
+    "CACHE_DIR": "./.arivara_cache",  # Root directory for on-disk caches
+    "SEARCH_CACHE_ENABLED": True,  # Cache retriever search results
+    "SEARCH_CACHE_DISK": True,  # Persist search results to SQLite under CACHE_DIR
+    "SEARCH_CACHE_TTL": 3600,  # Default seconds a search result stays fresh
+    "SEARCH_CACHE_TTLS": {},  # Per-retriever TTL overrides, e.g. {"tavily": 900, "arxiv": 86400}
+    "SEARCH_CACHE_MAX_ENTRIES": 1024,  # Size of the in-process LRU tier
+    "PAGE_CACHE_ENABLED": True,  # Cache extracted pages under CACHE_DIR
+    "PAGE_CACHE_TTL": 86400,  # Seconds a cached page is served before it is revalidated
+    "PAGE_CACHE_MAX_BYTES": 268435456,  # Compressed size at which least-recently-used pages are evicted
+    "EMBEDDING_CACHE_ENABLED": True,  # Reuse embeddings of identical texts across sub-queries and runs
+    "EMBEDDING_CACHE_MAX_ENTRIES": 50000,  # Vectors kept per embedding model before least-recently-used eviction
+    "EMBEDDING_CACHE_BATCH_SIZE": 256,  # Maximum uncached texts sent to the embedding provider per request
+    "LLM_RESPONSE_CACHE": False,  # Serve repeated planning calls (agent choice, sub-queries, ...) from CACHE_DIR
+    "LLM_RESPONSE_CACHE_TTL": 86400,  # Seconds a cached LLM response stays fresh
+    "LLM_RESPONSE_CACHE_TTLS": {},  # Per-call-site TTLs, e.g. {"choose_agent": 604800}
+    "LLM_RESPONSE_CACHE_SEMANTIC": False,  # Also reuse responses to near-identical queries under the same prompt template (uses the embedding model)
+    "LLM_RESPONSE_CACHE_SIMILARITY": 0.98,  # Minimum query similarity of a semantic hit
 }
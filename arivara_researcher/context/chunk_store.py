@@ -0,0 +1,136 @@
+"""
+Research-scoped store of page chunks and their embeddings.
+
+Every compressor that looks at a page used to split it again, and so did each subtopic
+researcher of a detailed report. `ChunkStore` splits a page once per chunking profile
+(chunk size and overlap), keeps the chunk text and offsets and caches each chunk's
+embedding per embedding model, so later lookups by page id are free.
+"""
+import asyncio
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from ..utils.urls import canonicalize_url
+
+
+@dataclass
+class Chunk:
+    """A slice of a page's ``raw_content``."""
+    id: str
+    page: Dict[str, Any]
+    text: str
+    start: int
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.text)
+
+    def to_document(self) -> Document:
+        return Document(
+            page_content=self.text,
+            metadata={
+                "title": self.page.get("title", ""),
+                "source": self.page.get("url", ""),
+                "duplicate_urls": self.page.get("duplicate_urls", []),
+            },
+        )
+
+
+class ChunkStore:
+    """
+    Chunks and chunk embeddings of the pages seen by a researcher and its child researchers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._splitters: Dict[Tuple[int, int], RecursiveCharacterTextSplitter] = {}
+        self._chunks: Dict[Tuple[str, int, int], List[Chunk]] = {}
+        self._vectors: Dict[Tuple[str, str], np.ndarray] = {}
+        self.stats: Dict[str, int] = {"pages_split": 0, "pages_reused": 0, "chunks_embedded": 0, "chunks_reused": 0}
+
+    @staticmethod
+    def page_id(page: Dict[str, Any]) -> str:
+        """Identity of a page: its canonical url and a hash of its content."""
+        digest = hashlib.sha256(canonicalize_url(page.get("url") or "").encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((page.get("raw_content") or "").encode("utf-8"))
+        return digest.hexdigest()[:24]
+
+    def _splitter(self, chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+        with self._lock:
+            splitter = self._splitters.get((chunk_size, chunk_overlap))
+            if splitter is None:
+                splitter = self._splitters[(chunk_size, chunk_overlap)] = RecursiveCharacterTextSplitter(
+                    chunk_size=chunk_size, chunk_overlap=chunk_overlap, add_start_index=True
+                )
+            return splitter
+
+    def split(self, pages: Iterable[Dict[str, Any]], chunk_size: int = 1000, chunk_overlap: int = 100) -> List[Chunk]:
+        """
+        Chunks of ``pages`` in order, splitting only the pages not split with this profile yet.
+        """
+        splitter = self._splitter(chunk_size, chunk_overlap)
+        chunks: List[Chunk] = []
+        for page in pages:
+            content = page.get("raw_content")
+            if not content:
+                continue
+            page_id = self.page_id(page)
+            key = (page_id, chunk_size, chunk_overlap)
+            page_chunks = self._chunks.get(key)
+            if page_chunks is None:
+                page_chunks = [
+                    Chunk(f"{page_id}:{chunk_size}:{chunk_overlap}:{i}", page, doc.page_content, doc.metadata["start_index"])
+                    for i, doc in enumerate(splitter.create_documents([content]))
+                ]
+                with self._lock:
+                    page_chunks = self._chunks.setdefault(key, page_chunks)
+                    self.stats["pages_split"] += 1
+            else:
+                self.stats["pages_reused"] += 1
+            chunks.extend(page_chunks)
+        return chunks
+
+    def chunks(self, page_ids: Iterable[str], chunk_size: int = 1000, chunk_overlap: int = 100) -> List[Chunk]:
+        """Chunks of already split pages, by page id."""
+        return [
+            chunk
+            for page_id in page_ids
+            for chunk in self._chunks.get((page_id, chunk_size, chunk_overlap), [])
+        ]
+
+    @staticmethod
+    def _space(embeddings) -> str:
+        # Cached embeddings know their embedding space; otherwise fall back to the model name
+        return getattr(embeddings, "space", None) or f"{type(embeddings).__name__}:{getattr(embeddings, 'model', '')}"
+
+    async def aembed(self, chunks: List[Chunk], embeddings) -> np.ndarray:
+        """
+        Embeddings of ``chunks`` as a float32 (n, d) matrix, embedding only the chunks
+        without a cached vector for this embedding model.
+        """
+        space = self._space(embeddings)
+        missing = list({chunk.id: chunk for chunk in chunks if (space, chunk.id) not in self._vectors}.values())
+        if missing:
+            vectors = await embeddings.aembed_documents([chunk.text for chunk in missing])
+            with self._lock:
+                for chunk, vector in zip(missing, vectors):
+                    self._vectors[(space, chunk.id)] = np.asarray(vector, dtype=np.float32)
+                self.stats["chunks_embedded"] += len(missing)
+        self.stats["chunks_reused"] += len(chunks) - len(missing)
+        if not chunks:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([self._vectors[(space, chunk.id)] for chunk in chunks])
+
+    async def asplit_and_embed(
+        self, pages: List[Dict[str, Any]], embeddings, chunk_size: int = 1000, chunk_overlap: int = 100
+    ) -> Tuple[List[Chunk], np.ndarray]:
+        """Chunks of ``pages`` and their embeddings; splitting runs off the event loop."""
+        chunks = await asyncio.to_thread(self.split, pages, chunk_size, chunk_overlap)
+        return chunks, await self.aembed(chunks, embeddings)
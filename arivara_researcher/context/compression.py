@@ -1,33 +1,9 @@
 import os
 import asyncio
 from typing import Optional
-from .retriever import SearchAPIRetriever, SectionRetriever
-try:
-    from langchain.retrievers import (
-        ContextualCompressionRetriever,
-    )
-    from langchain.retrievers.document_compressors import (
-        DocumentCompressorPipeline,
-        EmbeddingsFilter,
-    )
-except ImportError:
-    # Fallback for newer langchain versions
-    try:
-        from langchain_community.retrievers import (
-            ContextualCompressionRetriever,
-        )
-        from langchain_community.retrievers.document_compressors import (
-            DocumentCompressorPipeline,
-            EmbeddingsFilter,
-        )
-    except ImportError:
-        from langchain_classic.retrievers import (
-            ContextualCompressionRetriever,
-        )
-        from langchain_classic.retrievers.document_compressors import (
-            DocumentCompressorPipeline,
-            EmbeddingsFilter,
-        )
+from .retriever import SectionRetriever
+from .similarity import EmbeddingsSimilarityFilter
+from .chunk_store import ChunkStore
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from ..vector_store import VectorStoreWrapper
 from ..utils.costs import estimate_embedding_cost
@@ -64,35 +40,28 @@ class ContextCompressor:
         embeddings,
         max_results=5,
         prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+        chunk_store: ChunkStore | None = None,
         **kwargs,
     ):
         self.max_results = max_results
         self.documents = documents
         self.kwargs = kwargs
         self.embeddings = embeddings
-        self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
+        self.similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
         self.prompt_family = prompt_family
-
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SearchAPIRetriever(
-            pages=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
+        self.chunk_store = chunk_store or ChunkStore()
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
         if cost_callback:
             cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
+        relevance_filter = EmbeddingsSimilarityFilter(
+            self.embeddings, similarity_threshold=self.similarity_threshold, k=max_results
+        )
+        (chunks, chunk_vectors), query_vector = await asyncio.gather(
+            self.chunk_store.asplit_and_embed(self.documents, self.embeddings, chunk_size=1000, chunk_overlap=100),
+            self.embeddings.aembed_query(query),
+        )
+        relevant_docs = [chunks[i].to_document() for i in relevance_filter.select(query_vector, chunk_vectors)[0]]
         return self.prompt_family.pretty_print_docs(relevant_docs, max_results)
 
 
@@ -102,28 +71,22 @@ class WrittenContentCompressor:
         self.kwargs = kwargs
         self.embeddings = embeddings
         self.similarity_threshold = similarity_threshold
-
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SectionRetriever(
-            sections=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
 
     def __pretty_docs_list(self, docs, top_n):
         return [f"Title: {d.metadata.get('section_title')}\nContent: {d.page_content}\n" for i, d in enumerate(docs) if i < top_n]
 
-    async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+    async def async_get_contexts(self, queries, max_results=5, cost_callback=None):
+        """Relevant written content for each of ``queries``, embedding the sections only once."""
         if cost_callback:
             cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query, **self.kwargs)
-        return self.__pretty_docs_list(relevant_docs, max_results)
+        docs = SectionRetriever(sections=self.documents).invoke(queries[0]) if queries else []
+        chunks = await asyncio.to_thread(self.splitter.split_documents, docs)
+        relevance_filter = EmbeddingsSimilarityFilter(
+            self.embeddings, similarity_threshold=self.similarity_threshold, k=max_results
+        )
+        relevant_docs = await relevance_filter.afilter(chunks, queries)
+        return [self.__pretty_docs_list(docs, max_results) for docs in relevant_docs]
+
+    async def async_get_context(self, query, max_results=5, cost_callback=None):
+        return (await self.async_get_contexts([query], max_results, cost_callback))[0]
@@ -0,0 +1,87 @@
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+NUM_PERMUTATIONS = 128
+
+# Odd multipliers and offsets of the multiply-shift hash family used as permutations
+_rng = np.random.default_rng(0x5EED)
+_MULTIPLIERS = _rng.integers(1, 2**63, NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_OFFSETS = _rng.integers(0, 2**63, NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def minhash(text: str, shingle_size: int = 5) -> np.ndarray:
+    """
+    MinHash signature of the word shingles of ``text``.
+
+    The fraction of positions where two signatures agree estimates the Jaccard similarity
+    of the pages' shingle sets. Shingles are hashed with Python's ``hash``, so signatures
+    are only comparable within one process.
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= shingle_size:
+        shingles = {tuple(words)}
+    else:
+        shingles = {tuple(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)}
+    hashes = np.fromiter((hash(shingle) for shingle in shingles), dtype=np.int64, count=len(shingles))
+    # uint64 arithmetic wraps, which is what multiply-shift hashing relies on
+    with np.errstate(over="ignore"):
+        permuted = (hashes.view(np.uint64)[:, None] * _MULTIPLIERS + _OFFSETS) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+class NearDuplicateFilter:
+    """
+    Drops scraped pages that are near-duplicates of a page already seen.
+
+    Mirrors, syndicated articles and copies of the same press release are detected by the
+    estimated Jaccard similarity of the word shingles of their ``raw_content``. The first
+    copy is kept and collects the urls of the pages dropped in its favour in
+    ``duplicate_urls``, so they can still be cited.
+    """
+
+    def __init__(self, threshold: float = 0.8, shingle_size: int = 5):
+        """
+        Args:
+            threshold: Pages at least this similar (0-1) to an earlier page are duplicates
+            shingle_size: Words per shingle
+        """
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self._signatures = np.empty((0, NUM_PERMUTATIONS), dtype=np.uint32)
+        self._pages: List[Dict[str, Any]] = []
+        self.dropped = 0
+
+    def find_duplicate(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the already seen page that ``page`` duplicates, or None after remembering ``page``.
+        """
+        content = page.get("raw_content")
+        if not content:
+            return None
+        signature = minhash(content, self.shingle_size)
+        if len(self._pages):
+            similarity = (self._signatures == signature).mean(axis=1)
+            best = int(similarity.argmax())
+            if similarity[best] >= self.threshold:
+                original = self._pages[best]
+                if original.get("url") != page.get("url"):
+                    original.setdefault("duplicate_urls", []).append(page.get("url"))
+                self.dropped += 1
+                logger.info(
+                    f"Dropping {page.get('url')}: {similarity[best]:.0%} similar to {original.get('url')}"
+                )
+                return original
+        self._signatures = np.vstack([self._signatures, signature])
+        self._pages.append(page)
+        return None
+
+    def filter(self, pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the pages that don't duplicate an earlier page, in order."""
+        return [page for page in pages if self.find_duplicate(page) is None]
@@ -0,0 +1,96 @@
+import logging
+import re
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ..utils.tokenizer import count_tokens, truncate_to_tokens
+from .similarity import cosine_similarity
+
+logger = logging.getLogger(__name__)
+
+# Blocks written by PromptFamily.pretty_print_docs start with their source; sub-query
+# contexts are joined with a space, so a block may start with whitespace
+_SOURCE_BLOCK_RE = re.compile(r"(?m)^(?=[ \t]*Source: )")
+_PARAGRAPH_RE = re.compile(r"(?<=\n\n)")
+_CONTENT_RE = re.compile(r"^Content: ", re.MULTILINE)
+
+
+class ContextPacker:
+    """
+    Fits research context into a token budget.
+
+    The context is split into the per-chunk blocks it was built from, each keeping its
+    "Source:" line so citations survive. Blocks are counted with the model's tokenizer and
+    the budget is filled with the blocks most similar to the query; kept blocks stay in
+    their original order. Without embeddings, blocks are kept in order until the budget
+    runs out.
+    """
+
+    def __init__(self, embeddings=None, model: Optional[str] = None):
+        """
+        Args:
+            embeddings: LangChain embeddings used to rank blocks against the query
+            model: Model whose tokenizer counts the budget
+        """
+        self.embeddings = embeddings
+        self.model = model
+
+    @staticmethod
+    def split_blocks(context: str) -> List[str]:
+        """Split ``context`` into source blocks (or paragraphs), keeping all separators."""
+        blocks = _SOURCE_BLOCK_RE.split(context)
+        if len(blocks) < 2:
+            blocks = _PARAGRAPH_RE.split(context)
+        return [block for block in blocks if block]
+
+    @staticmethod
+    def block_content(block: str) -> str:
+        """The text of a block without its source and title lines."""
+        match = _CONTENT_RE.search(block)
+        return block[match.end():].strip() if match else block.strip()
+
+    def pack_blocks(self, blocks: Sequence[str], max_tokens: int, scores: Optional[np.ndarray] = None) -> str:
+        """
+        The highest scoring ``blocks`` that fit in ``max_tokens``, in their original order.
+        """
+        counts = [count_tokens(block, self.model) for block in blocks]
+        if sum(counts) <= max_tokens:
+            return "".join(blocks)
+        order = range(len(blocks)) if scores is None else np.argsort(-np.asarray(scores), kind="stable")
+        kept, used = [], 0
+        for i in order:
+            if used + counts[i] <= max_tokens:
+                kept.append(i)
+                used += counts[i]
+        if not kept:
+            # Not even the best block fits on its own
+            best = next(iter(order))
+            return truncate_to_tokens(blocks[best], max_tokens, self.model)
+        logger.info(f"Packed context: kept {len(kept)}/{len(blocks)} blocks, {used}/{sum(counts)} tokens")
+        return "".join(blocks[i] for i in sorted(kept))
+
+    async def score(self, blocks: Sequence[str], query: str) -> Optional[np.ndarray]:
+        """Similarity of each block to ``query`` (None without embeddings or if embedding fails)."""
+        if self.embeddings is None or not query:
+            return None
+        try:
+            doc_vectors = await self.embeddings.aembed_documents([self.block_content(block) for block in blocks])
+            query_vector = await self.embeddings.aembed_query(query)
+        except Exception as e:
+            logger.warning(f"Could not rank context blocks, keeping them in order: {e}")
+            return None
+        return cosine_similarity(query_vector, doc_vectors)[0]
+
+    async def apack(self, context: str, query: str, max_tokens: int) -> str:
+        """Fit ``context`` into ``max_tokens`` tokens, keeping the blocks most relevant to ``query``."""
+        if not context or count_tokens(context, self.model) <= max_tokens:
+            return context
+        blocks = self.split_blocks(context)
+        return self.pack_blocks(blocks, max_tokens, await self.score(blocks, query))
+
+    def pack(self, context: str, max_tokens: int) -> str:
+        """Fit ``context`` into ``max_tokens`` tokens, keeping blocks in order."""
+        if not context or count_tokens(context, self.model) <= max_tokens:
+            return context
+        return self.pack_blocks(self.split_blocks(context), max_tokens)
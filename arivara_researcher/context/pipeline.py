@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List
+
+import numpy as np
+from langchain_core.documents import Document
+
+from .chunk_store import Chunk, ChunkStore
+from .similarity import EmbeddingsSimilarityFilter
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage."""
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth_samples: List[int] = field(default_factory=list)
+
+    def observe_depth(self, depth: int) -> None:
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self.queue_depth_samples.append(depth)
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = self.queue_depth_samples
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "max_queue_depth": self.max_queue_depth,
+            "avg_queue_depth": round(sum(samples) / len(samples), 2) if samples else 0.0,
+        }
+
+
+class StreamingContextPipeline:
+    """
+    Scrape -> chunk -> embed pipeline for a single sub-query.
+
+    Pages are consumed from an async iterator as each scrape finishes, split into chunks
+    (through a `ChunkStore`, so pages already split or embedded are reused) and embedded in batches while the remaining pages are still downloading. Once the
+    page stream is exhausted the chunks are filtered against the query embedding by
+    `EmbeddingsSimilarityFilter`: the ``max_results`` most similar chunks above the
+    threshold, most similar first (LangChain's EmbeddingsFilter keeps its top 20 the same way).
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        similarity_threshold: float | None = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 100,
+        embed_batch_size: int = 64,
+        embed_workers: int = 2,
+        max_queue_size: int = 256,
+        max_results: int = 20,
+        chunk_store: ChunkStore | None = None,
+    ):
+        self.embeddings = embeddings
+        self.relevance_filter = EmbeddingsSimilarityFilter(embeddings, similarity_threshold, k=max_results)
+        self.similarity_threshold = self.relevance_filter.similarity_threshold
+        self.chunk_store = chunk_store or ChunkStore()
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.embed_batch_size = embed_batch_size
+        self.embed_workers = max(1, embed_workers)
+        self.max_queue_size = max_queue_size
+        self.pages: List[Dict[str, Any]] = []
+        self.stats: Dict[str, StageStats] = {
+            "scrape": StageStats(),
+            "chunk": StageStats(),
+            "embed": StageStats(),
+        }
+        self.elapsed_seconds = 0.0
+
+    async def run(self, query: str, page_stream: AsyncIterator[Dict[str, Any]]) -> List[Document]:
+        """
+        Consume the page stream and return the chunks relevant to the query.
+
+        Args:
+            query: The sub-query to match chunks against
+            page_stream: Async iterator of scraped pages ({"url", "raw_content", "title", ...})
+
+        Returns:
+            list[Document]: Relevant chunks, most similar first
+        """
+        started = time.perf_counter()
+        chunk_queue: asyncio.Queue = asyncio.Queue(self.max_queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(self.max_queue_size)
+        chunks: List[Chunk] = []
+        vectors: Dict[int, List[float]] = {}
+
+        query_task = asyncio.create_task(self.embeddings.aembed_query(query))
+
+        async def scrape_stage():
+            stats = self.stats["scrape"]
+            pages = page_stream.__aiter__()
+            try:
+                while True:
+                    # Time spent here is time spent waiting on the network
+                    t0 = time.perf_counter()
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        stats.busy_seconds += time.perf_counter() - t0
+                    stats.items_in += 1
+                    if not page.get("raw_content"):
+                        continue
+                    self.pages.append(page)
+                    await chunk_queue.put(page)
+                    stats.items_out += 1
+                    self.stats["chunk"].observe_depth(chunk_queue.qsize())
+            finally:
+                await chunk_queue.put(_DONE)
+
+        async def chunk_stage():
+            stats = self.stats["chunk"]
+            try:
+                while (page := await chunk_queue.get()) is not _DONE:
+                    stats.items_in += 1
+                    t0 = time.perf_counter()
+                    page_chunks = self.chunk_store.split([page], self.chunk_size, self.chunk_overlap)
+                    stats.busy_seconds += time.perf_counter() - t0
+                    for chunk in page_chunks:
+                        chunks.append(chunk)
+                        await embed_queue.put(len(chunks) - 1)
+                        stats.items_out += 1
+                        self.stats["embed"].observe_depth(embed_queue.qsize())
+            finally:
+                for _ in range(self.embed_workers):
+                    await embed_queue.put(_DONE)
+
+        async def embed_stage():
+            stats = self.stats["embed"]
+            done = False
+            while not done:
+                batch = []
+                item = await embed_queue.get()
+                while item is not _DONE:
+                    batch.append(item)
+                    if len(batch) >= self.embed_batch_size or embed_queue.empty():
+                        break
+                    item = embed_queue.get_nowait()
+                done = item is _DONE
+                if not batch:
+                    continue
+                stats.items_in += len(batch)
+                t0 = time.perf_counter()
+                embedded = await self.chunk_store.aembed([chunks[i] for i in batch], self.embeddings)
+                stats.busy_seconds += time.perf_counter() - t0
+                vectors.update(zip(batch, embedded))
+                stats.items_out += len(batch)
+
+        stages = [
+            asyncio.create_task(scrape_stage()),
+            asyncio.create_task(chunk_stage()),
+            *(asyncio.create_task(embed_stage()) for _ in range(self.embed_workers)),
+        ]
+        try:
+            await asyncio.gather(*stages)
+            query_vector = await query_task
+        except BaseException:
+            for task in [*stages, query_task]:
+                task.cancel()
+            raise
+        self.elapsed_seconds = time.perf_counter() - started
+
+        if not chunks:
+            return []
+
+        matrix = np.asarray([vectors[i] for i in range(len(chunks))], dtype=np.float32)
+        return [chunks[i].to_document() for i in self.relevance_filter.select(query_vector, matrix)[0]]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage queue depth and throughput metrics for the last run."""
+        return {
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "pages": len(self.pages),
+            **{stage: stats.to_dict() for stage, stats in self.stats.items()},
+        }
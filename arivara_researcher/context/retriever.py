@@ -21,6 +21,7 @@ class SearchAPIRetriever(BaseRetriever):
                 metadata={
                     "title": page.get("title", ""),
                     "source": page.get("url", ""),
+                    "duplicate_urls": page.get("duplicate_urls", []),
                 },
             )
             for page in self.pages
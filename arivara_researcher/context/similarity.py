@@ -0,0 +1,92 @@
+import asyncio
+import os
+from typing import List, Optional, Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+
+def cosine_similarity(query_vectors, doc_vectors) -> np.ndarray:
+    """
+    Cosine similarity of every query against every document.
+
+    Args:
+        query_vectors: (q, d) or (d,) array-like of query embeddings
+        doc_vectors: (n, d) array-like of document embeddings
+
+    Returns:
+        np.ndarray: float32 (q, n) similarity matrix
+    """
+    queries = np.atleast_2d(np.asarray(query_vectors, dtype=np.float32))
+    docs = np.asarray(doc_vectors, dtype=np.float32).reshape(-1, queries.shape[1])
+    query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+    doc_norms = np.linalg.norm(docs, axis=1)
+    query_norms[query_norms == 0] = 1.0
+    doc_norms[doc_norms == 0] = 1.0
+    return (queries / query_norms) @ (docs / doc_norms[:, None]).T
+
+
+def top_k_indices(scores: np.ndarray, k: Optional[int] = None, threshold: Optional[float] = None) -> np.ndarray:
+    """
+    Indices of the ``k`` highest ``scores`` above ``threshold``, best first (ties by index).
+
+    With ``k=None`` every index above the threshold is returned in its original order,
+    like LangChain's ``EmbeddingsFilter`` without ``k``.
+    """
+    candidates = np.flatnonzero(scores > threshold) if threshold is not None else np.arange(len(scores))
+    if k is None:
+        return candidates
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+class EmbeddingsSimilarityFilter:
+    """
+    Selects the documents most similar to one or more queries.
+
+    A vectorized replacement for LangChain's ``EmbeddingsFilter``: the document embeddings
+    are stacked into one float32 matrix and scored against all query vectors with a single
+    matrix product, then thresholded and cut to the top ``k`` with ``argpartition``.
+    """
+
+    def __init__(self, embeddings, similarity_threshold: Optional[float] = None, k: Optional[int] = None):
+        """
+        Args:
+            embeddings: LangChain embeddings used for documents and queries
+            similarity_threshold: Minimum cosine similarity; defaults to $SIMILARITY_THRESHOLD or 0.35
+            k: Documents kept per query, most similar first (None = all above the threshold, in order)
+        """
+        self.embeddings = embeddings
+        self.similarity_threshold = float(
+            similarity_threshold if similarity_threshold is not None
+            else os.environ.get("SIMILARITY_THRESHOLD", 0.35)
+        )
+        self.k = k
+
+    def select(self, query_vectors, doc_vectors, k: Optional[int] = None) -> List[np.ndarray]:
+        """Indices of the selected documents for each query vector."""
+        if len(doc_vectors) == 0:
+            return [np.empty(0, dtype=np.intp) for _ in np.atleast_2d(np.asarray(query_vectors))]
+        similarity = cosine_similarity(query_vectors, doc_vectors)
+        k = self.k if k is None else k
+        return [top_k_indices(scores, k, self.similarity_threshold) for scores in similarity]
+
+    async def aembed(self, documents: Sequence[Document], queries: Sequence[str]):
+        """Embed the documents in one batch and the queries concurrently."""
+        doc_vectors, *query_vectors = await asyncio.gather(
+            self.embeddings.aembed_documents([doc.page_content for doc in documents]),
+            *(self.embeddings.aembed_query(query) for query in queries),
+        )
+        return query_vectors, doc_vectors
+
+    async def afilter(self, documents: Sequence[Document], queries: Sequence[str]) -> List[List[Document]]:
+        """The documents selected for each of ``queries``, embedding the documents once."""
+        if not documents:
+            return [[] for _ in queries]
+        query_vectors, doc_vectors = await self.aembed(documents, queries)
+        return [[documents[i] for i in selected] for selected in self.select(query_vectors, doc_vectors)]
+
+    async def acompress_documents(self, documents: Sequence[Document], query: str) -> List[Document]:
+        """The documents selected for ``query``."""
+        return (await self.afilter(documents, [query]))[0]
@@ -0,0 +1,77 @@
+import asyncio
+from typing import Dict, List, Sequence
+
+import numpy as np
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from .similarity import EmbeddingsSimilarityFilter
+
+
+class WrittenSectionIndex:
+    """
+    Embeddings of the sections written so far in a report.
+
+    Sections are split and embedded once, as they are added, into one growing float32
+    matrix. Lookups score a whole batch of queries (e.g. a subtopic and its draft section
+    titles) against it with a single matrix product.
+    """
+
+    def __init__(self, embeddings, chunk_size: int = 1000, chunk_overlap: int = 100):
+        self.embeddings = embeddings
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        self.sections: List[Dict] = []
+        self.chunks: List[str] = []
+        self.matrix = np.empty((0, 0), dtype=np.float32)
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    async def add(self, sections: Sequence[Dict]):
+        """Split and embed new sections ({"section_title", "written_content"})."""
+        async with self._lock:
+            await self._add(sections)
+
+    async def _add(self, sections: Sequence[Dict]):
+        chunks = [
+            f"Title: {section.get('section_title')}\nContent: {text}\n"
+            for section in sections
+            for text in self.splitter.split_text(section.get("written_content", ""))
+        ]
+        if chunks:
+            vectors = np.asarray(await self.embeddings.aembed_documents(chunks), dtype=np.float32)
+            self.matrix = vectors if not len(self.chunks) else np.vstack([self.matrix, vectors])
+            self.chunks.extend(chunks)
+        self.sections.extend(sections)
+
+    async def sync(self, sections: Sequence[Dict]) -> List[Dict]:
+        """
+        Make the index cover exactly ``sections``: sections appended since the last sync are
+        embedded, anything else rebuilds the index.
+
+        Returns:
+            List[Dict]: The sections this call embedded
+        """
+        async with self._lock:
+            known = len(self.sections)
+            if list(sections[:known]) != self.sections:
+                self.sections, self.chunks = [], []
+                self.matrix = np.empty((0, 0), dtype=np.float32)
+                known = 0
+            embedded = list(sections[known:])
+            if embedded:
+                await self._add(embedded)
+            return embedded
+
+    async def search(
+        self, queries: Sequence[str], similarity_threshold: float = 0.5, max_results: int = 10
+    ) -> List[List[str]]:
+        """The most similar written content for each of ``queries``, best first."""
+        if not self.chunks:
+            return [[] for _ in queries]
+        query_vectors = await asyncio.gather(*(self.embeddings.aembed_query(query) for query in queries))
+        relevance_filter = EmbeddingsSimilarityFilter(self.embeddings, similarity_threshold, k=max_results)
+        return [
+            [self.chunks[i] for i in selected]
+            for selected in relevance_filter.select(query_vectors, self.matrix)
+        ]
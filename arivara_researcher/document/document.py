@@ -2,7 +2,6 @@ import asyncio
 import os
 from typing import List, Union
 from langchain_community.document_loaders import (
-    PyMuPDFLoader,
     TextLoader,
     UnstructuredCSVLoader,
     UnstructuredExcelLoader,
@@ -12,6 +11,8 @@ from langchain_community.document_loaders import (
 )
 from langchain_community.document_loaders import BSHTMLLoader
 
+from ..utils.pdf_ingest import get_pdf_ingestor
+
 
 class DocumentLoader:
 
@@ -58,8 +59,12 @@ class DocumentLoader:
     async def _load_document(self, file_path: str, file_extension: str) -> list:
         ret_data = []
         try:
+            if file_extension == "pdf":
+                # Local documents are loaded in full; long ones are parsed in page ranges
+                pdf = await get_pdf_ingestor().extract(file_path, max_chars=0)
+                return pdf.to_documents(file_path)
+
             loader_dict = {
-                "pdf": PyMuPDFLoader(file_path),
                 "txt": TextLoader(file_path),
                 "doc": UnstructuredWordDocumentLoader(file_path),
                 "docx": UnstructuredWordDocumentLoader(file_path),
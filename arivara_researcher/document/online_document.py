@@ -2,7 +2,6 @@ import os
 import aiohttp
 import tempfile
 from langchain_community.document_loaders import (
-    PyMuPDFLoader,
     TextLoader,
     UnstructuredCSVLoader,
     UnstructuredExcelLoader,
@@ -11,6 +10,8 @@ from langchain_community.document_loaders import (
     UnstructuredWordDocumentLoader
 )
 
+from ..utils.pdf_ingest import get_pdf_ingestor
+
 
 class OnlineDocumentLoader:
 
@@ -38,6 +39,9 @@ class OnlineDocumentLoader:
             headers = {
                 "User-Agent": "Mozilla/5.0"
             }
+            if self._get_extension(url).lower() == ".pdf":
+                return await self._load_pdf(url, headers)
+
             async with aiohttp.ClientSession() as session:
                 async with session.get(url, headers=headers, timeout=6) as response:
                     if response.status != 200:
@@ -59,11 +63,20 @@ class OnlineDocumentLoader:
             print(e)
             return []
 
+    async def _load_pdf(self, url: str, headers: dict) -> list:
+        """Stream the PDF into memory with the byte cap and parse it without a temp file."""
+        ingestor = get_pdf_ingestor()
+        result = await ingestor.fetch(url, headers=headers)
+        if result.status != 200:
+            print(f"Failed to download {url}: HTTP {result.status}")
+            return []
+        pdf = await ingestor.extract(result.body, max_chars=0)
+        return pdf.to_documents(url)
+
     async def _load_document(self, file_path: str, file_extension: str) -> list:
         ret_data = []
         try:
             loader_dict = {
-                "pdf": PyMuPDFLoader(file_path),
                 "txt": TextLoader(file_path),
                 "doc": UnstructuredWordDocumentLoader(file_path),
                 "docx": UnstructuredWordDocumentLoader(file_path),
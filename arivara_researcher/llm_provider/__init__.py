@@ -1,5 +1,21 @@
 from .generic import GenericLLMProvider
+from .governor import GovernedRunnable, LLMGovernor, LLMGovernorRegistry, get_llm_governor, govern
+from .resilience import CircuitOpenError, LLMResilience, get_llm_resilience
+from .registry import ProviderRegistry, get_provider_registry
+from .response_cache import LLMResponseCache, get_llm_response_cache
 
 __all__ = [
     "GenericLLMProvider",
+    "GovernedRunnable",
+    "LLMGovernor",
+    "LLMGovernorRegistry",
+    "get_llm_governor",
+    "govern",
+    "ProviderRegistry",
+    "CircuitOpenError",
+    "LLMResilience",
+    "get_llm_resilience",
+    "get_provider_registry",
+    "LLMResponseCache",
+    "get_llm_response_cache",
 ]
@@ -11,6 +11,9 @@ from colorama import Fore, Style, init
 import os
 from enum import Enum
 
+from ..governor import get_llm_governor, is_rate_limit_error
+from ..resilience import get_llm_resilience
+
 logger = logging.getLogger(__name__)
 
 _SUPPORTED_PROVIDERS = {
@@ -87,12 +90,17 @@ class ChatLogger:
 
 class GenericLLMProvider:
 
-    def __init__(self, llm, chat_log: str | None = None,  verbose: bool = True):
+    def __init__(self, llm, chat_log: str | None = None,  verbose: bool = True,
+                 provider: str | None = None, model: str | None = None):
         self.llm = llm
         self.chat_logger = ChatLogger(chat_log) if chat_log else None
         self.verbose = verbose
+        # Calls are governed per (provider, model)
+        self.provider = provider
+        self.model = model
     @classmethod
     def from_provider(cls, provider: str, chat_log: str | None = None, verbose: bool=True, **kwargs: Any):
+        model = kwargs.get("model") or kwargs.get("model_name") or kwargs.get("model_id")
         if provider == "openai":
             _check_pkg("langchain_openai")
             from langchain_openai import ChatOpenAI
@@ -247,7 +255,7 @@ class GenericLLMProvider:
             raise ValueError(
                 f"Unsupported {provider}.\n\nSupported model providers are: {supported}"
             )
-        return cls(llm, chat_log, verbose=verbose)
+        return cls(llm, chat_log, verbose=verbose, provider=provider, model=model)
 
 
     async def get_chat_response(self, messages, stream, websocket=None, token_tracker=None, model_name=None, **kwargs):
@@ -274,7 +282,16 @@ class GenericLLMProvider:
         
         if not stream:
             # Getting output from the model chain using ainvoke for asynchronous invoking
-            output = await self.llm.ainvoke(messages, **llm_kwargs)
+            async def invoke():
+                async with get_llm_governor().slot(self.provider, self.model, messages) as slot:
+                    output = await self.llm.ainvoke(messages, **llm_kwargs)
+                    slot.observe(output)
+                return output
+
+            # Retried with backoff behind the provider's circuit breaker
+            output = await get_llm_resilience().call(
+                self.provider, invoke, governor=get_llm_governor().governor(self.provider, self.model)
+            )
 
             # DEBUG: Log response structure and usage (user-requested debug output)
             print(f"DEBUG: API Response type: {type(output)}")
@@ -338,7 +355,12 @@ class GenericLLMProvider:
             res = output.content
 
         else:
-            res = await self.stream_response(messages, websocket, token_tracker=token_tracker, model_name=model_name, **llm_kwargs)
+            # stream_response retries rate limits itself, since chunks may already have been sent
+            res = await get_llm_resilience().call(
+                self.provider,
+                lambda: self.stream_response(messages, websocket, token_tracker=token_tracker, model_name=model_name, **llm_kwargs),
+                max_retries=0,
+            )
 
         if self.chat_logger:
             await self.chat_logger.log_request(messages, res)
@@ -372,6 +394,8 @@ class GenericLLMProvider:
         first_chunk_sent = False
         max_retries = 3
         base_delay = 2.0  # Start with 2 seconds
+        governors = get_llm_governor()
+        governor = governors.governor(self.provider, self.model)
         
         for attempt in range(max_retries + 1):
             # Reset variables for each retry attempt
@@ -385,8 +409,12 @@ class GenericLLMProvider:
                 if attempt > 0:
                     # Reset main response for retry (use only the successful attempt's response)
                     response = ""
-                    # Calculate exponential backoff delay
-                    delay = base_delay * (2 ** (attempt - 1))  # 2s, 4s, 8s
+                    if governor is not None:
+                        # The governor holds the next attempt back until its rate-limit pause is over
+                        delay = governor.pause_remaining()
+                    else:
+                        # Calculate exponential backoff delay
+                        delay = base_delay * (2 ** (attempt - 1))  # 2s, 4s, 8s
                     logger.info(f"Rate limit retry attempt {attempt}/{max_retries} after {delay:.1f}s delay...")
                     if websocket:
                         try:
@@ -396,60 +424,63 @@ class GenericLLMProvider:
                             )
                         except:
                             pass
-                    import asyncio
-                    await asyncio.sleep(delay)
+                    if governor is None:
+                        await asyncio.sleep(delay)
                 
                 logger.info(f"Starting to stream response chunks... (attempt {attempt + 1}/{max_retries + 1}, websocket={websocket is not None})")
                 # Filter out arguments that shouldn't be passed to the LLM
                 llm_kwargs = {k: v for k, v in kwargs.items() if k not in ['researcher', 'token_tracker', 'model_name']}
-                async for chunk in self.llm.astream(messages, **llm_kwargs):
-                    attempt_chunk_count += 1
-                    attempt_last_chunk = chunk  # Keep track of last chunk
-                    content = chunk.content
+                async with governors.slot(self.provider, self.model, messages) as slot:
+                    async for chunk in self.llm.astream(messages, **llm_kwargs):
+                        attempt_chunk_count += 1
+                        attempt_last_chunk = chunk  # Keep track of last chunk
+                        content = chunk.content
                     
-                    if content is not None and len(content) > 0:
-                        attempt_response += content
-                        response += content  # Accumulate in main response (reset on retry, so only current attempt)
-                        attempt_paragraph += content
+                        if content is not None and len(content) > 0:
+                            attempt_response += content
+                            response += content  # Accumulate in main response (reset on retry, so only current attempt)
+                            attempt_paragraph += content
                         
-                        # Send immediately on first chunk for instant feedback
-                        # Then send on newlines or when buffer gets large (100 chars)
-                        should_send = (
-                            not attempt_first_chunk_sent or  # Always send first chunk immediately
-                            "\n" in attempt_paragraph or  # Send on newline
-                            len(attempt_paragraph) >= 100  # Send when buffer fills
-                        )
+                            # Send immediately on first chunk for instant feedback
+                            # Then send on newlines or when buffer gets large (100 chars)
+                            should_send = (
+                                not attempt_first_chunk_sent or  # Always send first chunk immediately
+                                "\n" in attempt_paragraph or  # Send on newline
+                                len(attempt_paragraph) >= 100  # Send when buffer fills
+                            )
                         
-                        if should_send:
-                            await self._send_output(attempt_paragraph, websocket)
-                            attempt_first_chunk_sent = True
-                            attempt_paragraph = ""  # Clear buffer after sending
+                            if should_send:
+                                await self._send_output(attempt_paragraph, websocket)
+                                attempt_first_chunk_sent = True
+                                attempt_paragraph = ""  # Clear buffer after sending
                             
-                    elif content is None:
-                        logger.debug(f"Received None content in chunk #{attempt_chunk_count}")
-                    else:
-                        logger.debug(f"Received empty content in chunk #{attempt_chunk_count}")
+                        elif content is None:
+                            logger.debug(f"Received None content in chunk #{attempt_chunk_count}")
+                        else:
+                            logger.debug(f"Received empty content in chunk #{attempt_chunk_count}")
                 
-                # Send any final remaining content from this attempt
-                if attempt_paragraph:
-                    await self._send_output(attempt_paragraph, websocket)
+                    # Send any final remaining content from this attempt
+                    if attempt_paragraph:
+                        await self._send_output(attempt_paragraph, websocket)
                 
-                # Track token usage from last chunk if available
-                if token_tracker is not None and attempt_last_chunk is not None:
-                    try:
-                        from ..utils.token_utils import extract_token_usage_from_response
-                        usage_dict = extract_token_usage_from_response(attempt_last_chunk)
-                        if usage_dict:
-                            token_tracker.add(
-                                prompt_tokens=usage_dict.get("prompt_tokens", 0),
-                                completion_tokens=usage_dict.get("completion_tokens", 0),
-                                total_tokens=usage_dict.get("total_tokens", 0)
-                            )
-                    except Exception as e:
-                        logger.debug(f"Could not extract token usage from streaming chunk: {e}")
-                        # For streaming, token usage might not be available until end
-                        # This is acceptable - we'll try to get it from response_metadata if available
+                    # Track token usage from last chunk if available
+                    if token_tracker is not None and attempt_last_chunk is not None:
+                        try:
+                            from ..utils.token_utils import extract_token_usage_from_response
+                            usage_dict = extract_token_usage_from_response(attempt_last_chunk)
+                            if usage_dict:
+                                token_tracker.add(
+                                    prompt_tokens=usage_dict.get("prompt_tokens", 0),
+                                    completion_tokens=usage_dict.get("completion_tokens", 0),
+                                    total_tokens=usage_dict.get("total_tokens", 0)
+                                )
+                        except Exception as e:
+                            logger.debug(f"Could not extract token usage from streaming chunk: {e}")
+                            # For streaming, token usage might not be available until end
+                            # This is acceptable - we'll try to get it from response_metadata if available
                 
+                    slot.observe(attempt_last_chunk)
+
                 last_chunk = attempt_last_chunk
                 # Successfully completed streaming
                 chunk_count = attempt_chunk_count
@@ -457,15 +488,8 @@ class GenericLLMProvider:
                 break
                     
             except Exception as e:
-                error_str = str(e)
                 # Check if it's a rate limit error (429)
-                is_rate_limit = (
-                    "429" in error_str or 
-                    "rate_limit" in error_str.lower() or 
-                    "too many requests" in error_str.lower() or
-                    "tokens per min" in error_str.lower() or
-                    "rate limit" in error_str.lower()
-                )
+                is_rate_limit = is_rate_limit_error(e)
                 
                 if is_rate_limit and attempt < max_retries:
                     logger.warning(f"✗ Rate limit error in stream_response (attempt {attempt + 1}/{max_retries + 1}): {e}")
@@ -0,0 +1,437 @@
+"""
+Process-wide concurrency governor for LLM calls.
+
+Researchers, deep-research children and multi-agent sections all call the same models,
+so every call to a (provider, model) goes through one `LLMGovernor`. Callers hold a slot
+while their request is in flight and wait for one in FIFO order when the limit is reached.
+The limit adapts AIMD-style: each success raises it by 1/limit (about one slot per round
+of successful requests) and a rate-limit response halves it, at most once per round, and
+pauses the model for Retry-After or an exponential backoff. Optional requests/min and
+tokens/min budgets space calls out with token buckets, and rate-limit response headers
+(``x-ratelimit-*``, ``anthropic-ratelimit-*``) pause the model when a budget runs out.
+"""
+import asyncio
+import datetime
+import logging
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, ClassVar, Dict, Mapping, Optional, Tuple
+
+from langchain_core.runnables import RunnableBinding, RunnableConfig
+
+from ..utils.rate_limiter import TokenBucket, parse_retry_after
+from ..utils.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STATUSES = (429, 503, 529)
+MAX_BACKOFF = 60.0
+
+_RATE_LIMIT_MARKERS = ("429", "rate_limit", "rate limit", "too many requests", "tokens per min", "overloaded")
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _error_headers(error: BaseException) -> Optional[Mapping[str, str]]:
+    return getattr(getattr(error, "response", None), "headers", None)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether ``error`` is a provider telling us to slow down (429/503/529 or a rate-limit message)."""
+    status = _status_code(error)
+    if status is not None:
+        return status in RATE_LIMIT_STATUSES
+    message = str(error).lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+def retry_after_from_error(error: BaseException) -> Optional[float]:
+    """Seconds the provider asked us to wait in the headers of ``error``, if any."""
+    headers = _error_headers(error)
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+    return parse_retry_after(headers.get("retry-after"))
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit reset header ("20ms", "6m0s", seconds or an RFC 3339 time) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    parts = _DURATION_RE.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        reset_at = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return max(0.0, reset_at.timestamp() - time.time())
+
+
+def _rate_limit_headers(headers: Mapping[str, str]) -> Dict[str, Dict[str, str]]:
+    """{"requests"|"tokens": {"limit", "remaining", "reset"}} from OpenAI or Anthropic style headers."""
+    parsed: Dict[str, Dict[str, str]] = {}
+    for name, value in headers.items():
+        name = name.lower()
+        for prefix in ("x-ratelimit-", "anthropic-ratelimit-"):
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix):]
+            # x-ratelimit-remaining-requests / anthropic-ratelimit-requests-remaining
+            for budget in ("requests", "tokens"):
+                for field in ("limit", "remaining", "reset"):
+                    if rest in (f"{field}-{budget}", f"{budget}-{field}"):
+                        parsed.setdefault(budget, {})[field] = value
+    return parsed
+
+
+class LLMGovernor:
+    """
+    Adaptive concurrency limit, fair queue and requests/tokens budgets of one (provider, model).
+
+    Slots are handed out across event loops: waiters are woken on their own loop.
+    """
+
+    def __init__(self, max_concurrency: int, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.requests = TokenBucket(rpm / 60, burst=rpm) if rpm else None
+        self.tokens = TokenBucket(tpm / 60, burst=tpm) if tpm else None
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.strikes = 0
+        self.throttled = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+
+    def _grant(self):
+        """Hand free slots to waiters in arrival order (lock held)."""
+        while self._waiters and self.in_flight < max(1, int(self.limit)):
+            loop, waiter = self._waiters.popleft()
+            self.in_flight += 1
+            try:
+                loop.call_soon_threadsafe(self._wake, waiter)
+            except RuntimeError:
+                # The waiter's loop is closed
+                self.in_flight -= 1
+
+    def _wake(self, waiter: asyncio.Future):
+        if waiter.cancelled():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait for a slot and for the budgets, then return the (monotonic) start time of the call.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = None
+        with self._lock:
+            if not self._waiters and self.in_flight < max(1, int(self.limit)):
+                self.in_flight += 1
+            else:
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+        if waiter is not None:
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                        queued = True
+                    except ValueError:
+                        queued = False
+                # A cancelled grant is released by _wake
+                if not queued and not waiter.cancelled():
+                    self.release()
+                raise
+
+        try:
+            wait = 0.0
+            if self.requests is not None:
+                wait = self.requests.reserve()
+            if self.tokens is not None and tokens:
+                wait = max(wait, self.tokens.reserve(tokens))
+            while True:
+                wait = max(wait, self.blocked_until - time.monotonic())
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+                wait = 0.0
+        except BaseException:
+            self.release()
+            raise
+        return time.monotonic()
+
+    def release(self):
+        """Give a slot back."""
+        with self._lock:
+            self.in_flight -= 1
+            self._grant()
+
+    def on_success(self):
+        """Additive increase: about one more slot per round of successful calls."""
+        with self._lock:
+            self.strikes = 0
+            if self.limit < self.max_concurrency:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+                self._grant()
+
+    def on_rate_limited(self, started: float, retry_after: Optional[float] = None):
+        """
+        Multiplicative decrease and a pause after a rate-limit response.
+
+        Calls that started before the last decrease were sent at the old limit, so they
+        don't shrink it again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            self.strikes += 1
+            if started >= self.last_decrease:
+                self.limit = max(1.0, self.limit / 2)
+                self.last_decrease = now
+            pause = retry_after if retry_after is not None else min(MAX_BACKOFF, 2.0 ** (self.strikes - 1))
+            self.blocked_until = max(self.blocked_until, now + pause)
+            logger.info(f"LLM rate limited: concurrency limit {self.limit:.1f}, pausing {pause:.1f}s")
+
+    def observe_headers(self, headers: Optional[Mapping[str, str]]):
+        """Adopt advertised budgets and pause until reset when one is used up."""
+        if not headers:
+            return
+        for budget, fields in _rate_limit_headers(headers).items():
+            try:
+                limit = float(fields["limit"]) if "limit" in fields else None
+                remaining = float(fields["remaining"]) if "remaining" in fields else None
+            except ValueError:
+                continue
+            with self._lock:
+                if limit and budget == "requests" and self.requests is None:
+                    self.requests = TokenBucket(limit / 60, burst=limit)
+                elif limit and budget == "tokens" and self.tokens is None:
+                    self.tokens = TokenBucket(limit / 60, burst=limit)
+                if remaining is not None and remaining <= 0:
+                    reset = parse_reset(fields.get("reset"))
+                    if reset:
+                        self.blocked_until = max(self.blocked_until, time.monotonic() + reset)
+
+    def debit(self, tokens: int):
+        """Charge tokens used beyond the estimate against the tokens budget."""
+        if self.tokens is not None and tokens > 0:
+            self.tokens.reserve(tokens)
+
+    def pause_remaining(self) -> float:
+        """Seconds until the model is no longer paused."""
+        return max(0.0, self.blocked_until - time.monotonic())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "waiting": len(self._waiters),
+                "throttled": self.throttled,
+                "blocked_for": round(self.pause_remaining(), 2),
+                "requests": self.requests.stats() if self.requests else None,
+                "tokens": self.tokens.stats() if self.tokens else None,
+            }
+
+
+class LLMSlot:
+    """A held governor slot; `observe` feeds the response back into the governor."""
+
+    def __init__(self, governor: Optional[LLMGovernor], estimated_tokens: int = 0):
+        self.governor = governor
+        self.estimated_tokens = estimated_tokens
+
+    def observe(self, output: Any):
+        """Read rate-limit headers and actual token usage from a LangChain message or chunk."""
+        if self.governor is None or output is None:
+            return
+        metadata = getattr(output, "response_metadata", None) or {}
+        self.governor.observe_headers(metadata.get("headers"))
+        usage = getattr(output, "usage_metadata", None) or {}
+        total = usage.get("total_tokens", 0) if isinstance(usage, dict) else getattr(usage, "total_tokens", 0)
+        if total:
+            self.governor.debit(total - self.estimated_tokens)
+
+
+class LLMGovernorRegistry:
+    """
+    Singleton registry of `LLMGovernor` instances keyed by (provider, model).
+    """
+
+    _instance: ClassVar['LLMGovernorRegistry'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the registry (only once)."""
+        if self._initialized:
+            return
+
+        self.max_concurrency = 16
+        self.limits: Dict[str, Dict[str, float]] = {}
+        self._governors: Dict[Tuple[str, str], LLMGovernor] = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def configure(self, max_concurrency: int = 16, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        """
+        Configure the registry.
+
+        Governors whose settings are unchanged keep their state (including any backoff).
+
+        Args:
+            max_concurrency: Upper bound of concurrent calls per model (0 disables the governor
+                             for models without an explicit limit)
+            limits: Per-model budgets keyed by "provider:model", "provider" or "model",
+                    e.g. {"openai:gpt-4.1": {"rpm": 500, "tpm": 30000, "concurrency": 8}}
+        """
+        limits = {key.lower(): dict(spec) for key, spec in (limits or {}).items()}
+        with self._lock:
+            if limits == self.limits and max_concurrency == self.max_concurrency:
+                return
+            self.max_concurrency = max(0, max_concurrency)
+            self.limits = limits
+            self._governors.clear()
+
+    def _spec_for(self, provider: str, model: str) -> Optional[Dict[str, float]]:
+        for key in (f"{provider}:{model}", provider, model):
+            spec = self.limits.get(key.lower())
+            if spec is not None:
+                return spec
+        return None
+
+    def governor(self, provider: Optional[str], model: Optional[str]) -> Optional[LLMGovernor]:
+        """The governor of (provider, model), or None when calls to it aren't governed."""
+        if not provider:
+            return None
+        key = (provider, model or "")
+        with self._lock:
+            governor = self._governors.get(key)
+            if governor is None:
+                spec = self._spec_for(*key) or {}
+                concurrency = spec.get("concurrency", self.max_concurrency)
+                if not concurrency:
+                    return None
+                governor = LLMGovernor(int(concurrency), spec.get("rpm"), spec.get("tpm"))
+                self._governors[key] = governor
+            return governor
+
+    @asynccontextmanager
+    async def slot(
+        self, provider: Optional[str], model: Optional[str], messages: Any = None
+    ) -> AsyncIterator[LLMSlot]:
+        """
+        Hold a slot of (provider, model) for the duration of one LLM call.
+
+        Successful calls raise the concurrency limit; rate-limit errors raised inside the
+        block lower it and pause the model before being re-raised.
+        """
+        governor = self.governor(provider, model)
+        if governor is None:
+            yield LLMSlot(None)
+            return
+
+        estimate = count_tokens(str(messages), model) if governor.tokens is not None and messages else 0
+        started = await governor.acquire(estimate)
+        try:
+            yield LLMSlot(governor, estimate)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                governor.observe_headers(_error_headers(e))
+                governor.on_rate_limited(started, retry_after_from_error(e))
+            raise
+        else:
+            governor.on_success()
+        finally:
+            governor.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current state of every governor, keyed by "provider:model"."""
+        with self._lock:
+            governors = list(self._governors.items())
+        return {f"{provider}:{model}": governor.stats() for (provider, model), governor in governors}
+
+    def reset(self):
+        """Drop all governors (useful for testing)."""
+        with self._lock:
+            self._governors.clear()
+
+
+class GovernedRunnable(RunnableBinding):
+    """
+    A chat model (usually with tools bound) whose every ``ainvoke`` holds its own slot.
+
+    For agents that call the model several times per turn, such as LangGraph's ReAct agent:
+    holding one slot for the whole turn would keep it through tool calls, and rate-limit
+    errors would only reach the governor once the turn failed. Build it with `govern`.
+    """
+
+    llm_provider: Optional[str] = None
+    llm_model: Optional[str] = None
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> Any:
+        async with _llm_governor_registry.slot(self.llm_provider, self.llm_model, input) as slot:
+            output = await super().ainvoke(input, config, **kwargs)
+            slot.observe(output)
+        return output
+
+
+def govern(runnable: Any, provider: Optional[str], model: Optional[str]) -> GovernedRunnable:
+    """
+    Wrap a chat model, or a `RunnableBinding` of one (e.g. from ``bind_tools``), so each of
+    its async calls goes through the governor of (provider, model).
+    """
+    if isinstance(runnable, RunnableBinding):
+        return GovernedRunnable(
+            bound=runnable.bound,
+            kwargs=runnable.kwargs,
+            config=runnable.config,
+            llm_provider=provider,
+            llm_model=model,
+        )
+    return GovernedRunnable(bound=runnable, kwargs={}, llm_provider=provider, llm_model=model)
+
+
+# Singleton instance
+_llm_governor_registry = LLMGovernorRegistry()
+
+
+def get_llm_governor(cfg=None) -> LLMGovernorRegistry:
+    """Get the LLM governor registry singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _llm_governor_registry.configure(
+            max_concurrency=getattr(cfg, "llm_max_concurrency", 16),
+            limits=getattr(cfg, "llm_rate_limits", None),
+        )
+    return _llm_governor_registry
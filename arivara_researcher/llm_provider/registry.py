@@ -0,0 +1,165 @@
+"""
+Process-wide registry of LLM providers.
+
+Building a LangChain chat model creates a new SDK client with its own HTTP connection
+pool, so constructing one per request pays object setup plus fresh TCP/TLS handshakes
+on every call. `ProviderRegistry` hands out one `GenericLLMProvider` per (provider,
+model, settings) and keeps it, and its keep-alive connections, for later calls.
+
+Async SDK clients are bound to the event loop they first ran on, so providers are kept
+per running event loop; the size of each loop's registry is bounded with LRU eviction.
+"""
+import asyncio
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, Hashable, Optional
+
+from .generic import GenericLLMProvider
+
+# Prefixes of the environment variables a provider's client reads its credentials and
+# endpoints from; providers not listed use "<PROVIDER>_"
+_ENV_PREFIXES = {
+    "openai": ("OPENAI_",),
+    "azure_openai": ("AZURE_OPENAI_", "OPENAI_API_VERSION"),
+    "google_vertexai": ("GOOGLE_",),
+    "google_genai": ("GOOGLE_",),
+    "mistralai": ("MISTRAL_",),
+    "huggingface": ("HUGGINGFACE", "HF_"),
+    "bedrock": ("AWS_",),
+}
+
+
+def _freeze(value: Any) -> Hashable:
+    """A hashable, order-independent form of a keyword argument value."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _env_fingerprint(provider: str) -> Hashable:
+    """The environment variables that can change how ``provider`` is built."""
+    prefixes = _ENV_PREFIXES.get(provider, (provider.upper() + "_",))
+    environ = os.environ
+    return tuple(sorted((name, environ[name]) for name in environ if name.startswith(prefixes)))
+
+
+class ProviderRegistry:
+    """
+    Singleton cache of `GenericLLMProvider` instances.
+    """
+
+    _instance: ClassVar['ProviderRegistry'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the registry (only once)."""
+        if self._initialized:
+            return
+
+        self.max_size = 32
+        self._lock = threading.Lock()
+        # Providers used inside an event loop are kept per loop, the others in _sync_providers
+        self._loop_providers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_providers: "OrderedDict[Hashable, GenericLLMProvider]" = OrderedDict()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        self._initialized = True
+
+    def configure(self, max_size: int = 32):
+        """
+        Configure the registry.
+
+        Args:
+            max_size: Providers kept per event loop (0 disables caching)
+        """
+        with self._lock:
+            self.max_size = max(0, max_size)
+            for providers in [self._sync_providers, *self._loop_providers.values()]:
+                self._evict(providers)
+
+    def _evict(self, providers: OrderedDict):
+        while len(providers) > self.max_size:
+            providers.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _providers(self) -> OrderedDict:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._sync_providers
+        providers = self._loop_providers.get(loop)
+        if providers is None:
+            providers = self._loop_providers[loop] = OrderedDict()
+        return providers
+
+    @staticmethod
+    def make_key(provider: str, chat_log: Optional[str], verbose: bool, kwargs: Dict[str, Any]) -> Hashable:
+        """Cache key of a provider: its name, options, normalized kwargs and relevant environment."""
+        return provider, chat_log, verbose, _freeze(kwargs), _env_fingerprint(provider)
+
+    def get(self, provider: str, chat_log: Optional[str] = None, verbose: bool = True, **kwargs: Any) -> GenericLLMProvider:
+        """
+        The cached provider for these settings, built with `GenericLLMProvider.from_provider`
+        on first use.
+        """
+        if self.max_size == 0:
+            return GenericLLMProvider.from_provider(provider, chat_log=chat_log, verbose=verbose, **kwargs)
+
+        key = self.make_key(provider, chat_log, verbose, kwargs)
+        with self._lock:
+            providers = self._providers()
+            cached = providers.get(key)
+            if cached is not None:
+                providers.move_to_end(key)
+                self._stats["hits"] += 1
+                return cached
+            self._stats["misses"] += 1
+
+        # Built outside the lock: from_provider may import (or even install) packages
+        built = GenericLLMProvider.from_provider(provider, chat_log=chat_log, verbose=verbose, **kwargs)
+        with self._lock:
+            cached = providers.setdefault(key, built)
+            providers.move_to_end(key)
+            self._evict(providers)
+        return cached
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and the number of cached providers."""
+        with self._lock:
+            size = len(self._sync_providers) + sum(len(p) for p in self._loop_providers.values())
+            return {**self._stats, "size": size}
+
+    def clear(self):
+        """Drop every cached provider and reset the counters."""
+        with self._lock:
+            self._sync_providers.clear()
+            self._loop_providers.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+# Singleton instance
+_provider_registry = ProviderRegistry()
+
+
+def get_provider_registry(cfg=None) -> ProviderRegistry:
+    """Get the provider registry singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _provider_registry.configure(max_size=getattr(cfg, "llm_provider_cache_size", 32))
+    return _provider_registry
@@ -0,0 +1,286 @@
+"""
+Retries and circuit breaking for LLM calls.
+
+`GenericLLMProvider.get_chat_response` runs every call through `LLMResilience.call`:
+transient failures (rate limits, timeouts, connection errors, 5xx) are retried with
+full-jitter exponential backoff, or after Retry-After when the provider sends it. Each
+provider has a circuit breaker: after a run of consecutive transient failures (429s
+excluded; the governor handles those) calls fail fast with `CircuitOpenError`
+until a cool-down has passed, then a single probe call decides whether it closes again.
+A fallback LLM can be configured for planning calls that opt in to it.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional, TypeVar
+
+from .governor import LLMGovernor, _status_code, is_rate_limit_error, retry_after_from_error
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = (408, 409, 500, 502, 503, 504, 529)
+_TRANSIENT_ERROR_NAMES = ("timeout", "connection", "serviceunavailable", "internalserver", "overloaded")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether ``error`` means the provider is (temporarily) unavailable rather than the request being bad."""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUSES or status >= 500
+    name = type(error).__name__.lower()
+    return any(marker in name for marker in _TRANSIENT_ERROR_NAMES)
+
+
+def is_throttled_error(error: BaseException) -> bool:
+    """Whether ``error`` only says the caller is sending too much (429), not that the provider is down."""
+    status = _status_code(error)
+    if status is not None:
+        return status == 429
+    return is_rate_limit_error(error) and not is_transient_error(error)
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Whether a call that failed with ``error`` is worth retrying."""
+    return not isinstance(error, CircuitOpenError) and (is_rate_limit_error(error) or is_transient_error(error))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker of one provider.
+
+    closed: calls go through. open: calls fail fast until ``reset_timeout`` has passed.
+    half-open: one probe call goes through; its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.probing or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def check(self, name: str = "provider") -> bool:
+        """
+        Raise `CircuitOpenError` unless a call may go through now.
+
+        Returns:
+            bool: Whether the call is the half-open circuit's probe
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+            if remaining <= 0 and not self.probing:
+                self.probing = True
+                logger.info(f"Circuit of {name} half-open, probing")
+                return True
+            if remaining <= 0:
+                raise CircuitOpenError(f"{name} is failing, waiting for the probe call to it")
+            raise CircuitOpenError(f"{name} is failing, not calling it for another {remaining:.1f}s")
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self, probe: bool = False):
+        """Count a transient failure; a failed ``probe`` re-opens the circuit."""
+        with self._lock:
+            self.failures += 1
+            if probe or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            if probe:
+                self.probing = False
+
+    def release_probe(self):
+        """End a probe whose outcome says nothing about the provider's health. Only for the probe call."""
+        with self._lock:
+            self.probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures}
+
+
+class LLMResilience:
+    """
+    Singleton retry policy, per-provider circuit breakers and fallback LLM.
+    """
+
+    _instance: ClassVar['LLMResilience'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the policy (only once)."""
+        if self._initialized:
+            return
+
+        self.max_retries = 3
+        self.base_delay = 1.0
+        self.max_delay = 30.0
+        self.failure_threshold = 5
+        self.reset_timeout = 30.0
+        self.fallback_provider: Optional[str] = None
+        self.fallback_model: Optional[str] = None
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._initialized = True
+
+    def configure(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        fallback_provider: Optional[str] = None,
+        fallback_model: Optional[str] = None,
+    ):
+        """
+        Configure the policy.
+
+        Args:
+            max_retries: Retries of a transient failure (0 disables retrying)
+            base_delay: Backoff cap of the first retry in seconds; doubles per retry
+            max_delay: Largest backoff in seconds
+            failure_threshold: Consecutive transient failures that open a provider's circuit
+            reset_timeout: Seconds an open circuit fails fast before a probe call is let through
+            fallback_provider: Provider of the fallback LLM for calls that opt in
+            fallback_model: Model of the fallback LLM
+        """
+        with self._lock:
+            self.max_retries = max(0, max_retries)
+            self.base_delay = base_delay
+            self.max_delay = max_delay
+            self.fallback_provider = fallback_provider or None
+            self.fallback_model = fallback_model or None
+            if (failure_threshold, reset_timeout) != (self.failure_threshold, self.reset_timeout):
+                self.failure_threshold = failure_threshold
+                self.reset_timeout = reset_timeout
+                self._breakers.clear()
+
+    def breaker(self, provider: Optional[str]) -> CircuitBreaker:
+        """The circuit breaker of ``provider``."""
+        key = provider or "default"
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry ``attempt`` (1-based): Retry-After, else full jitter."""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def fallback_for(self, provider: Optional[str], model: Optional[str]) -> Optional[tuple[str, str]]:
+        """The configured fallback (provider, model), unless it is the LLM that just failed."""
+        if not self.fallback_provider or not self.fallback_model:
+            return None
+        if (self.fallback_provider, self.fallback_model) == (provider, model):
+            return None
+        return self.fallback_provider, self.fallback_model
+
+    async def call(
+        self,
+        provider: Optional[str],
+        fn: Callable[[], Awaitable[T]],
+        max_retries: Optional[int] = None,
+        governor: Optional[LLMGovernor] = None,
+    ) -> T:
+        """
+        Await ``fn()`` behind the circuit breaker of ``provider``, retrying transient failures.
+
+        Args:
+            provider: Provider name the breaker is kept for
+            fn: Makes one attempt of the call
+            max_retries: Overrides the configured number of retries
+            governor: Governor ``fn`` takes its slot from; while it is paused after a rate
+                      limit, the retry waits for its slot rather than for a backoff as well
+        """
+        breaker = self.breaker(provider)
+        retries = self.max_retries if max_retries is None else max_retries
+        attempt = 0
+        while True:
+            probe = breaker.check(provider or "LLM provider")
+            try:
+                result = await fn()
+            except Exception as e:
+                if is_transient_error(e) and not is_throttled_error(e):
+                    breaker.record_failure(probe)
+                elif probe:
+                    breaker.release_probe()
+                # Once the circuit opened, retrying would only fail fast
+                if attempt >= retries or not is_retryable_error(e) or breaker.state == "open":
+                    raise
+                attempt += 1
+                if governor is not None and is_rate_limit_error(e) and governor.pause_remaining() > 0:
+                    logger.warning(f"LLM call to {provider} rate limited ({e}), retry {attempt}/{retries} after the pause")
+                    continue
+                delay = self.backoff(attempt, retry_after_from_error(e))
+                logger.warning(f"LLM call to {provider} failed ({e}), retry {attempt}/{retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            except BaseException:
+                if probe:
+                    breaker.release_probe()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state of every provider."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return {provider: breaker.stats() for provider, breaker in breakers}
+
+    def reset(self):
+        """Close all circuits (useful for testing)."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Singleton instance
+_llm_resilience = LLMResilience()
+
+
+def get_llm_resilience(cfg=None) -> LLMResilience:
+    """Get the LLM resilience singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        fallback = getattr(cfg, "llm_fallback", "") or ""
+        fallback_provider, _, fallback_model = fallback.partition(":")
+        _llm_resilience.configure(
+            max_retries=getattr(cfg, "llm_max_retries", 3),
+            base_delay=getattr(cfg, "llm_retry_base_delay", 1.0),
+            max_delay=getattr(cfg, "llm_retry_max_delay", 30.0),
+            failure_threshold=getattr(cfg, "llm_circuit_breaker_threshold", 5),
+            reset_timeout=getattr(cfg, "llm_circuit_breaker_reset", 30.0),
+            fallback_provider=fallback_provider,
+            fallback_model=fallback_model,
+        )
+    return _llm_resilience
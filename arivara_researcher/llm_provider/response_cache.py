@@ -0,0 +1,343 @@
+"""
+Response cache for deterministic LLM calls.
+
+Planning calls (choosing an agent, generating sub-queries, selecting MCP tools, ...)
+run at low temperature and are re-asked with identical or near-identical prompts by
+other users and by nested researchers. Call sites opt in by passing a ``cache_site``
+to `create_chat_completion`. Responses are then looked up by an exact key of
+(model, messages, parameters) and, when semantic lookup is enabled and the call site names
+the variable part of its prompt (the user's query or task), by the embedding similarity of
+that text alone to the queries of earlier calls with the same call site, model, parameters
+and prompt template. Embedding the whole prompt would let a long shared template drown out
+the query. Entries live in SQLite under CACHE_DIR with a TTL per call site.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, ClassVar, Dict, List, Optional
+
+import numpy as np
+
+from ..utils.tokenizer import count_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "./.arivara_cache"
+
+
+def _prompt_text(messages: List[Dict[str, Any]]) -> str:
+    return "\n\n".join(f"{m.get('role', '')}: {m.get('content', '')}" for m in messages)
+
+
+class LLMResponseCache:
+    """
+    Singleton SQLite cache of LLM responses, with optional semantic lookup.
+    """
+
+    _instance: ClassVar['LLMResponseCache'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the cache (only once)."""
+        if self._initialized:
+            return
+
+        self.enabled = False
+        self.default_ttl = 86400
+        self.ttls: Dict[str, int] = {}
+        self.semantic = False
+        self.similarity_threshold = 0.98
+        self.db_path: Optional[str] = None
+
+        self._embedding_settings: Optional[tuple] = None
+        self._embedding_kwargs: Dict[str, Any] = {}
+        self._embeddings = None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"exact_hits": 0, "semantic_hits": 0, "misses": 0}
+        )
+        self._initialized = True
+
+    def configure(
+        self,
+        enabled: bool = False,
+        default_ttl: int = 86400,
+        ttls: Optional[Dict[str, int]] = None,
+        semantic: bool = False,
+        similarity_threshold: float = 0.98,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        embedding_provider: Optional[str] = None,
+        embedding_model: Optional[str] = None,
+        embedding_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Configure the cache.
+
+        Args:
+            enabled: Whether call sites that opt in are cached at all
+            default_ttl: Seconds a response stays fresh when its call site has no TTL
+            ttls: Per-call-site TTLs (e.g. {"choose_agent": 604800})
+            semantic: Also serve responses to prompts whose embedding is similar enough
+            similarity_threshold: Minimum cosine similarity (0-1) of a semantic hit
+            cache_dir: Directory for the SQLite database (None disables the cache)
+            embedding_provider: Embedding provider used for semantic lookup
+            embedding_model: Embedding model used for semantic lookup
+            embedding_kwargs: Extra embedding arguments
+        """
+        with self._lock:
+            self.enabled = enabled and bool(cache_dir)
+            self.default_ttl = default_ttl
+            self.ttls = dict(ttls or {})
+            self.semantic = semantic and embedding_provider is not None
+            self.similarity_threshold = similarity_threshold
+
+            embedding_settings = (embedding_provider, embedding_model, json.dumps(embedding_kwargs or {}, sort_keys=True, default=str))
+            if embedding_settings != self._embedding_settings:
+                self._embedding_settings = embedding_settings
+                self._embedding_kwargs = embedding_kwargs or {}
+                self._embeddings = None
+
+            db_path = os.path.join(cache_dir, "llm_cache.sqlite") if cache_dir else None
+            if db_path != self.db_path:
+                self._close()
+                self.db_path = db_path
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], params: Dict[str, Any]) -> str:
+        """Exact cache key of a call."""
+        payload = json.dumps([model, messages, params], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_scope(
+        site: str, model: str, messages: List[Dict[str, Any]], params: Dict[str, Any], query: Optional[str]
+    ) -> str:
+        """
+        Calls whose responses can stand in for each other on a semantic match: same call
+        site, model and parameters, and the same prompt once ``query`` is cut out of it.
+        """
+        template = json.dumps(messages, sort_keys=True, default=str)
+        if query:
+            # The query as it appears inside the JSON strings; NUL never appears unescaped in JSON
+            template = template.replace(json.dumps(query)[1:-1], "\0")
+        payload = json.dumps([site, model, params, template], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, site: str) -> int:
+        return self.ttls.get(site, self.default_ttl)
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        if self.db_path is None:
+            return None
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, site TEXT, scope TEXT, embedding BLOB, response TEXT, "
+                    "prompt_tokens INTEGER, completion_tokens INTEGER, expires_at REAL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope, expires_at)")
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache unavailable ({self.db_path}): {e}")
+                self.db_path = None
+                return None
+        return self._conn
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def _get_embeddings(self):
+        if self._embeddings is None:
+            from ..memory import Memory
+            provider, model, _ = self._embedding_settings
+            self._embeddings = Memory(provider, model, **self._embedding_kwargs).get_embeddings()
+        return self._embeddings
+
+    async def _embed(self, query: str) -> Optional[np.ndarray]:
+        try:
+            vector = await self._get_embeddings().aembed_query(query)
+        except Exception as e:
+            logger.debug(f"LLM response cache could not embed the query: {e}")
+            return None
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _row_to_hit(self, row, match: str) -> Dict[str, Any]:
+        response, prompt_tokens, completion_tokens = row
+        return {
+            "response": response,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "match": match,
+        }
+
+    async def lookup(
+        self,
+        site: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        query: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        A cached response for this call, or None.
+
+        Args:
+            query: Variable part of the prompt; semantic lookup compares only this text and
+                   is skipped without it
+
+        Returns:
+            dict: {"response", "prompt_tokens", "completion_tokens", "match"} where match is
+                  "exact" or "semantic"
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        key = self.make_key(model, messages, params)
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT response, prompt_tokens, completion_tokens FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"LLM response cache read failed: {e}")
+                row = None
+            if row is not None:
+                self._stats[site]["exact_hits"] += 1
+                return self._row_to_hit(row, "exact")
+
+        if self.semantic and query:
+            vector = await self._embed(query)
+            if vector is not None:
+                with self._lock:
+                    try:
+                        rows = conn.execute(
+                            "SELECT embedding, response, prompt_tokens, completion_tokens FROM responses "
+                            "WHERE scope = ? AND expires_at > ? AND embedding IS NOT NULL",
+                            (self.make_scope(site, model, messages, params, query), now),
+                        ).fetchall()
+                    except sqlite3.Error as e:
+                        logger.debug(f"LLM response cache read failed: {e}")
+                        rows = []
+                    rows = [r for r in rows if len(r[0]) == vector.nbytes]
+                    if rows:
+                        matrix = np.frombuffer(b"".join(r[0] for r in rows), dtype=np.float32).reshape(len(rows), -1)
+                        similarity = matrix @ vector
+                        best = int(similarity.argmax())
+                        if similarity[best] >= self.similarity_threshold:
+                            self._stats[site]["semantic_hits"] += 1
+                            logger.info(f"LLM response cache: semantic hit for {site} ({similarity[best]:.3f})")
+                            return self._row_to_hit(rows[best][1:], "semantic")
+
+        with self._lock:
+            self._stats[site]["misses"] += 1
+        return None
+
+    async def store(
+        self,
+        site: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        response: str,
+        query: Optional[str] = None,
+    ) -> None:
+        """Cache a non-empty response of this call (see `lookup` for ``query``)."""
+        if not self.enabled or not response:
+            return
+
+        embedding = None
+        if self.semantic and query:
+            vector = await self._embed(query)
+            embedding = vector.tobytes() if vector is not None else None
+        prompt_tokens = count_tokens(_prompt_text(messages), model)
+        completion_tokens = count_tokens(response, model)
+        now = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses "
+                        "(key, site, scope, embedding, response, prompt_tokens, completion_tokens, expires_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            self.make_key(model, messages, params),
+                            site,
+                            self.make_scope(site, model, messages, params, query),
+                            embedding,
+                            response,
+                            prompt_tokens,
+                            completion_tokens,
+                            now + self.ttl_for(site),
+                        ),
+                    )
+                    conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            except sqlite3.Error as e:
+                logger.debug(f"LLM response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters per call site."""
+        with self._lock:
+            return {site: dict(counts) for site, counts in self._stats.items()}
+
+    def clear(self):
+        """Drop every cached response and reset the counters."""
+        with self._lock:
+            self._stats.clear()
+            conn = self._get_conn()
+            if conn is not None:
+                try:
+                    with conn:
+                        conn.execute("DELETE FROM responses")
+                except sqlite3.Error as e:
+                    logger.debug(f"LLM response cache clear failed: {e}")
+
+
+# Singleton instance
+_llm_response_cache = LLMResponseCache()
+
+
+def get_llm_response_cache(cfg=None) -> LLMResponseCache:
+    """Get the LLM response cache singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _llm_response_cache.configure(
+            enabled=getattr(cfg, "llm_response_cache", False),
+            default_ttl=getattr(cfg, "llm_response_cache_ttl", 86400),
+            ttls=getattr(cfg, "llm_response_cache_ttls", None),
+            semantic=getattr(cfg, "llm_response_cache_semantic", False),
+            similarity_threshold=getattr(cfg, "llm_response_cache_similarity", 0.98),
+            cache_dir=getattr(cfg, "cache_dir", DEFAULT_CACHE_DIR),
+            embedding_provider=getattr(cfg, "embedding_provider", None),
+            embedding_model=getattr(cfg, "embedding_model", None),
+            embedding_kwargs=getattr(cfg, "embedding_kwargs", None),
+        )
+    return _llm_response_cache
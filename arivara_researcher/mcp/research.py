@@ -49,7 +49,8 @@ class MCPResearchSkill:
         logger.info(f"Conducting research using {len(selected_tools)} selected tools")
         
         try:
-            from ..llm_provider.generic.base import GenericLLMProvider
+            from ..llm_provider import get_llm_governor, get_llm_resilience
+            from ..utils.llm import get_llm
             
             # Create LLM provider using the config
             provider_kwargs = {
@@ -57,7 +58,7 @@ class MCPResearchSkill:
                 **self.cfg.llm_kwargs
             }
             
-            llm_provider = GenericLLMProvider.from_provider(
+            llm_provider = get_llm(
                 self.cfg.strategic_llm_provider, 
                 **provider_kwargs
             )
@@ -76,7 +77,19 @@ class MCPResearchSkill:
             
             # Invoke LLM with tools
             logger.info("LLM researching with bound tools...")
-            response = await llm_with_tools.ainvoke(messages)
+            async def invoke():
+                async with get_llm_governor().slot(
+                    self.cfg.strategic_llm_provider, self.cfg.strategic_llm_model, messages
+                ) as slot:
+                    response = await llm_with_tools.ainvoke(messages)
+                    slot.observe(response)
+                return response
+
+            response = await get_llm_resilience().call(
+                self.cfg.strategic_llm_provider,
+                invoke,
+                governor=get_llm_governor().governor(self.cfg.strategic_llm_provider, self.cfg.strategic_llm_model),
+            )
             
             # Process tool calls and results
             research_results = []
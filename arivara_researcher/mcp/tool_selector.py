@@ -70,7 +70,7 @@ class MCPToolSelector:
 
         try:
             # Call LLM for tool selection
-            response = await self._call_llm_for_tool_selection(prompt)
+            response = await self._call_llm_for_tool_selection(prompt, query)
             
             if not response:
                 logger.warning("No LLM response for tool selection, using fallback")
@@ -126,12 +126,13 @@ class MCPToolSelector:
             logger.warning("Falling back to pattern-based selection")
             return self._fallback_tool_selection(all_tools, max_tools)
 
-    async def _call_llm_for_tool_selection(self, prompt: str) -> str:
+    async def _call_llm_for_tool_selection(self, prompt: str, query: str | None = None) -> str:
         """
         Call the LLM using the existing create_chat_completion function for tool selection.
         
         Args:
             prompt (str): The prompt to send to the LLM.
+            query (str, optional): The research query the prompt was built from.
             
         Returns:
             str: The generated text response.
@@ -154,6 +155,9 @@ class MCPToolSelector:
                 llm_provider=self.cfg.strategic_llm_provider,
                 llm_kwargs=self.cfg.llm_kwargs,
                 cost_callback=self.researcher.add_costs if self.researcher and hasattr(self.researcher, 'add_costs') else None,
+                cache_site="select_mcp_tools",
+                cache_query=query,
+                fallback=True,
             )
             return result
         except Exception as e:
@@ -0,0 +1,441 @@
+"""
+Content-addressed embedding cache.
+
+Vectors are keyed by (provider, model, sha256(text)) so a chunk embedded once, by a
+sibling sub-query or by an earlier research run, is never sent to the provider again.
+Each embedding space (provider + model + settings) keeps its vectors as float32 rows of
+one memory-mapped file under CACHE_DIR; a SQLite index maps text hashes to rows and
+tracks recency, and the least recently used row is overwritten once the space is full.
+Only cache misses are embedded, deduplicated and in batches.
+
+The SQLite index is the only record of which row holds what, so several processes (e.g.
+uvicorn workers) can share one cache: rows are allocated inside a write transaction and
+handed out as reservations that readers ignore until their vector has been written, and
+a read only counts if the row still belongs to its key after the vector was copied.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, List, Optional
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "./.arivara_cache"
+# A reservation older than this belongs to a writer that died before filling its row
+RESERVATION_TIMEOUT = 60.0
+# Keys per "IN (...)" query, below SQLite's host parameter limit
+_QUERY_BATCH = 500
+
+
+class _VectorSpace:
+    """
+    Rows of one embedding space: a float32 matrix, plus an LRU index of text hash -> row
+    when the space is kept in memory only (on disk, the SQLite index maps keys to rows).
+    """
+
+    def __init__(self, space: str, dim: int, capacity: int, path: Optional[str]):
+        self.space = space
+        self.dim = dim
+        self.capacity = capacity
+        self.path = path
+        self.index: "OrderedDict[str, int]" = OrderedDict()
+        if path is None:
+            self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        else:
+            size = capacity * dim * 4
+            if not os.path.exists(path) or os.path.getsize(path) < size:
+                with open(path, "ab") as f:
+                    f.truncate(size)
+            self.vectors = np.memmap(path, dtype=np.float32, mode="r+", shape=(capacity, dim))
+
+    def allocate(self) -> tuple[int, Optional[str]]:
+        """A free row, or the row of the least recently used key (returned for eviction). In memory only."""
+        if len(self.index) < self.capacity:
+            return len(self.index), None
+        key, slot = self.index.popitem(last=False)
+        return slot, key
+
+    def flush(self):
+        if isinstance(self.vectors, np.memmap):
+            self.vectors.flush()
+
+
+class EmbeddingCache:
+    """
+    Singleton store of embedding vectors shared by every researcher in the process.
+    """
+
+    _instance: ClassVar['EmbeddingCache'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the cache (only once)."""
+        if self._initialized:
+            return
+
+        self.enabled = True
+        self.max_entries = 50000
+        self.batch_size = 256
+        self.cache_dir: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._spaces: Dict[str, _VectorSpace] = {}
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "batches": 0}
+        self._initialized = True
+
+    def configure(
+        self,
+        enabled: bool = True,
+        max_entries: int = 50000,
+        batch_size: int = 256,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    ):
+        """
+        Configure the cache.
+
+        Args:
+            enabled: Whether `Memory.get_embeddings` returns cached embeddings
+            max_entries: Vectors kept per embedding space before LRU eviction
+            batch_size: Maximum texts sent to the provider in one request
+            cache_dir: Directory for the vector files and index (None = in memory only)
+        """
+        with self._lock:
+            self.enabled = enabled
+            self.max_entries = max(1, max_entries)
+            self.batch_size = max(1, batch_size)
+            cache_dir = os.path.join(cache_dir, "embeddings") if cache_dir else None
+            if cache_dir != self.cache_dir:
+                self._close()
+                self.cache_dir = cache_dir
+
+    @staticmethod
+    def make_space(provider: str, model: str, settings: Optional[Dict[str, Any]] = None) -> str:
+        """Identifier of the embedding space a provider, model and their settings produce."""
+        # Credentials and endpoints don't change the vectors, so they don't split the space
+        settings = {
+            name: value for name, value in (settings or {}).items()
+            if not any(part in name.lower() for part in ("key", "token", "secret", "url", "base"))
+        }
+        payload = json.dumps([provider, model, settings], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def make_key(text: str, kind: str = "document") -> str:
+        """Key of a text; queries and documents are kept apart as some providers embed them differently."""
+        return hashlib.sha256(f"{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        if self.cache_dir is None:
+            return None
+        if self._conn is None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                conn = sqlite3.connect(os.path.join(self.cache_dir, "index.sqlite"), check_same_thread=False, timeout=5)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS spaces (space TEXT PRIMARY KEY, dim INTEGER, capacity INTEGER)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS vectors ("
+                    "space TEXT, key TEXT, slot INTEGER, accessed_at REAL, ready INTEGER DEFAULT 1, "
+                    "PRIMARY KEY (space, key))"
+                )
+                columns = [column[1] for column in conn.execute("PRAGMA table_info(vectors)")]
+                if "ready" not in columns:
+                    conn.execute("ALTER TABLE vectors ADD COLUMN ready INTEGER DEFAULT 1")
+                conn.execute("CREATE INDEX IF NOT EXISTS vectors_lru ON vectors (space, accessed_at)")
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache disk store unavailable ({self.cache_dir}): {e}")
+                self.cache_dir = None
+                return None
+        return self._conn
+
+    def _close(self):
+        for space in self._spaces.values():
+            space.flush()
+        self._spaces.clear()
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def _open_space(self, space: str, dim: Optional[int] = None) -> Optional[_VectorSpace]:
+        """Open (or create, when ``dim`` is known) the rows of a space. Caller holds the lock."""
+        opened = self._spaces.get(space)
+        if opened is not None and (dim is None or opened.dim == dim):
+            return opened
+
+        conn = self._get_conn()
+        row = conn.execute("SELECT dim, capacity FROM spaces WHERE space = ?", (space,)).fetchone() if conn else None
+        if row is not None and dim is not None and row[0] != dim:
+            # The provider changed its output size; the old vectors are useless
+            logger.info(f"Embedding dimension of space {space} changed from {row[0]} to {dim}, resetting it")
+            with conn:
+                conn.execute("DELETE FROM vectors WHERE space = ?", (space,))
+                conn.execute("DELETE FROM spaces WHERE space = ?", (space,))
+            row = None
+        if row is None and dim is None:
+            return None
+
+        dim = row[0] if row is not None else dim
+        # Spaces only grow, so rows already written stay valid
+        capacity = max(self.max_entries, row[1] if row is not None else 0)
+        path = os.path.join(self.cache_dir, f"{space}-{dim}.f32") if conn else None
+        opened = _VectorSpace(space, dim, capacity, path)
+        if conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO spaces (space, dim, capacity) VALUES (?, ?, ?)", (space, dim, capacity)
+                )
+        self._spaces[space] = opened
+        return opened
+
+    @staticmethod
+    def _read_slots(conn: sqlite3.Connection, space: str, keys: List[str], ready: bool = True) -> Dict[str, int]:
+        """
+        Rows of the ``keys`` as the index says right now: only rows whose vectors have been
+        written, or reservations too when ``ready`` is False.
+        """
+        slots: Dict[str, int] = {}
+        condition = " AND ready" if ready else ""
+        for i in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[i:i + _QUERY_BATCH]
+            slots.update(conn.execute(
+                f"SELECT key, slot FROM vectors WHERE space = ?{condition} "
+                f"AND key IN ({', '.join('?' * len(batch))})",
+                (space, *batch),
+            ))
+        return slots
+
+    def _reserve_slots(self, conn: sqlite3.Connection, opened: _VectorSpace, keys: List[str]) -> Dict[str, int]:
+        """
+        Rows to write the vectors of ``keys`` to, assigned in one write transaction so
+        concurrent processes never get the same row. Rows of new keys are reserved (not
+        ready) until their vectors have been written; keys that get no row are left out.
+        """
+        space = opened.space
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            slots = self._read_slots(conn, space, keys, ready=False)
+            new_keys = [key for key in keys if key not in slots]
+            next_slot = conn.execute(
+                "SELECT COALESCE(MAX(slot) + 1, 0) FROM vectors WHERE space = ?", (space,)
+            ).fetchone()[0]
+            fresh = max(0, min(len(new_keys), opened.capacity - next_slot))
+            for offset, key in enumerate(new_keys[:fresh]):
+                slots[key] = next_slot + offset
+            evicted = []
+            if len(new_keys) > fresh:
+                # Least recently used rows, except those a live writer has reserved
+                candidates = conn.execute(
+                    "SELECT key, slot FROM vectors WHERE space = ? AND (ready OR accessed_at < ?) "
+                    "ORDER BY accessed_at LIMIT ?",
+                    (space, now - RESERVATION_TIMEOUT, len(new_keys) - fresh + len(slots)),
+                ).fetchall()
+                victims = [(key, slot) for key, slot in candidates if key not in slots and slot < opened.capacity]
+                for key, (old_key, slot) in zip(new_keys[fresh:], victims):
+                    slots[key] = slot
+                    evicted.append(old_key)
+            conn.executemany("DELETE FROM vectors WHERE space = ? AND key = ?", [(space, key) for key in evicted])
+            conn.executemany(
+                "INSERT INTO vectors (space, key, slot, accessed_at, ready) VALUES (?, ?, ?, ?, 0)",
+                [(space, key, slots[key], now + i * 1e-6) for i, key in enumerate(new_keys) if key in slots],
+            )
+        self._stats["evictions"] += len(evicted)
+        # Another process may have grown the space beyond this process's file
+        return {key: slot for key, slot in slots.items() if slot < opened.capacity}
+
+    def get_many(self, space: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Vectors of the keys that are cached, as float32 copies."""
+        found: Dict[str, np.ndarray] = {}
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            try:
+                opened = self._open_space(space)
+                conn = self._get_conn()
+                if opened is not None and conn is None:
+                    for key in keys:
+                        slot = opened.index.get(key)
+                        if slot is not None:
+                            opened.index.move_to_end(key)
+                            found[key] = np.array(opened.vectors[slot])
+                elif opened is not None:
+                    slots = self._read_slots(conn, space, keys)
+                    for key, slot in slots.items():
+                        if slot < opened.capacity:
+                            found[key] = np.array(opened.vectors[slot])
+                    if found:
+                        # A writer in another process may have taken a row over while it was
+                        # copied; only rows that still belong to their key are hits
+                        current = self._read_slots(conn, space, list(found))
+                        found = {key: vector for key, vector in found.items() if current.get(key) == slots[key]}
+                    if found:
+                        now = time.time()
+                        with conn:
+                            conn.executemany(
+                                "UPDATE vectors SET accessed_at = ? WHERE space = ? AND key = ?",
+                                # Later keys count as more recently used, like the in-memory index
+                                [(now + i * 1e-6, space, key) for i, key in enumerate(found)],
+                            )
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.debug(f"Embedding cache read failed: {e}")
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(keys) - len(found)
+        return found
+
+    def put_many(self, space: str, keys: List[str], vectors: List[List[float]]) -> Dict[str, np.ndarray]:
+        """Store a batch of vectors fetched from the provider and return them as the float32 rows later hits will see."""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        stored = {key: matrix[i] for i, key in enumerate(keys)}
+        if not keys:
+            return stored
+        with self._lock:
+            self._stats["batches"] += 1
+            try:
+                opened = self._open_space(space, matrix.shape[1])
+                conn = self._get_conn()
+                if conn is None:
+                    for key, vector in stored.items():
+                        slot = opened.index.get(key)
+                        if slot is None:
+                            slot, old_key = opened.allocate()
+                            if old_key is not None:
+                                self._stats["evictions"] += 1
+                        opened.index[key] = slot
+                        opened.index.move_to_end(key)
+                        opened.vectors[slot] = vector
+                else:
+                    slots = self._reserve_slots(conn, opened, list(stored))
+                    for key, slot in slots.items():
+                        opened.vectors[slot] = stored[key]
+                    # Vectors hit the file before the index marks them readable
+                    opened.flush()
+                    now = time.time()
+                    with conn:
+                        conn.executemany(
+                            "UPDATE vectors SET ready = 1, accessed_at = ? WHERE space = ? AND key = ? AND slot = ?",
+                            [(now + i * 1e-6, space, key, slot) for i, (key, slot) in enumerate(slots.items())],
+                        )
+            except (sqlite3.Error, OSError, ValueError) as e:
+                logger.debug(f"Embedding cache write failed: {e}")
+        return stored
+
+    def wrap(self, embeddings: Embeddings, space: str) -> "CachedEmbeddings":
+        """Wrap a LangChain embeddings object with this cache."""
+        return CachedEmbeddings(embeddings, space, self)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the number of cached vectors per space."""
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                spaces = {space: len(opened.index) for space, opened in self._spaces.items()}
+            else:
+                spaces = dict(conn.execute("SELECT space, COUNT(*) FROM vectors WHERE ready GROUP BY space"))
+            return {**self._stats, "spaces": spaces}
+
+    def clear(self):
+        """Drop every cached vector and reset the counters."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+            paths = [space.path for space in self._spaces.values() if space.path]
+            conn = self._get_conn()
+            self._close()
+            if conn is not None:
+                conn = self._get_conn()
+                with conn:
+                    conn.execute("DELETE FROM vectors")
+                    conn.execute("DELETE FROM spaces")
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain `Embeddings` that serves vectors from the `EmbeddingCache` and only sends
+    misses to the wrapped provider, deduplicated and in batches.
+    """
+
+    def __init__(self, embeddings: Embeddings, space: str, cache: EmbeddingCache):
+        self.embeddings = embeddings
+        self.space = space
+        self.cache = cache
+
+    def __getattr__(self, name):
+        # Expose provider attributes (model, dimensions, ...) like the unwrapped object
+        if name in ("embeddings", "space", "cache"):
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _lookup(self, texts: List[str], kind: str):
+        keys = [self.cache.make_key(text, kind) for text in texts]
+        found = self.cache.get_many(self.space, keys)
+        missing = list(dict.fromkeys((key, text) for key, text in zip(keys, texts) if key not in found))
+        batches = [missing[i:i + self.cache.batch_size] for i in range(0, len(missing), self.cache.batch_size)]
+        return keys, found, batches
+
+    def _store(self, batch, vectors, found):
+        found.update(self.cache.put_many(self.space, [key for key, _ in batch], vectors))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, batches = self._lookup(texts, "document")
+        for batch in batches:
+            self._store(batch, self.embeddings.embed_documents([text for _, text in batch]), found)
+        return [found[key].tolist() for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, found, batches = self._lookup([text], "query")
+        for batch in batches:
+            self._store(batch, [self.embeddings.embed_query(batch[0][1])], found)
+        return found[keys[0]].tolist()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, batches = self._lookup(texts, "document")
+        for batch in batches:
+            self._store(batch, await self.embeddings.aembed_documents([text for _, text in batch]), found)
+        return [found[key].tolist() for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        keys, found, batches = self._lookup([text], "query")
+        for batch in batches:
+            self._store(batch, [await self.embeddings.aembed_query(batch[0][1])], found)
+        return found[keys[0]].tolist()
+
+
+# Singleton instance
+_embedding_cache = EmbeddingCache()
+
+
+def get_embedding_cache(cfg=None) -> EmbeddingCache:
+    """Get the embedding cache singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _embedding_cache.configure(
+            enabled=getattr(cfg, "embedding_cache_enabled", True),
+            max_entries=getattr(cfg, "embedding_cache_max_entries", 50000),
+            batch_size=getattr(cfg, "embedding_cache_batch_size", 256),
+            cache_dir=getattr(cfg, "cache_dir", DEFAULT_CACHE_DIR),
+        )
+    return _embedding_cache
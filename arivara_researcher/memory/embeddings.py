@@ -1,6 +1,8 @@
 import os
 from typing import Any
 
+from .embedding_cache import get_embedding_cache
+
 OPENAI_EMBEDDING_MODEL = os.environ.get(
     "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
 )
@@ -28,6 +30,8 @@ _SUPPORTED_PROVIDERS = {
 
 class Memory:
     def __init__(self, embedding_provider: str, model: str, **embdding_kwargs: Any):
+        self._space = get_embedding_cache().make_space(embedding_provider, model, embdding_kwargs)
+        self._cached_embeddings = None
         _embeddings = None
         match embedding_provider:
             case "custom":
@@ -133,4 +137,10 @@ class Memory:
         self._embeddings = _embeddings
 
     def get_embeddings(self):
-        return self._embeddings
+        """The provider's embeddings, served through the embedding cache when it is enabled."""
+        cache = get_embedding_cache()
+        if not cache.enabled:
+            return self._embeddings
+        if self._cached_embeddings is None:
+            self._cached_embeddings = cache.wrap(self._embeddings, self._space)
+        return self._cached_embeddings
@@ -454,7 +454,9 @@ response:
     def pretty_print_docs(docs: list[Document], top_n: int | None = None) -> str:
         """Compress the list of documents into a context string"""
         return f"\n".join(f"Source: {d.metadata.get('source')}\n"
-                          f"Title: {d.metadata.get('title')}\n"
+                          + (f"Also published at: {', '.join(d.metadata['duplicate_urls'])}\n"
+                             if d.metadata.get("duplicate_urls") else "")
+                          + f"Title: {d.metadata.get('title')}\n"
                           f"Content: {d.page_content}\n"
                           for i, d in enumerate(docs)
                           if top_n is None or i < top_n)
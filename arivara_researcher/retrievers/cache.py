@@ -0,0 +1,277 @@
+"""
+Search result cache shared by all retrievers.
+
+Results are keyed on (retriever, normalized query, query_domains, max_results) and
+kept in two tiers: a bounded in-process LRU and an on-disk SQLite store that
+survives restarts and is shared by every worker process on the host. Each
+retriever can have its own TTL so fast-moving sources (news, web search) expire
+sooner than slow-moving ones (arxiv, semantic scholar).
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, ClassVar, Dict, List, Optional
+
+from .utils import normalize_retriever_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "./.arivara_cache"
+
+
+class SearchResultCache:
+    """
+    Singleton two-tier (memory + SQLite) cache for retriever search results.
+
+    Empty result lists are never cached because retrievers return [] on errors.
+    """
+
+    _instance: ClassVar['SearchResultCache'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the cache (only once)."""
+        if self._initialized:
+            return
+
+        self.enabled = True
+        self.default_ttl = 3600
+        self.ttls: Dict[str, int] = {}
+        self.max_entries = 1024
+        self.db_path: Optional[str] = None
+
+        self._memory: "OrderedDict[str, tuple[float, list]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        )
+        self._initialized = True
+
+    def configure(
+        self,
+        enabled: bool = True,
+        default_ttl: int = 3600,
+        ttls: Optional[Dict[str, int]] = None,
+        max_entries: int = 1024,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        use_disk: bool = True,
+    ):
+        """
+        Configure the cache.
+
+        Args:
+            enabled: Whether lookups and stores are performed at all
+            default_ttl: Seconds a result stays fresh when no per-retriever TTL is set
+            ttls: Per-retriever TTLs, keyed by retriever name (e.g. {"tavily": 900})
+            max_entries: Maximum entries held by the in-process LRU tier
+            cache_dir: Directory for the SQLite tier
+            use_disk: Whether to use the SQLite tier
+        """
+        with self._lock:
+            self.enabled = enabled
+            self.default_ttl = default_ttl
+            self.ttls = {normalize_retriever_name(k): v for k, v in (ttls or {}).items()}
+            self.max_entries = max(0, max_entries)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+            db_path = os.path.join(cache_dir, "search_cache.sqlite") if (use_disk and cache_dir) else None
+            if db_path != self.db_path:
+                self._close()
+                self.db_path = db_path
+
+    @staticmethod
+    def make_key(
+        retriever_name: str,
+        query: str,
+        query_domains: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> str:
+        """Build the cache key from the retriever name and normalized search arguments."""
+        normalized_query = " ".join(query.lower().split())
+        domains = sorted({d.strip().lower() for d in (query_domains or []) if d and d.strip()})
+        payload = json.dumps([retriever_name, normalized_query, domains, max_results])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, retriever_name: str) -> int:
+        return self.ttls.get(normalize_retriever_name(retriever_name), self.default_ttl)
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        if self.db_path is None:
+            return None
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS search_results ("
+                    "key TEXT PRIMARY KEY, retriever TEXT, results TEXT, expires_at REAL)"
+                )
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Search cache disk tier unavailable ({self.db_path}): {e}")
+                self.db_path = None
+                return None
+        return self._conn
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def get(self, retriever_name: str, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, results = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats[retriever_name]["memory_hits"] += 1
+                    return [dict(r) for r in results]
+                del self._memory[key]
+
+            conn = self._get_conn()
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT results, expires_at FROM search_results WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.debug(f"Search cache read failed: {e}")
+                    row = None
+                if row is not None and row[1] > now:
+                    results = json.loads(row[0])
+                    self._remember(key, row[1], results)
+                    self._stats[retriever_name]["disk_hits"] += 1
+                    return [dict(r) for r in results]
+
+            self._stats[retriever_name]["misses"] += 1
+            return None
+
+    def set(self, retriever_name: str, key: str, results: List[Dict[str, Any]]) -> None:
+        """Store non-empty results in both tiers."""
+        if not self.enabled or not results:
+            return
+
+        expires_at = time.time() + self.ttl_for(retriever_name)
+        with self._lock:
+            self._remember(key, expires_at, [dict(r) for r in results])
+            conn = self._get_conn()
+            if conn is not None:
+                try:
+                    with conn:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO search_results (key, retriever, results, expires_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            (key, retriever_name, json.dumps(results, default=str), expires_at),
+                        )
+                        conn.execute("DELETE FROM search_results WHERE expires_at <= ?", (time.time(),))
+                except sqlite3.Error as e:
+                    logger.debug(f"Search cache write failed: {e}")
+
+    def _remember(self, key: str, expires_at: float, results: list) -> None:
+        if self.max_entries == 0:
+            return
+        self._memory[key] = (expires_at, results)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters per retriever."""
+        with self._lock:
+            return {name: dict(counters) for name, counters in self._stats.items()}
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self._stats.clear()
+            conn = self._get_conn()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM search_results")
+
+
+# Singleton instance
+_search_cache = SearchResultCache()
+
+
+def get_search_cache(cfg=None) -> SearchResultCache:
+    """Get the search cache singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _search_cache.configure(
+            enabled=getattr(cfg, "search_cache_enabled", True),
+            default_ttl=getattr(cfg, "search_cache_ttl", 3600),
+            ttls=getattr(cfg, "search_cache_ttls", None),
+            max_entries=getattr(cfg, "search_cache_max_entries", 1024),
+            cache_dir=getattr(cfg, "cache_dir", DEFAULT_CACHE_DIR),
+            use_disk=getattr(cfg, "search_cache_disk", True),
+        )
+    return _search_cache
+
+
+def cached_search(
+    retriever_class,
+    query: str,
+    query_domains: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    cfg=None,
+) -> List[Dict[str, Any]]:
+    """
+    Run ``retriever_class(query, query_domains=...).search(...)`` through the search cache.
+
+    The retriever is only instantiated on a cache miss. MCP retrievers are never cached
+    because their results depend on the researcher's tool configuration.
+
+    Args:
+        retriever_class: The retriever class to search with
+        query: The search query
+        query_domains: Optional list of domains to restrict the search to
+        max_results: Maximum results to request; None uses the retriever's own default
+        cfg: Config used to configure the cache
+
+    Returns:
+        list: Search results
+    """
+    cache = get_search_cache(cfg)
+    retriever_name = retriever_class.__name__
+
+    def _search():
+        retriever = retriever_class(query, query_domains=query_domains)
+        if max_results is None:
+            return retriever.search()
+        return retriever.search(max_results=max_results)
+
+    if not cache.enabled or "mcpretriever" in retriever_name.lower():
+        return _search()
+
+    key = cache.make_key(retriever_name, query, query_domains, max_results)
+    results = cache.get(retriever_name, key)
+    if results is not None:
+        logger.debug(f"Search cache hit for {retriever_name}: {query}")
+        return results
+
+    results = _search()
+    cache.set(retriever_name, key, results)
+    return results
@@ -71,6 +71,46 @@ VALID_RETRIEVERS = [
     "mock"
 ]
 
+def normalize_retriever_name(name: str) -> str:
+    """
+    Normalize a retriever class or config name so both spellings match
+    (e.g. "TavilySearch" and "tavily", "SemanticScholarSearch" and "semantic_scholar").
+    """
+    name = name.lower().replace("_", "")
+    return name[: -len("search")] if name.endswith("search") and name != "search" else name
+
+
+def reciprocal_rank_fusion(ranked_lists, k: int = 60, key=None) -> list:
+    """
+    Merge several ranked lists with reciprocal-rank fusion.
+
+    Each item scores sum(1 / (k + rank)) over the lists it appears in, so items ranked
+    highly by several retrievers float to the top. Ties keep first-seen order.
+
+    Args:
+        ranked_lists: Iterable of ranked lists of hashable items (e.g. URLs)
+        k: Rank smoothing constant (60 is the value from the original RRF paper)
+        key: Optional function mapping items to an identity (e.g. a canonical URL); items
+             with the same identity are fused and represented by the first one seen
+
+    Returns:
+        list: Unique items ordered by fused score
+    """
+    key = key or (lambda item: item)
+    scores = {}
+    representatives = {}
+    for ranked in ranked_lists:
+        seen = set()
+        for rank, item in enumerate(ranked, start=1):
+            identity = key(item)
+            if identity in seen:
+                continue
+            seen.add(identity)
+            representatives.setdefault(identity, item)
+            scores[identity] = scores.get(identity, 0.0) + 1.0 / (k + rank)
+    return [representatives[identity] for identity in sorted(scores, key=lambda i: scores[i], reverse=True)]
+
+
 def get_all_retriever_names():
     """
     Get all available retriever names
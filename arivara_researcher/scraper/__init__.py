@@ -1,5 +1,6 @@
 from .beautiful_soup.beautiful_soup import BeautifulSoupScraper
 from .web_base_loader.web_base_loader import WebBaseLoaderScraper
+from .lxml_scraper.lxml_scraper import LxmlScraper
 from .arxiv.arxiv import ArxivScraper
 from .pymupdf.pymupdf import PyMuPDFScraper
 from .browser.browser import BrowserScraper
@@ -11,6 +12,7 @@ from .scraper import Scraper
 __all__ = [
     "BeautifulSoupScraper",
     "WebBaseLoaderScraper",
+    "LxmlScraper",
     "ArxivScraper",
     "PyMuPDFScraper",
     "BrowserScraper",
@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from ..http_client import FetchResult, get_http_client
 from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
 
 class BeautifulSoupScraper:
@@ -22,21 +23,63 @@ class BeautifulSoupScraper:
         """
         try:
             response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
+            return self.parse(FetchResult(
+                url=self.link,
+                status=response.status_code,
+                body=response.content,
+                encoding=response.encoding,
+            ))
 
-            soup = clean_soup(soup)
+        except Exception as e:
+            print("Error! : " + str(e))
+            return "", [], ""
 
-            content = get_text_from_soup(soup)
+    async def fetch_async(self, headers=None) -> FetchResult:
+        """
+        Fetches the webpage with the shared async HTTP client. Network errors propagate to the caller.
 
-            image_urls = get_relevant_images(soup, self.link)
-            
-            # Extract the title using the utility function
-            title = extract_title(soup)
+        Args:
+          headers: Extra request headers, e.g. conditional-request validators
+        """
+        request_headers = dict(self.session.headers) if self.session is not None else {}
+        request_headers.update(headers or {})
+        return await get_http_client().fetch(self.link, headers=request_headers)
 
-            return content, image_urls, title
+    def parse(self, result: FetchResult) -> tuple:
+        """
+        Parses a fetched page into (content, image_urls, title). This is the CPU-bound half
+        of `scrape` and is safe to run in a worker thread.
+        """
+        return self.extract(result.body, result.encoding, self.link)
 
-        except Exception as e:
-            print("Error! : " + str(e))
-            return "", [], ""
+    @staticmethod
+    def extract(body: bytes, encoding, url: str) -> tuple:
+        """
+        Picklable form of `parse` for running in a worker process.
+        """
+        return extract_page(body, encoding, url)
+
+
+def extract_page(body: bytes, encoding, url: str) -> tuple:
+    """
+    Extracts (content, image_urls, title) from raw HTML bytes.
+
+    Only plain bytes/strings cross the call boundary so it can run in a process pool.
+    """
+    try:
+        soup = BeautifulSoup(body, "lxml", from_encoding=encoding)
+
+        soup = clean_soup(soup)
+
+        content = get_text_from_soup(soup)
+
+        image_urls = get_relevant_images(soup, url)
+
+        # Extract the title using the utility function
+        title = extract_title(soup)
+
+        return content, image_urls, str(title) if title else ""
+
+    except Exception as e:
+        print("Error! : " + str(e))
+        return "", [], ""
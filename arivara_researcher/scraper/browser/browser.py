@@ -1,13 +1,9 @@
 from __future__ import annotations
 
 import traceback
-import pickle
 from pathlib import Path
 from sys import platform
 import time
-import random
-import string
-import os
 
 from bs4 import BeautifulSoup
 from typing import Iterable, cast
@@ -18,6 +14,7 @@ from .processing.scrape_skills import (scrape_pdf_with_pymupdf,
 from urllib.parse import urljoin
 
 from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
+from .driver_pool import get_driver_pool
 
 FILE_DIR = Path(__file__).parent.parent
 
@@ -26,37 +23,45 @@ class BrowserScraper:
         self.url = url
         self.session = session
         self.selenium_web_browser = "chrome"
-        self.headless = False
+        self.pool = get_driver_pool()
+        self.headless = self.pool.headless
         self.user_agent = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                            "AppleWebKit/537.36 (KHTML, like Gecko) "
                            "Chrome/128.0.0.0 Safari/537.36")
         self.driver = None
         self.use_browser_cookies = False
         self._import_selenium()  # Import only if used to avoid unnecessary dependencies
-        self.cookie_filename = f"{self._generate_random_string(8)}.pkl"
 
     def scrape(self) -> tuple:
         if not self.url:
             print("URL not specified")
             return "A URL was not specified, cancelling request to browse website.", [], ""
 
+        healthy = True
         try:
-            self.setup_driver()
-            self._visit_google_and_save_cookies()
+            self.driver = self.pool.acquire(self._create_pooled_driver)
             self._load_saved_cookies()
             self._add_header()
 
             text, image_urls, title = self.scrape_text_with_selenium()
+            self.pool.remember_cookies(self._get_domain(), self.driver.get_cookies())
             return text, image_urls, title
         except Exception as e:
+            healthy = not isinstance(e, WebDriverException)
             print(f"An error occurred during scraping: {str(e)}")
             print("Full stack trace:")
             print(traceback.format_exc())
             return f"An error occurred: {str(e)}\n\nStack trace:\n{traceback.format_exc()}", [], ""
         finally:
             if self.driver:
-                self.driver.quit()
-            self._cleanup_cookie_file()
+                self.pool.release(self.driver, healthy)
+                self.driver = None
+
+    def _create_pooled_driver(self):
+        """Start a driver for the pool, warming its cookie jar with a Google visit once."""
+        self.setup_driver()
+        self._visit_google_and_save_cookies()
+        return self.driver
 
     def _import_selenium(self):
         try:
@@ -103,7 +108,6 @@ class BrowserScraper:
             else:  # chrome
                 if platform == "linux" or platform == "linux2":
                     options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--remote-debugging-port=9222")
                 options.add_argument("--no-sandbox")
                 options.add_experimental_option("prefs", {"download_restrictions": 3})
                 self.driver = webdriver.Chrome(options=options)
@@ -119,14 +123,23 @@ class BrowserScraper:
             raise
 
     def _load_saved_cookies(self):
-        """Load saved cookies before visiting the target URL"""
-        cookie_file = Path(self.cookie_filename)
-        if cookie_file.exists():
-            cookies = pickle.load(open(self.cookie_filename, "rb"))
-            for cookie in cookies:
-                self.driver.add_cookie(cookie)
-        else:
-            print("No saved cookies found.")
+        """Load cookies cached from earlier visits to the target domain before navigating to it"""
+        cookies = self.pool.cookies_for(self._get_domain())
+        if not cookies or not hasattr(self.driver, "execute_cdp_cmd"):
+            return
+        # CDP can set cookies for any domain without first navigating there (Chromium only)
+        for cookie in cookies:
+            params = {
+                key: cookie[key]
+                for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+                if key in cookie
+            }
+            if "expiry" in cookie:
+                params["expires"] = cookie["expiry"]
+            try:
+                self.driver.execute_cdp_cmd("Network.setCookie", params)
+            except Exception as e:
+                print(f"Failed to restore cookie {cookie.get('name')}: {str(e)}")
 
     def _load_browser_cookies(self):
         """Load cookies directly from the browser"""
@@ -149,21 +162,6 @@ class BrowserScraper:
         for cookie in cookies:
             self.driver.add_cookie({'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain})
 
-    def _cleanup_cookie_file(self):
-        """Remove the cookie file"""
-        cookie_file = Path(self.cookie_filename)
-        if cookie_file.exists():
-            try:
-                os.remove(self.cookie_filename)
-            except Exception as e:
-                print(f"Failed to remove cookie file: {str(e)}")
-        else:
-            print("No cookie file found to remove.")
-
-    def _generate_random_string(self, length):
-        """Generate a random string of specified length"""
-        return "".join(random.choices(string.ascii_letters + string.digits, k=length))
-
     def _get_domain(self):
         """Extract domain from URL"""
         from urllib.parse import urlparse
@@ -173,14 +171,12 @@ class BrowserScraper:
         return domain[4:] if domain.startswith("www.") else domain
 
     def _visit_google_and_save_cookies(self):
-        """Visit Google and save cookies before navigating to the target URL"""
+        """Visit Google and cache its cookies; done once per pooled driver"""
         try:
             self.driver.get("https://www.google.com")
             time.sleep(2)  # Wait for cookies to be set
 
-            # Save cookies to a file
-            cookies = self.driver.get_cookies()
-            pickle.dump(cookies, open(self.cookie_filename, "wb"))
+            self.pool.remember_cookies("google.com", self.driver.get_cookies())
 
             # print("Google cookies saved successfully.")
         except Exception as e:
@@ -0,0 +1,186 @@
+"""
+Pool of reusable Selenium WebDrivers for `BrowserScraper`.
+
+Starting a WebDriver costs seconds, so drivers are kept alive between pages instead
+of being created and quit for every URL. The pool is bounded; callers block until a
+driver is free. Drivers are health-checked before reuse, reset between pages and
+recycled after a number of uses or on failure. Cookies are cached per domain in
+memory so a page can start with the cookies a previous visit to its domain got.
+"""
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, ClassVar, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SeleniumDriverPool:
+    """Singleton, thread-safe pool of Selenium WebDrivers."""
+
+    _instance: ClassVar['SeleniumDriverPool'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the pool (only once)."""
+        if self._initialized:
+            return
+
+        self.max_drivers = 4
+        self.max_uses = 50
+        self.headless = False
+        self._idle: List[Any] = []
+        self._uses: Dict[int, int] = {}
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._cookies: Dict[str, List[Dict[str, Any]]] = {}
+        self._stats: Dict[str, int] = {"created": 0, "reused": 0, "recycled": 0, "waits": 0}
+        self._initialized = True
+        atexit.register(self.shutdown)
+
+    def configure(self, max_drivers: int = 4, max_uses: int = 50, headless: bool = False):
+        """
+        Configure the pool.
+
+        Args:
+            max_drivers: Maximum number of drivers alive at once
+            max_uses: Pages a driver loads before it is replaced (0 = unlimited)
+            headless: Whether new drivers are started headless
+        """
+        with self._condition:
+            self.max_drivers = max(1, max_drivers)
+            self.max_uses = max_uses
+            self.headless = headless
+            self._condition.notify_all()
+
+    def acquire(self, factory: Callable[[], Any], timeout: Optional[float] = None):
+        """
+        Take a driver from the pool, creating one with ``factory`` if none is idle.
+
+        Args:
+            factory: Creates a new, ready-to-use driver
+            timeout: Seconds to wait for a free slot (None = wait indefinitely)
+
+        Raises:
+            TimeoutError: If no driver became free within ``timeout``
+        """
+        with self._condition:
+            if self._in_use >= self.max_drivers:
+                self._stats["waits"] += 1
+            if not self._condition.wait_for(lambda: self._in_use < self.max_drivers, timeout):
+                raise TimeoutError("No browser driver became available")
+            self._in_use += 1
+            driver = self._idle.pop() if self._idle else None
+
+        try:
+            if driver is not None and not self._is_healthy(driver):
+                self._quit(driver)
+                self._stats["recycled"] += 1
+                driver = None
+            if driver is None:
+                driver = factory()
+                self._uses[id(driver)] = 0
+                self._stats["created"] += 1
+            else:
+                self._stats["reused"] += 1
+            self._uses[id(driver)] += 1
+            return driver
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, driver, healthy: bool = True):
+        """
+        Return a driver to the pool after resetting it, or quit it if it is broken or worn out.
+        """
+        uses = self._uses.get(id(driver), 0)
+        keep = healthy and (not self.max_uses or uses < self.max_uses) and self._reset(driver)
+        with self._condition:
+            self._in_use -= 1
+            if keep:
+                self._idle.append(driver)
+            self._condition.notify()
+        if not keep:
+            self._stats["recycled"] += 1
+            self._quit(driver)
+
+    @contextmanager
+    def driver(self, factory: Callable[[], Any]):
+        """Context manager form of `acquire`/`release`; a driver that raised is recycled."""
+        driver = self.acquire(factory)
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.release(driver, healthy)
+
+    def remember_cookies(self, domain: str, cookies: List[Dict[str, Any]]):
+        """Cache the cookies a page on ``domain`` ended up with."""
+        if domain and cookies:
+            self._cookies[domain] = [dict(cookie) for cookie in cookies]
+
+    def cookies_for(self, domain: str) -> List[Dict[str, Any]]:
+        """Cookies cached for ``domain``, if any."""
+        return [dict(cookie) for cookie in self._cookies.get(domain, [])]
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception as e:
+            logger.info(f"Recycling unresponsive browser driver: {e}")
+            return False
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """Close extra windows and leave the page blank so the next scrape starts clean."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.info(f"Failed to reset browser driver: {e}")
+            return False
+
+    def _quit(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Failed to quit browser driver: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Pool size and driver lifecycle counters."""
+        with self._condition:
+            return {**self._stats, "in_use": self._in_use, "idle": len(self._idle), "max_drivers": self.max_drivers}
+
+    def shutdown(self):
+        """Quit every idle driver."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+
+
+# Singleton instance
+_driver_pool = SeleniumDriverPool()
+
+
+def get_driver_pool() -> SeleniumDriverPool:
+    """Get the Selenium driver pool singleton instance."""
+    return _driver_pool
@@ -9,6 +9,7 @@ from typing import Dict, Literal, cast, Tuple, List
 import requests
 import asyncio
 import logging
+import time
 
 from ..utils import get_relevant_images, extract_title, get_text_from_soup, clean_soup
 
@@ -17,8 +18,28 @@ class NoDriverScraper:
     logger = logging.getLogger(__name__)
     max_browsers = 3
     browser_load_threshold = 5
+    max_tabs_per_browser = 8
+    # Browsers stay warm this long after their last page; 0 stops them as soon as they are idle
+    idle_timeout = 300.0
+    # Keep at least this many browsers running even when idle
+    min_browsers = 0
+    reuse_tabs = True
+    # CDP resource types that are never downloaded (their URLs stay in the DOM for image extraction)
+    blocked_resource_types: List[str] = ["Image", "Font", "Media"]
+    headless = False
     browsers: set["NoDriverScraper.Browser"] = set()
     browsers_lock = asyncio.Lock()
+    _reaper_task: "asyncio.Task | None" = None
+    stats: Dict[str, float] = {
+        "browsers_started": 0,
+        "browsers_stopped": 0,
+        "tabs_created": 0,
+        "tabs_reused": 0,
+        "pages_loaded": 0,
+        "page_load_seconds": 0.0,
+        "max_page_load_seconds": 0.0,
+        "requests_blocked": 0,
+    }
 
     @staticmethod
     def get_domain(url: str) -> str:
@@ -41,21 +62,87 @@ class NoDriverScraper:
             self.tab_mode = True
             self.max_scroll_percent = 500
             self.stopping = False
+            self.idle_tabs: List["zendriver.Tab"] = []
+            self.tab_slots = asyncio.Semaphore(NoDriverScraper.max_tabs_per_browser)
+            self.intercepted_tabs: set[str] = set()
+            self.last_used = time.monotonic()
 
         async def get(self, url: str) -> "zendriver.Tab":
+            await self.tab_slots.acquire()
             self.processing_count += 1
+            tab = None
             try:
                 async with self.rate_limit_for_domain(url):
-                    new_window = not self.has_blank_page
-                    self.has_blank_page = False
-                    if self.tab_mode:
-                        return await self.driver.get(url, new_tab=new_window)
+                    started = time.monotonic()
+                    if self.idle_tabs:
+                        tab = self.idle_tabs.pop()
+                        NoDriverScraper.stats["tabs_reused"] += 1
                     else:
-                        return await self.driver.get(url, new_window=new_window)
-            except Exception:
+                        new_window = not self.has_blank_page
+                        self.has_blank_page = False
+                        if not new_window:
+                            tab = self.driver.main_tab
+                        elif self.tab_mode:
+                            tab = await self.driver.get("about:blank", new_tab=True)
+                        else:
+                            tab = await self.driver.get("about:blank", new_window=True)
+                        NoDriverScraper.stats["tabs_created"] += 1
+                    # Interception must be in place before navigating so nothing heavy slips through
+                    await self.block_resources(tab)
+                    await tab.get(url)
+                    NoDriverScraper.record_page_load(time.monotonic() - started)
+                    return tab
+            except BaseException:
+                if tab is not None:
+                    # Park the tab again (the next get() navigates it anyway) or close it
+                    if NoDriverScraper.reuse_tabs and not self.stopping and not tab.closed:
+                        self.idle_tabs.append(tab)
+                    else:
+                        self.intercepted_tabs.discard(tab.target_id)
+                        try:
+                            await tab.close()
+                        except Exception as e:
+                            NoDriverScraper.logger.debug(f"Failed to close tab after error: {e}")
                 self.processing_count -= 1
+                self.tab_slots.release()
+                self.last_used = time.monotonic()
                 raise
 
+        async def block_resources(self, page: "zendriver.Tab"):
+            """Fail requests for the blocked resource types on this tab via CDP Fetch interception."""
+            resource_types = NoDriverScraper.blocked_resource_types
+            if not resource_types or page.target_id in self.intercepted_tabs:
+                return
+            try:
+                cdp = zendriver.cdp
+
+                async def fail_request(event: "zendriver.cdp.fetch.RequestPaused"):
+                    NoDriverScraper.stats["requests_blocked"] += 1
+                    try:
+                        await page.send(
+                            cdp.fetch.fail_request(
+                                event.request_id, cdp.network.ErrorReason.BLOCKED_BY_CLIENT
+                            )
+                        )
+                    except Exception as e:
+                        NoDriverScraper.logger.debug(f"Failed to block request: {e}")
+
+                page.add_handler(cdp.fetch.RequestPaused, fail_request)
+                await page.send(
+                    cdp.fetch.enable(
+                        patterns=[
+                            cdp.fetch.RequestPattern(
+                                resource_type=cdp.network.ResourceType(resource_type),
+                                request_stage=cdp.fetch.RequestStage.REQUEST,
+                            )
+                            for resource_type in resource_types
+                        ]
+                    )
+                )
+                self.intercepted_tabs.add(page.target_id)
+            except Exception as e:
+                NoDriverScraper.logger.warning(f"Resource blocking unavailable: {e}")
+
         async def scroll_page_to_bottom(self, page: "zendriver.Tab"):
             total_scroll_percent = 0
             while True:
@@ -97,12 +184,22 @@ class NoDriverScraper:
                 )
 
         async def close_page(self, page: "zendriver.Tab"):
+            """Return the tab to the idle pool for reuse, or close it."""
             try:
-                await page.close()
+                if NoDriverScraper.reuse_tabs and not self.stopping and not page.closed:
+                    # Stop any scripts, timers and pending loads before parking the tab
+                    await page.get("about:blank")
+                    self.idle_tabs.append(page)
+                else:
+                    self.intercepted_tabs.discard(page.target_id)
+                    await page.close()
             except Exception as e:
                 NoDriverScraper.logger.error(f"Failed to close page: {e}")
+                self.intercepted_tabs.discard(page.target_id)
             finally:
                 self.processing_count -= 1
+                self.tab_slots.release()
+                self.last_used = time.monotonic()
 
         @asynccontextmanager
         async def rate_limit_for_domain(self, url: str):
@@ -114,50 +211,130 @@ class NoDriverScraper:
                 if not semaphore:
                     semaphore = asyncio.Semaphore(1)
                     self.domain_semaphores[domain] = semaphore
-
-                was_locked = semaphore.locked()
-                async with semaphore:
-                    if was_locked:
-                        await asyncio.sleep(random.uniform(0.6, 1.2))
-                    yield
-
             except Exception as e:
                 # Log error but don't block the request
                 NoDriverScraper.logger.warning(
                     f"Rate limiting error for {url}: {str(e)}"
                 )
 
+            # Errors raised by the caller's block propagate to it
+            if semaphore is None:
+                yield
+                return
+            was_locked = semaphore.locked()
+            async with semaphore:
+                if was_locked:
+                    await asyncio.sleep(random.uniform(0.6, 1.2))
+                yield
+
         async def stop(self):
             if self.stopping:
                 return
             self.stopping = True
+            self.idle_tabs.clear()
+            NoDriverScraper.stats["browsers_stopped"] += 1
             await self.driver.stop()
 
     @classmethod
-    async def get_browser(cls, headless: bool = False) -> "NoDriverScraper.Browser":
-        async def create_browser():
-            try:
-                global zendriver
-                import zendriver
-            except ImportError:
-                raise ImportError(
-                    "The zendriver package is required to use NoDriverScraper. "
-                    "Please install it with: pip install zendriver"
-                )
+    def configure(
+        cls,
+        max_browsers: int = 3,
+        max_tabs_per_browser: int = 8,
+        browser_load_threshold: int = 5,
+        idle_timeout: float = 300.0,
+        min_browsers: int = 0,
+        reuse_tabs: bool = True,
+        blocked_resource_types: List[str] | None = None,
+        headless: bool = False,
+    ):
+        """
+        Configure the shared browser pool. Tab limits apply to browsers started afterwards.
+
+        Args:
+            max_browsers: Maximum number of browsers running at once
+            max_tabs_per_browser: Maximum pages a single browser loads concurrently
+            browser_load_threshold: Open pages at which another browser is started (up to max_browsers)
+            idle_timeout: Seconds an unused browser is kept warm before it is stopped (0 = stop at once)
+            min_browsers: Browsers kept running even when idle, e.g. after pre-warming
+            reuse_tabs: Park finished tabs for reuse instead of closing them
+            blocked_resource_types: CDP resource types to block (e.g. ["Image", "Font", "Media"])
+            headless: Whether browsers are started headless
+        """
+        cls.max_browsers = max(1, max_browsers)
+        cls.max_tabs_per_browser = max(1, max_tabs_per_browser)
+        cls.browser_load_threshold = max(1, min(browser_load_threshold, cls.max_tabs_per_browser))
+        cls.idle_timeout = idle_timeout
+        cls.min_browsers = min(min_browsers, cls.max_browsers)
+        cls.reuse_tabs = reuse_tabs
+        if blocked_resource_types is not None:
+            cls.blocked_resource_types = list(blocked_resource_types)
+        cls.headless = headless
+
+    @classmethod
+    def record_page_load(cls, seconds: float):
+        cls.stats["pages_loaded"] += 1
+        cls.stats["page_load_seconds"] += seconds
+        cls.stats["max_page_load_seconds"] = max(cls.stats["max_page_load_seconds"], seconds)
+
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, float]:
+        """Browser pool utilization and page load time statistics."""
+        capacity = len(cls.browsers) * cls.max_tabs_per_browser
+        in_use = sum(browser.processing_count for browser in cls.browsers)
+        pages = cls.stats["pages_loaded"]
+        return {
+            **cls.stats,
+            "browsers": len(cls.browsers),
+            "tabs_in_use": in_use,
+            "idle_tabs": sum(len(browser.idle_tabs) for browser in cls.browsers),
+            "utilization": round(in_use / capacity, 3) if capacity else 0.0,
+            "avg_page_load_seconds": round(cls.stats["page_load_seconds"] / pages, 3) if pages else 0.0,
+        }
 
-            config = zendriver.Config(
-                headless=headless,
-                browser_connection_timeout=1,
+    @classmethod
+    async def warm_up(cls, count: int | None = None):
+        """
+        Start browsers ahead of the first scrape and keep them warm.
+
+        Args:
+            count: Number of browsers to start (defaults to ``min_browsers``, at least one)
+        """
+        count = min(cls.max_browsers, count if count is not None else max(1, cls.min_browsers))
+        cls.min_browsers = max(cls.min_browsers, count)
+        async with cls.browsers_lock:
+            while len(cls.browsers) < count:
+                await cls._start_browser(cls.headless)
+        cls._ensure_reaper()
+
+    @classmethod
+    async def _start_browser(cls, headless: bool) -> "NoDriverScraper.Browser":
+        try:
+            global zendriver
+            import zendriver
+        except ImportError:
+            raise ImportError(
+                "The zendriver package is required to use NoDriverScraper. "
+                "Please install it with: pip install zendriver"
             )
-            driver = await zendriver.start(config)
-            browser = cls.Browser(driver)
-            cls.browsers.add(browser)
-            return browser
 
+        config = zendriver.Config(
+            headless=headless,
+            browser_connection_timeout=1,
+        )
+        driver = await zendriver.start(config)
+        browser = cls.Browser(driver)
+        cls.browsers.add(browser)
+        cls.stats["browsers_started"] += 1
+        return browser
+
+    @classmethod
+    async def get_browser(cls, headless: bool | None = None) -> "NoDriverScraper.Browser":
+        headless = cls.headless if headless is None else headless
         async with cls.browsers_lock:
+            cls._ensure_reaper()
             if len(cls.browsers) == 0:
                 # No browsers available, create new one
-                return await create_browser()
+                return await cls._start_browser(headless)
 
             # Load balancing: Get browser with lowest number of tabs
             browser = min(cls.browsers, key=lambda b: b.processing_count)
@@ -167,20 +344,52 @@ class NoDriverScraper:
                 browser.processing_count >= cls.browser_load_threshold
                 and len(cls.browsers) < cls.max_browsers
             ):
-                return await create_browser()
+                return await cls._start_browser(headless)
 
             return browser
 
     @classmethod
     async def release_browser(cls, browser: Browser):
+        """Stop the browser once it is idle, unless the pool keeps idle browsers warm."""
+        if cls.idle_timeout > 0:
+            return
         async with cls.browsers_lock:
-            if browser and browser.processing_count <= 0:
-                try:
-                    await browser.stop()
-                except Exception as e:
-                    NoDriverScraper.logger.error(f"Failed to release browser: {e}")
-                finally:
-                    cls.browsers.discard(browser)
+            if browser and browser.processing_count <= 0 and len(cls.browsers) > cls.min_browsers:
+                await cls._stop_browser(browser)
+
+    @classmethod
+    async def _stop_browser(cls, browser: Browser):
+        try:
+            await browser.stop()
+        except Exception as e:
+            NoDriverScraper.logger.error(f"Failed to release browser: {e}")
+        finally:
+            cls.browsers.discard(browser)
+
+    @classmethod
+    def _ensure_reaper(cls):
+        if cls.idle_timeout <= 0 or (cls._reaper_task is not None and not cls._reaper_task.done()):
+            return
+        cls._reaper_task = asyncio.get_running_loop().create_task(cls._reap_idle_browsers())
+
+    @classmethod
+    async def _reap_idle_browsers(cls):
+        """Stop browsers that have been idle longer than ``idle_timeout``."""
+        while cls.browsers:
+            await asyncio.sleep(max(1.0, cls.idle_timeout / 4))
+            now = time.monotonic()
+            async with cls.browsers_lock:
+                idle = sorted(
+                    (
+                        browser
+                        for browser in cls.browsers
+                        if browser.processing_count <= 0 and now - browser.last_used > cls.idle_timeout
+                    ),
+                    key=lambda browser: browser.last_used,
+                )
+                for browser in idle[: max(0, len(cls.browsers) - cls.min_browsers)]:
+                    cls.logger.info("Stopping idle browser")
+                    await cls._stop_browser(browser)
 
     def __init__(self, url: str, session: requests.Session | None = None):
         self.url = url
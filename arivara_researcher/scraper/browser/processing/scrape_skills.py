@@ -1,6 +1,7 @@
-from langchain_community.document_loaders import PyMuPDFLoader
 from langchain_community.retrievers import ArxivRetriever
 
+from arivara_researcher.utils.pdf_ingest import extract_pdf_text, get_pdf_ingestor
+
 
 def scrape_pdf_with_pymupdf(url) -> str:
     """Scrape a pdf with pymupdf
@@ -11,9 +12,8 @@ def scrape_pdf_with_pymupdf(url) -> str:
     Returns:
         str: The text scraped from the pdf
     """
-    loader = PyMuPDFLoader(url)
-    doc = loader.load()
-    return str(doc)
+    ingestor = get_pdf_ingestor()
+    return extract_pdf_text(ingestor.download(url), max_chars=ingestor.max_chars).text
 
 
 def scrape_pdf_with_arxiv(query) -> str:
@@ -1,12 +1,15 @@
 from bs4 import BeautifulSoup
 import os
-from ..utils import get_relevant_images
+from ..utils import api_error_status, get_relevant_images
 
 class FireCrawl:
 
     def __init__(self, link, session=None):
         self.link = link
         self.session = session
+        # Outcome of the API call, reported to the provider's rate limit bucket
+        self.status = None
+        self.retry_after = None
         from firecrawl import FirecrawlApp
         self.firecrawl = FirecrawlApp(api_key=self.get_api_key(), api_url=self.get_server_url())
 
@@ -50,6 +53,7 @@ class FireCrawl:
 
         try:
             response = self.firecrawl.scrape_url(url=self.link, formats=["markdown"])
+            self.status = 200
 
             # Check if the page has been scraped success
             if "error" in response:
@@ -75,5 +79,8 @@ class FireCrawl:
             return content, image_urls, title
 
         except Exception as e:
+            if self.status is None:
+                # The API call itself failed (not the follow-up page fetch)
+                self.status, self.retry_after = api_error_status(e)
             print("Error! : " + str(e))
             return "", [], ""
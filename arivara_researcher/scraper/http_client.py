@@ -0,0 +1,199 @@
+"""
+Shared async HTTP client for the HTML scrapers.
+
+One aiohttp session is kept per event loop so every scrape reuses the same
+keep-alive connection pool instead of a blocking ``requests.Session`` driven
+from the worker thread pool. The connector enforces a global and a per-host
+connection limit and caches DNS lookups. Bodies are streamed and capped after
+decompression so a huge page or a compression bomb can't exhaust memory.
+
+A session is closed when its event loop shuts down its async generators, which
+``asyncio.run`` does before closing the loop, so short-lived loops (CLI runs, MCP
+retriever calls) neither leak their sessions nor warn about unclosed ones.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, ClassVar, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchResult:
+    """A fetched HTTP response body and the metadata needed to parse it."""
+    url: str
+    status: int
+    body: bytes
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    truncated: bool = False
+
+
+class AsyncHttpClient:
+    """
+    Singleton holder of the per-event-loop aiohttp sessions used by the scrapers.
+
+    Connector settings only apply to sessions created after ``configure`` is called,
+    which in practice is the first scrape on each event loop.
+    """
+
+    _instance: ClassVar['AsyncHttpClient'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the client (only once)."""
+        if self._initialized:
+            return
+
+        self.max_connections = 100
+        self.max_connections_per_host = 4
+        self.dns_cache_ttl = 300
+        self.max_response_bytes = 10 * 1024 * 1024
+        self.timeout = 4.0
+        # Each session with the async generator that closes it when its loop shuts down
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncIterator[None]]] = {}
+        self._initialized = True
+
+    def configure(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 4,
+        dns_cache_ttl: int = 300,
+        max_response_bytes: int = 10 * 1024 * 1024,
+        timeout: float = 4.0,
+    ):
+        """
+        Configure the client.
+
+        Args:
+            max_connections: Total simultaneous connections per event loop (0 = unlimited)
+            max_connections_per_host: Simultaneous connections to a single host (0 = unlimited)
+            dns_cache_ttl: Seconds DNS lookups are cached
+            max_response_bytes: Bodies are truncated after this many decompressed bytes
+            timeout: Total seconds allowed for a single request
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_response_bytes = max_response_bytes
+        self.timeout = timeout
+
+    async def _close_on_shutdown(
+        self, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession
+    ) -> AsyncIterator[None]:
+        """Parked until ``loop`` shuts down its async generators (or `close` is called), then closes ``session``."""
+        try:
+            yield
+        finally:
+            entry = self._sessions.get(loop)
+            if entry is not None and entry[0] is session:
+                del self._sessions[loop]
+            if not session.closed:
+                await session.close()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the session bound to the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is not None and not entry[0].closed:
+            return entry[0]
+        # Loops closed without shutting down their async generators can't close their sessions
+        for stale in [other for other in self._sessions if other.is_closed()]:
+            del self._sessions[stale]
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            enable_cleanup_closed=True,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        closer = self._close_on_shutdown(loop, session)
+        self._sessions[loop] = (session, closer)
+        # Starting the generator registers it with the loop's shutdown_asyncgens
+        await closer.__anext__()
+        return session
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+        verify_ssl: bool = True,
+    ) -> FetchResult:
+        """
+        GET ``url`` and read the body up to the byte cap.
+
+        Args:
+            url: The url to fetch
+            headers: Request headers (e.g. the scraper session's User-Agent)
+            max_bytes: Override for the decompressed body cap
+            timeout: Override for the total request timeout
+            verify_ssl: Whether to verify TLS certificates
+
+        Returns:
+            FetchResult: Status, (possibly truncated) body, charset and response headers
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: On connection or timeout failures
+        """
+        cap = self.max_response_bytes if max_bytes is None else max_bytes
+        session = await self.get_session()
+        async with session.get(
+            url,
+            headers=dict(headers or {}),
+            timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+            ssl=None if verify_ssl else False,
+        ) as response:
+            chunks = []
+            size = 0
+            truncated = False
+            # iter_chunked yields decompressed data, so the cap also bounds compression bombs
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                if cap and size + len(chunk) > cap:
+                    chunks.append(chunk[: cap - size])
+                    truncated = True
+                    logger.debug(f"Response body for {url} truncated at {cap} bytes")
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+
+            return FetchResult(
+                url=str(response.url),
+                status=response.status,
+                body=b"".join(chunks),
+                encoding=response.charset,
+                headers=dict(response.headers),
+                truncated=truncated,
+            )
+
+    async def close(self):
+        """Close the session bound to the running event loop."""
+        entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+
+# Singleton instance
+_http_client = AsyncHttpClient()
+
+
+def get_http_client(cfg=None) -> AsyncHttpClient:
+    """Get the shared HTTP client, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _http_client.configure(
+            max_connections=getattr(cfg, "http_max_connections", 100),
+            max_connections_per_host=getattr(cfg, "http_max_connections_per_host", 4),
+            dns_cache_ttl=getattr(cfg, "http_dns_cache_ttl", 300),
+            max_response_bytes=getattr(cfg, "http_max_response_bytes", 10 * 1024 * 1024),
+            timeout=getattr(cfg, "http_timeout", 4.0),
+        )
+    return _http_client
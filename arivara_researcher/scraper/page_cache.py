@@ -0,0 +1,393 @@
+"""
+Disk-backed cache of extracted pages.
+
+Entries are keyed by (canonical url, scraper) and point at a content-addressed,
+compressed blob holding the extracted text, title and image candidates, so a
+hit skips both the network and HTML parsing. Stale entries keep their
+ETag/Last-Modified validators so they can be refreshed with a conditional GET.
+The store is bounded by total blob size and evicts least-recently-used pages.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional
+
+from arivara_researcher.utils.urls import canonicalize_url
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is in requirements.txt
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "./.arivara_cache"
+
+# Bump when extraction output changes so older entries are re-scraped
+EXTRACTION_VERSION = 1
+
+# Least-recently-used pages dropped per eviction query
+EVICTION_BATCH = 64
+
+
+@dataclass
+class CachedPage:
+    """An extracted page read back from the cache."""
+    url: str
+    raw_content: str
+    title: str
+    image_urls: List[Dict[str, Any]] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    fresh: bool = True
+
+    def to_page(self) -> Dict[str, Any]:
+        """The page in the shape returned by `Scraper.extract_data_from_url`."""
+        return {
+            "url": self.url,
+            "raw_content": self.raw_content,
+            "image_urls": list(self.image_urls),
+            "title": self.title,
+        }
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=3).compress(data)
+    return "zlib", zlib.compress(data, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class PageCache:
+    """
+    Singleton SQLite-backed cache of extracted pages.
+
+    Only pages that produced usable content are stored; failures are always retried.
+    """
+
+    _instance: ClassVar['PageCache'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the cache (only once)."""
+        if self._initialized:
+            return
+
+        self.enabled = True
+        self.ttl = 86400
+        self.max_bytes = 256 * 1024 * 1024
+        self.db_path: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats: Dict[str, int] = {"hits": 0, "stale": 0, "misses": 0, "revalidated": 0}
+        self._initialized = True
+
+    def configure(
+        self,
+        enabled: bool = True,
+        ttl: int = 86400,
+        max_bytes: int = 256 * 1024 * 1024,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    ):
+        """
+        Configure the cache.
+
+        Args:
+            enabled: Whether lookups and stores are performed at all
+            ttl: Seconds a page is served without revalidation
+            max_bytes: Upper bound on the total size of compressed pages
+            cache_dir: Directory for the SQLite database
+        """
+        with self._lock:
+            self.enabled = enabled and bool(cache_dir)
+            self.ttl = ttl
+            self.max_bytes = max_bytes
+
+            db_path = os.path.join(cache_dir, "page_cache.sqlite") if cache_dir else None
+            if db_path != self.db_path:
+                self._close()
+                self.db_path = db_path
+
+    @staticmethod
+    def make_key(url: str, scraper_name: str) -> str:
+        """Build the cache key from the canonical url and the scraper that extracted it."""
+        payload = json.dumps([canonicalize_url(url), scraper_name])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_conn(self) -> Optional[sqlite3.Connection]:
+        if self.db_path is None:
+            return None
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pages ("
+                    "key TEXT PRIMARY KEY, url TEXT, content_hash TEXT, etag TEXT, last_modified TEXT, "
+                    "extraction_version INTEGER, fetched_at REAL, accessed_at REAL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS blobs ("
+                    "content_hash TEXT PRIMARY KEY, codec TEXT, data BLOB, size INTEGER)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS pages_content ON pages (content_hash)")
+                # Total blob size, kept current by triggers so every process sees the same figure
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta (name, value) "
+                    "SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM blobs"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS blobs_added AFTER INSERT ON blobs BEGIN "
+                    "UPDATE meta SET value = value + NEW.size WHERE name = 'total_bytes'; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS blobs_removed AFTER DELETE ON blobs BEGIN "
+                    "UPDATE meta SET value = value - OLD.size WHERE name = 'total_bytes'; END"
+                )
+                conn.commit()
+                self._conn = conn
+            except sqlite3.Error as e:
+                logger.warning(f"Page cache unavailable ({self.db_path}): {e}")
+                self.db_path = None
+                return None
+        return self._conn
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def get(self, url: str, scraper_name: str) -> Optional[CachedPage]:
+        """
+        Return the cached page, or None on a miss.
+
+        Entries older than the TTL are returned with ``fresh=False`` so the caller can
+        revalidate them; entries from an older extraction version are misses.
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(url, scraper_name)
+        now = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT p.etag, p.last_modified, p.extraction_version, p.fetched_at, b.codec, b.data "
+                    "FROM pages p JOIN blobs b ON b.content_hash = p.content_hash WHERE p.key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or row[2] != EXTRACTION_VERSION:
+                    self._stats["misses"] += 1
+                    return None
+                with conn:
+                    conn.execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (now, key))
+                payload = json.loads(_decompress(row[4], row[5]))
+            except (sqlite3.Error, ValueError, zlib.error) as e:
+                logger.debug(f"Page cache read failed for {url}: {e}")
+                self._stats["misses"] += 1
+                return None
+
+            fresh = row[3] + self.ttl > now
+            self._stats["hits" if fresh else "stale"] += 1
+            return CachedPage(
+                url=url,
+                raw_content=payload["raw_content"],
+                title=payload.get("title") or "",
+                image_urls=payload.get("image_urls") or [],
+                etag=row[0],
+                last_modified=row[1],
+                fetched_at=row[3],
+                fresh=fresh,
+            )
+
+    def set(
+        self,
+        url: str,
+        scraper_name: str,
+        page: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        status: Optional[int] = None,
+    ) -> None:
+        """
+        Store an extracted page along with the response's validators.
+
+        Pages of a response with a non-2xx ``status`` are not stored; None is for scrapers
+        that can't report one (browsers, document loaders).
+        """
+        if not self.enabled or not page.get("raw_content"):
+            return
+        if status is not None and not 200 <= status < 300:
+            return
+
+        data = json.dumps(
+            {
+                "raw_content": page["raw_content"],
+                "title": page.get("title") or "",
+                "image_urls": page.get("image_urls") or [],
+            },
+            default=str,
+        ).encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        codec, blob = _compress(data)
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        now = time.time()
+
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return
+            key = self.make_key(url, scraper_name)
+            try:
+                with conn:
+                    previous = conn.execute("SELECT content_hash FROM pages WHERE key = ?", (key,)).fetchone()
+                    added = conn.execute(
+                        "INSERT OR IGNORE INTO blobs (content_hash, codec, data, size) VALUES (?, ?, ?, ?)",
+                        (content_hash, codec, blob, len(blob)),
+                    ).rowcount
+                    conn.execute(
+                        "INSERT OR REPLACE INTO pages (key, url, content_hash, etag, last_modified, "
+                        "extraction_version, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            key,
+                            url,
+                            content_hash,
+                            headers.get("etag"),
+                            headers.get("last-modified"),
+                            EXTRACTION_VERSION,
+                            now,
+                            now,
+                        ),
+                    )
+                    if previous is not None and previous[0] != content_hash:
+                        self._drop_orphans(conn, [previous[0]])
+                    if added:
+                        self._evict(conn)
+            except sqlite3.Error as e:
+                logger.debug(f"Page cache write failed for {url}: {e}")
+
+    def touch(self, url: str, scraper_name: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                        (now, now, self.make_key(url, scraper_name)),
+                    )
+                self._stats["revalidated"] += 1
+            except sqlite3.Error as e:
+                logger.debug(f"Page cache update failed for {url}: {e}")
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _drop_orphans(conn: sqlite3.Connection, content_hashes: List[str]) -> None:
+        """Delete the blobs among ``content_hashes`` that no page points at any more."""
+        conn.executemany(
+            "DELETE FROM blobs WHERE content_hash = ? "
+            "AND NOT EXISTS (SELECT 1 FROM pages WHERE content_hash = blobs.content_hash)",
+            [(content_hash,) for content_hash in set(content_hashes)],
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used pages while the blobs are over ``max_bytes``."""
+        while self._total_bytes(conn) > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, content_hash FROM pages ORDER BY accessed_at LIMIT ?", (EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            # Only evict as many of the batch as needed to get back under the limit
+            sizes = dict(conn.execute(
+                f"SELECT content_hash, size FROM blobs WHERE content_hash IN ({','.join('?' * len(rows))})",
+                [content_hash for _, content_hash in rows],
+            ).fetchall())
+            excess = self._total_bytes(conn) - self.max_bytes
+            evicted = []
+            for key, content_hash in rows:
+                evicted.append((key, content_hash))
+                excess -= sizes.pop(content_hash, 0)
+                if excess <= 0:
+                    break
+            conn.executemany("DELETE FROM pages WHERE key = ?", [(key,) for key, _ in evicted])
+            self._drop_orphans(conn, [content_hash for _, content_hash in evicted])
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters."""
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        """Drop every cached page and reset the counters."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+            conn = self._get_conn()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM pages")
+                    conn.execute("DELETE FROM blobs")
+
+
+# Singleton instance
+_page_cache = PageCache()
+
+
+def get_page_cache(cfg=None) -> PageCache:
+    """Get the page cache singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _page_cache.configure(
+            enabled=getattr(cfg, "page_cache_enabled", True),
+            ttl=getattr(cfg, "page_cache_ttl", 86400),
+            max_bytes=getattr(cfg, "page_cache_max_bytes", 256 * 1024 * 1024),
+            cache_dir=getattr(cfg, "cache_dir", DEFAULT_CACHE_DIR),
+        )
+    return _page_cache
@@ -1,8 +1,9 @@
-import os
+import functools
 import requests
-import tempfile
 from urllib.parse import urlparse
-from langchain_community.document_loaders import PyMuPDFLoader
+
+from arivara_researcher.utils.pdf_ingest import extract_pdf_page, extract_pdf_text, get_pdf_ingestor
+from ..http_client import FetchResult
 
 
 class PyMuPDFScraper:
@@ -17,6 +18,7 @@ class PyMuPDFScraper:
         """
         self.link = link
         self.session = session
+        self.max_chars = get_pdf_ingestor().max_chars
 
     def is_url(self) -> bool:
         """
@@ -33,34 +35,19 @@ class PyMuPDFScraper:
 
     def scrape(self) -> tuple[str, list[str], str]:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from the provided link (either URL or local file)
-        and returns the document as a string.
+        The `scrape` function downloads the PDF from the provided link (either URL or local file) into
+        memory and extracts its text page by page up to the configured character budget.
 
         Returns:
-          str: A string representation of the loaded document.
+          tuple: The extracted text, an empty image list and the document title.
         """
         try:
             if self.is_url():
-                response = requests.get(self.link, timeout=5, stream=True)
-                response.raise_for_status()
-
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-                    temp_filename = temp_file.name  # Get the temporary file name
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)  # Write the downloaded content to the temporary file
-
-                loader = PyMuPDFLoader(temp_filename)
-                doc = loader.load()
-
-                os.remove(temp_filename)
+                source = get_pdf_ingestor().download(self.link, session=self.session)
             else:
-                loader = PyMuPDFLoader(self.link)
-                doc = loader.load()
-
-            # Extract the content, image (if any), and title from the document.
-            image = []
-            # Retrieve the content of the first page to minimize embedding costs.
-            return doc[0].page_content, image, doc[0].metadata["title"]
+                source = self.link
+            result = extract_pdf_text(source, max_chars=self.max_chars)
+            return result.text, [], result.title
 
         except requests.exceptions.Timeout:
             print(f"Download timed out. Please check the link : {self.link}")
@@ -68,3 +55,29 @@ class PyMuPDFScraper:
         except Exception as e:
             print(f"Error loading PDF : {self.link} {e}")
             return "", [], ""
+
+    async def fetch_async(self, headers=None) -> FetchResult:
+        """
+        Downloads the PDF with the shared async HTTP client and the PDF byte cap. Network errors
+        propagate to the caller.
+
+        Args:
+          headers: Extra request headers, e.g. conditional-request validators
+        """
+        request_headers = dict(self.session.headers) if self.session is not None else {}
+        request_headers.update(headers or {})
+        return await get_pdf_ingestor().fetch(self.link, headers=request_headers)
+
+    def parse(self, result: FetchResult) -> tuple:
+        """
+        Extracts (content, image_urls, title) from a downloaded PDF.
+        """
+        return self.extract(result.body, result.encoding, self.link)
+
+    @property
+    def extract(self):
+        """
+        Picklable ``(body, encoding, url) -> (content, image_urls, title)`` callable bound to
+        this scraper's character budget, for running in a worker process.
+        """
+        return functools.partial(extract_pdf_page, max_chars=self.max_chars)
@@ -1,4 +1,6 @@
 import asyncio
+import math
+from collections import OrderedDict
 from colorama import Fore, init
 
 import requests
@@ -6,53 +8,162 @@ import subprocess
 import sys
 import importlib
 import logging
+from urllib.parse import urlparse
 
+from arivara_researcher.utils.rate_limiter import get_rate_limit_registry
 from arivara_researcher.utils.workers import WorkerPool
+from .page_cache import get_page_cache
+from .utils import looks_js_rendered
 
 from . import (
     ArxivScraper,
     BeautifulSoupScraper,
     PyMuPDFScraper,
     WebBaseLoaderScraper,
+    LxmlScraper,
     BrowserScraper,
     NoDriverScraper,
     TavilyExtract,
     FireCrawl,
 )
 
+SCRAPER_CLASSES = {
+    "pdf": PyMuPDFScraper,
+    "arxiv": ArxivScraper,
+    "bs": BeautifulSoupScraper,
+    "web_base_loader": WebBaseLoaderScraper,
+    "lxml": LxmlScraper,
+    "browser": BrowserScraper,
+    "nodriver": NoDriverScraper,
+    "tavily_extract": TavilyExtract,
+    "firecrawl": FireCrawl,
+}
+
+# Scrapers backed by a hosted API; their requests are rate limited per provider rather than per host
+API_SCRAPERS = {TavilyExtract: "tavily_extract", FireCrawl: "firecrawl"}
+
+# Tier that last produced usable content for each domain in tiered mode
+MAX_REMEMBERED_DOMAINS = 10000
+_domain_tiers: "OrderedDict[str, type]" = OrderedDict()
+
+# Stragglers left running by the "background" policy; held here so they aren't garbage collected
+_background_scrapes: set[asyncio.Task] = set()
+
 
 class Scraper:
     """
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper, worker_pool: WorkerPool):
+    def __init__(
+        self,
+        urls,
+        user_agent,
+        scraper,
+        worker_pool: WorkerPool,
+        min_pages: int = 0,
+        completion_ratio: float = 1.0,
+        deadline: float = 0.0,
+        straggler_policy: str = "cancel",
+        tiers: list[str] | None = None,
+        tier_min_content: int = 500,
+    ):
         """
         Initialize the Scraper class.
         Args:
-            urls:
+            urls: List of urls to scrape
+            user_agent: User agent sent with requests
+            scraper: Default scraper key (e.g. "bs", "browser"), or "tiered" to escalate through `tiers`
+            worker_pool: Worker pool used for concurrency and rate limiting
+            min_pages: Stop waiting once this many pages scraped successfully (0 = wait for all)
+            completion_ratio: Stop waiting once this fraction of urls finished, success or not
+            deadline: Stop waiting after this many seconds (0 = no deadline)
+            straggler_policy: "cancel" unfinished scrapes on cutoff, or let them finish in the "background"
+            tiers: Scraper keys tried in order in tiered mode, cheapest first (e.g. ["lxml", "nodriver"])
+            tier_min_content: In tiered mode, pages with less text than this are escalated to the next tier
         """
         self.urls = urls
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
         self.scraper = scraper
-        if self.scraper == "tavily_extract":
-            self._check_pkg(self.scraper)
-        if self.scraper == "firecrawl":
-            self._check_pkg(self.scraper)
+        self.tiers = list(tiers or ["lxml", "nodriver"])
+        self.tier_min_content = tier_min_content
+        if self.scraper == "tiered":
+            unknown = [key for key in self.tiers if key not in SCRAPER_CLASSES]
+            if unknown:
+                raise Exception(f"Scraper not found: {', '.join(unknown)}")
+        for key in (self.tiers if self.scraper == "tiered" else [self.scraper]):
+            if key in ("tavily_extract", "firecrawl"):
+                self._check_pkg(key)
         self.logger = logging.getLogger(__name__)
         self.worker_pool = worker_pool
+        self.min_pages = min_pages
+        self.completion_ratio = completion_ratio
+        self.deadline = deadline
+        if straggler_policy not in ("cancel", "background"):
+            raise ValueError(f"Unknown straggler policy: {straggler_policy}")
+        self.straggler_policy = straggler_policy
 
     async def run(self):
         """
         Extracts the content from the links
         """
-        contents = await asyncio.gather(
-            *(self.extract_data_from_url(url, self.session) for url in self.urls)
-        )
+        return [content async for content in self.stream()]
 
-        res = [content for content in contents if content["raw_content"] is not None]
-        return res
+    async def stream(self):
+        """
+        Extracts the content from the links, yielding each page as soon as its scrape finishes.
+
+        Stops early once the completion policy is met (min_pages successes, completion_ratio
+        of urls finished, or the deadline passed). Unfinished scrapes are then cancelled or,
+        with the "background" policy, left running so their results still warm any caches.
+        """
+        tasks = [
+            asyncio.create_task(self.extract_data_from_url(url, self.session))
+            for url in self.urls
+        ]
+        pending = set(tasks)
+        required = math.ceil(len(tasks) * self.completion_ratio) if self.completion_ratio < 1 else len(tasks)
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + self.deadline if self.deadline and self.deadline > 0 else None
+        finished = succeeded = 0
+        cutoff = False
+        try:
+            while pending:
+                timeout = None if deadline_at is None else max(0.0, deadline_at - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.logger.info(
+                        f"Scrape deadline of {self.deadline}s reached with {len(pending)} url(s) pending"
+                    )
+                    cutoff = True
+                    break
+                for task in done:
+                    finished += 1
+                    content = task.result()
+                    if content["raw_content"] is not None:
+                        succeeded += 1
+                        yield content
+                if pending and (
+                    (self.min_pages and succeeded >= self.min_pages) or finished >= required
+                ):
+                    self.logger.info(
+                        f"Scrape quorum met ({succeeded} pages, {finished}/{len(tasks)} urls finished), "
+                        f"{len(pending)} url(s) pending"
+                    )
+                    cutoff = True
+                    break
+        finally:
+            if cutoff and self.straggler_policy == "background":
+                for task in pending:
+                    _background_scrapes.add(task)
+                    task.add_done_callback(_background_scrapes.discard)
+            else:
+                # Cutoff with the cancel policy, or the consumer stopped early
+                for task in pending:
+                    task.cancel()
 
     def _check_pkg(self, scrapper_name: str) -> None:
         """
@@ -89,20 +200,91 @@ class Scraper:
 
     async def extract_data_from_url(self, link, session):
         """
-        Extracts the data from the link with logging
+        Extracts the data from the link with logging.
+
+        In tiered mode the link is tried with each scraper tier in turn, starting from the
+        tier last chosen for its domain, and only escalated when the cheaper tier returned
+        content that looks empty or JavaScript-rendered.
         """
-        async with self.worker_pool.throttle():
-            try:
-                Scraper = self.get_scraper(link)
-                scraper = Scraper(link, session)
+        tiers = self.get_scraper_tiers(link)
+        tiered = len(tiers) > 1
+        best = None
+        for position, scraper_class in enumerate(tiers):
+            page, needs_escalation = await self._extract_with(scraper_class, link, session, tiered)
+            if page["raw_content"] is not None and not needs_escalation:
+                if tiered:
+                    self._remember_tier(link, scraper_class)
+                return page
+            if page["raw_content"] is not None and (
+                best is None or len(page["raw_content"]) > len(best["raw_content"])
+            ):
+                best = page
+            if position + 1 < len(tiers):
+                self.logger.info(
+                    f"Escalating {link} from {scraper_class.__name__} to {tiers[position + 1].__name__}"
+                )
+        return best or page
+
+    async def _extract_with(self, scraper_class, link, session, detect_js: bool = False):
+        """
+        Extracts the data from the link with one scraper class.
+
+        Fresh page cache hits return without touching the network or the rate limiter;
+        stale entries are revalidated with a conditional GET when the scraper supports it.
+
+        Returns:
+            tuple[dict, bool]: The page, and whether it looks like it needs a browser to render
+        """
+        scraper_name = scraper_class.__name__
+        page_cache = get_page_cache()
+        cached = None
+        try:
+            cached = await asyncio.to_thread(page_cache.get, link, scraper_name)
+        except Exception as e:
+            self.logger.debug(f"Page cache lookup failed for {link}: {e}")
+        if cached is not None and cached.fresh:
+            self.logger.info(f"Page cache hit for {link}")
+            return cached.to_page(), False
 
-                # Get scraper name
-                scraper_name = scraper.__class__.__name__
+        rate_limit_key = self.rate_limit_key(link, scraper_class)
+        async with self.worker_pool.throttle(rate_limit_key):
+            try:
+                scraper = scraper_class(link, session)
                 self.logger.info(f"\n=== Using {scraper_name} ===")
 
                 # Get content
+                html = None
+                response_headers = None
+                # HTTP status of the page; browser and document scrapers can't report one
+                status = None
                 if hasattr(scraper, "scrape_async"):
                     content, image_urls, title = await scraper.scrape_async()
+                elif hasattr(scraper, "fetch_async"):
+                    # Network I/O stays on the event loop; only extraction goes to a worker
+                    fetched = await scraper.fetch_async(
+                        headers=cached.validators() if cached is not None else None
+                    )
+                    get_rate_limit_registry().report(
+                        rate_limit_key, fetched.status, fetched.headers.get("Retry-After")
+                    )
+                    if fetched.status == 304 and cached is not None:
+                        self.logger.info(f"Page not modified, using cached copy of {link}")
+                        await asyncio.to_thread(page_cache.touch, link, scraper_name)
+                        return cached.to_page(), False
+                    status = fetched.status
+                    html = fetched.body
+                    response_headers = fetched.headers
+                    (
+                        content,
+                        image_urls,
+                        title,
+                    ) = await asyncio.get_running_loop().run_in_executor(
+                        self.worker_pool.parse_executor,
+                        scraper.extract,
+                        fetched.body,
+                        fetched.encoding,
+                        link,
+                    )
                 else:
                     (
                         content,
@@ -112,14 +294,31 @@ class Scraper:
                         self.worker_pool.executor, scraper.scrape
                     )
 
-                if len(content) < 100:
+                # API scrapers swallow their errors but keep the status they got
+                if getattr(scraper, "status", None) is not None:
+                    status = scraper.status
+                    get_rate_limit_registry().report(
+                        rate_limit_key, scraper.status, getattr(scraper, "retry_after", None)
+                    )
+
+                # Error pages (403 challenges, 404s, 429s, 5xx) are not content
+                if status is not None and not 200 <= status < 300:
+                    self.logger.warning(f"{scraper_name} got HTTP {status} for {link}")
+                    return {
+                        "url": link,
+                        "raw_content": None,
+                        "image_urls": [],
+                        "title": "",
+                    }, True
+
+                if not content or len(content) < 100:
                     self.logger.warning(f"Content too short or empty for {link}")
                     return {
                         "url": link,
                         "raw_content": None,
                         "image_urls": [],
                         "title": title,
-                    }
+                    }, True
 
                 # Log results
                 self.logger.info(f"\nTitle: {title}")
@@ -130,25 +329,67 @@ class Scraper:
                 self.logger.info(f"URL: {link}")
                 self.logger.info("=" * 50)
 
-                if not content or len(content) < 100:
-                    self.logger.warning(f"Content too short or empty for {link}")
-                    return {
-                        "url": link,
-                        "raw_content": None,
-                        "image_urls": [],
-                        "title": title,
-                    }
-
-                return {
+                page = {
                     "url": link,
                     "raw_content": content,
                     "image_urls": image_urls,
                     "title": title,
                 }
+                if detect_js and looks_js_rendered(html, content, self.tier_min_content):
+                    self.logger.info(f"Content of {link} looks JavaScript-rendered")
+                    return page, True
+
+                await asyncio.to_thread(page_cache.set, link, scraper_name, page, response_headers, status)
+                return page, False
 
             except Exception as e:
                 self.logger.error(f"Error processing {link}: {str(e)}")
-                return {"url": link, "raw_content": None, "image_urls": [], "title": ""}
+                return {"url": link, "raw_content": None, "image_urls": [], "title": ""}, True
+
+    def rate_limit_key(self, link, scraper_class=None) -> str:
+        """
+        The rate limit bucket a request for ``link`` counts against: the API provider for
+        hosted scrapers (e.g. "firecrawl"), otherwise the link's host.
+        """
+        scraper_class = scraper_class or self.get_scraper(link)
+        if scraper_class in API_SCRAPERS:
+            return API_SCRAPERS[scraper_class]
+        return urlparse(link).netloc.lower()
+
+    def get_scraper_tiers(self, link) -> list:
+        """
+        The scraper classes to try for ``link``, in order.
+
+        Outside tiered mode this is just `get_scraper(link)`. In tiered mode it is the
+        configured tiers, starting from the one last remembered for the link's domain.
+        """
+        document_key = self._document_scraper_key(link)
+        if document_key is not None:
+            # PDFs and arXiv papers have dedicated scrapers and never escalate to a browser
+            return [SCRAPER_CLASSES[document_key]]
+        if self.scraper != "tiered":
+            return [self.get_scraper(link)]
+        tiers = [SCRAPER_CLASSES[key] for key in self.tiers]
+        remembered = _domain_tiers.get(urlparse(link).netloc.lower())
+        if remembered in tiers:
+            tiers = tiers[tiers.index(remembered):]
+        return tiers
+
+    def _remember_tier(self, link, scraper_class):
+        domain = urlparse(link).netloc.lower()
+        _domain_tiers[domain] = scraper_class
+        _domain_tiers.move_to_end(domain)
+        while len(_domain_tiers) > MAX_REMEMBERED_DOMAINS:
+            _domain_tiers.popitem(last=False)
+
+    @staticmethod
+    def _document_scraper_key(link) -> str | None:
+        """The dedicated scraper for PDFs and arXiv links, whatever the configured scraper."""
+        if link.endswith(".pdf"):
+            return "pdf"
+        if "arxiv.org" in link:
+            return "arxiv"
+        return None
 
     def get_scraper(self, link):
         """
@@ -165,26 +406,14 @@ class Scraper:
         checks the link to determine the appropriate scraper class to use based on predefined mappings
         in the `SCRAPER_CLASSES` dictionary. If the link ends with ".pdf", it selects the
         `PyMuPDFScraper` class. If the link contains "arxiv.org", it selects the `ArxivScraper
+        class. In tiered mode it returns the first tier to try for the link's domain.
         """
+        scraper_key = self._document_scraper_key(link)
 
-        SCRAPER_CLASSES = {
-            "pdf": PyMuPDFScraper,
-            "arxiv": ArxivScraper,
-            "bs": BeautifulSoupScraper,
-            "web_base_loader": WebBaseLoaderScraper,
-            "browser": BrowserScraper,
-            "nodriver": NoDriverScraper,
-            "tavily_extract": TavilyExtract,
-            "firecrawl": FireCrawl,
-        }
-
-        scraper_key = None
+        if scraper_key is None and self.scraper == "tiered":
+            return self.get_scraper_tiers(link)[0]
 
-        if link.endswith(".pdf"):
-            scraper_key = "pdf"
-        elif "arxiv.org" in link:
-            scraper_key = "arxiv"
-        else:
+        if scraper_key is None:
             scraper_key = self.scraper
 
         scraper_class = SCRAPER_CLASSES.get(scraper_key)
@@ -0,0 +1,69 @@
+"""
+Single-flight registry of in-flight scrapes.
+
+Concurrent sub-queries and nested researchers often find the same page. The first
+requester of a url claims it and scrapes it; everyone else asking for the same canonical
+url while that scrape is running awaits its result instead of fetching the page again.
+Entries are dropped as soon as the scrape finishes; later requests are served by the
+page cache.
+"""
+import asyncio
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from arivara_researcher.utils.urls import canonicalize_url
+
+
+class InFlightScrapes:
+    """Futures of the scrapes currently running, keyed by canonical url."""
+
+    def __init__(self):
+        self._futures: Dict[str, asyncio.Future] = {}
+        self.stats: Dict[str, int] = {"claimed": 0, "joined": 0}
+
+    def claim(self, urls: List[str]) -> Tuple[List[str], List[asyncio.Future]]:
+        """
+        Split ``urls`` into the ones the caller must scrape and futures of the ones
+        already being scraped by someone else.
+
+        The caller must `resolve` every url it was handed (or `release` them), otherwise
+        whoever joined those scrapes waits forever.
+        """
+        loop = asyncio.get_running_loop()
+        owned, joined = [], []
+        for url in urls:
+            key = canonicalize_url(url)
+            future = self._futures.get(key)
+            if future is not None and not future.done():
+                joined.append(future)
+                self.stats["joined"] += 1
+            else:
+                self._futures[key] = loop.create_future()
+                owned.append(url)
+                self.stats["claimed"] += 1
+        return owned, joined
+
+    def resolve(self, url: str, page: Optional[Dict[str, Any]]):
+        """Publish the result of a claimed scrape (None if it produced nothing)."""
+        future = self._futures.pop(canonicalize_url(url), None)
+        if future is not None and not future.done():
+            future.set_result(page)
+
+    def release(self, urls: List[str]):
+        """Resolve claimed urls that produced no page, e.g. after a failure or a deadline."""
+        for url in urls:
+            self.resolve(url, None)
+
+
+_process_registries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, InFlightScrapes]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_process_inflight_scrapes() -> InFlightScrapes:
+    """The registry shared by every researcher on the running event loop."""
+    loop = asyncio.get_running_loop()
+    registry = _process_registries.get(loop)
+    if registry is None:
+        registry = _process_registries[loop] = InFlightScrapes()
+    return registry
@@ -1,12 +1,15 @@
 from bs4 import BeautifulSoup
 import os
-from ..utils import get_relevant_images, extract_title
+from ..utils import api_error_status, get_relevant_images, extract_title
 
 class TavilyExtract:
 
     def __init__(self, link, session=None):
         self.link = link
         self.session = session
+        # Outcome of the API call, reported to the provider's rate limit bucket
+        self.status = None
+        self.retry_after = None
         from tavily import TavilyClient
         self.tavily_client = TavilyClient(api_key=self.get_api_key())
 
@@ -37,6 +40,7 @@ class TavilyExtract:
 
         try:
             response = self.tavily_client.extract(urls=self.link)
+            self.status = 200
             if response['failed_results']:
                 return "", [], ""
 
@@ -58,5 +62,8 @@ class TavilyExtract:
             return content, image_urls, title
 
         except Exception as e:
+            if self.status is None:
+                # The API call itself failed (not the follow-up page fetch)
+                self.status, self.retry_after = api_error_status(e)
             print("Error! : " + str(e))
             return "", [], ""
@@ -16,25 +16,9 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         for img in all_images:
             img_src = urljoin(url, img['src'])
             if img_src.startswith(('http://', 'https://')):
-                score = 0
-                # Check for relevant classes
-                if any(cls in img.get('class', []) for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
-                    score = 4  # Higher score
-                # Check for size attributes
-                elif img.get('width') and img.get('height'):
-                    width = parse_dimension(img['width'])
-                    height = parse_dimension(img['height'])
-                    if width and height:
-                        if width >= 2000 and height >= 1000:
-                            score = 3  # Medium score (very large images)
-                        elif width >= 1600 or height >= 800:
-                            score = 2  # Lower score
-                        elif width >= 800 or height >= 500:
-                            score = 1  # Lowest score
-                        elif width >= 500 or height >= 300:
-                            score = 0  # Lowest score
-                        else:
-                            continue  # Skip small images
+                score = score_image(img.get('class', []), img.get('width'), img.get('height'))
+                if score is None:
+                    continue  # Skip small images
                 
                 image_urls.append({'url': img_src, 'score': score})
         
@@ -47,6 +31,28 @@ def get_relevant_images(soup: BeautifulSoup, url: str) -> list:
         logging.error(f"Error in get_relevant_images: {e}")
         return []
 
+def score_image(classes: list, width: str | None, height: str | None) -> int | None:
+    """Score an image by its classes and size attributes; None means it is too small to keep"""
+    # Check for relevant classes
+    if any(cls in classes for cls in ['header', 'featured', 'hero', 'thumbnail', 'main', 'content']):
+        return 4  # Higher score
+    # Check for size attributes
+    if width and height:
+        width = parse_dimension(width)
+        height = parse_dimension(height)
+        if width and height:
+            if width >= 2000 and height >= 1000:
+                return 3  # Medium score (very large images)
+            elif width >= 1600 or height >= 800:
+                return 2  # Lower score
+            elif width >= 800 or height >= 500:
+                return 1  # Lowest score
+            elif width >= 500 or height >= 300:
+                return 0  # Lowest score
+            else:
+                return None  # Skip small images
+    return 0
+
 def parse_dimension(value: str) -> int:
     """Parse dimension value, handling px units"""
     if value.lower().endswith('px'):
@@ -122,3 +128,37 @@ def get_text_from_soup(soup: BeautifulSoup) -> str:
     # Remove excess whitespace
     text = re.sub(r"\s{2,}", " ", text)
     return text
+
+
+# Empty mount points of client-side rendered apps (React, Vue, Next.js, Nuxt, Svelte)
+_JS_APP_ROOT_RE = re.compile(
+    rb"<div[^>]+id=[\"'](?:root|app|__next|__nuxt|svelte)[\"'][^>]*>\s*</div>", re.IGNORECASE
+)
+_JS_REQUIRED_RE = re.compile(rb"(?:enable|requires?|turn on)\s+javascript", re.IGNORECASE)
+
+
+def looks_js_rendered(html: bytes | None, content: str, min_chars: int = 500) -> bool:
+    """Guess whether a page needs a browser to render its content"""
+    if not content or len(content) < min_chars:
+        return True
+    if not html or len(content) >= 2000:
+        return False
+    return bool(_JS_APP_ROOT_RE.search(html) or _JS_REQUIRED_RE.search(html))
+
+
+_RATE_LIMIT_MARKERS = ("429", "rate limit", "rate_limit", "too many requests")
+
+
+def api_error_status(error: Exception) -> tuple[int | None, str | None]:
+    """
+    The HTTP status and Retry-After header behind an API client's exception, when known.
+    Clients that only describe a rate limit in the message are reported as 429.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+    retry_after = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if not isinstance(status, int):
+        message = str(error).lower()
+        status = 429 if any(marker in message for marker in _RATE_LIMIT_MARKERS) else None
+    return status, retry_after
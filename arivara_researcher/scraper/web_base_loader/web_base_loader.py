@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import requests
+from ..http_client import FetchResult, get_http_client
 from ..utils import get_relevant_images, extract_title
 
 class WebBaseLoaderScraper:
@@ -41,3 +42,48 @@ class WebBaseLoaderScraper:
         except Exception as e:
             print("Error! : " + str(e))
             return "", [], ""
+
+    async def fetch_async(self, headers=None) -> FetchResult:
+        """
+        Fetches the webpage once with the shared async HTTP client. Certificate checks are
+        skipped to match the `WebBaseLoader` request settings used by `scrape`.
+
+        Args:
+          headers: Extra request headers, e.g. conditional-request validators
+        """
+        request_headers = dict(self.session.headers)
+        request_headers.update(headers or {})
+        return await get_http_client().fetch(
+            self.link, headers=request_headers, verify_ssl=False
+        )
+
+    def parse(self, result: FetchResult) -> tuple:
+        """
+        Parses a fetched page into (content, image_urls, title), extracting the text the same
+        way `WebBaseLoader` does so the page doesn't have to be downloaded twice.
+        """
+        return self.extract(result.body, result.encoding, self.link)
+
+    @staticmethod
+    def extract(body: bytes, encoding, url: str) -> tuple:
+        """
+        Picklable form of `parse` for running in a worker process.
+        """
+        return extract_page(body, encoding, url)
+
+
+def extract_page(body: bytes, encoding, url: str) -> tuple:
+    """
+    Extracts (content, image_urls, title) from raw HTML bytes the way `WebBaseLoader` does.
+    """
+    try:
+        soup = BeautifulSoup(body, 'html.parser', from_encoding=encoding)
+        image_urls = get_relevant_images(soup, url)
+        title = extract_title(soup)
+        content = soup.get_text()
+
+        return content, image_urls, str(title) if title else ""
+
+    except Exception as e:
+        print("Error! : " + str(e))
+        return "", [], ""
@@ -1,9 +1,16 @@
+import asyncio
+from contextlib import aclosing
+
 from arivara_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
-from ..actions.web_scraping import scrape_urls
+from ..context.dedup import NearDuplicateFilter
+from ..actions.web_scraping import scrape_urls, scrape_urls_stream
+from ..scraper.single_flight import get_process_inflight_scrapes
 from ..scraper.utils import get_image_hash
 
+_DONE = object()
+
 
 class BrowserManager:
     """Manages context for the researcher agent."""
@@ -12,9 +19,23 @@ class BrowserManager:
         self.researcher = researcher
         self.worker_pool = WorkerPool(
             researcher.cfg.max_scraper_workers,
-            rate_limit_delay=researcher.cfg.scraper_rate_limit_delay
+            rate_limit_delay=researcher.cfg.scraper_rate_limit_delay,
+            parse_executor=researcher.cfg.scraper_parse_executor,
+            parse_workers=researcher.cfg.scraper_parse_workers,
+            rate_limits=researcher.cfg.rate_limits,
         )
 
+    def _new_duplicate_filter(self) -> NearDuplicateFilter | None:
+        """
+        A near-duplicate filter for one sub-query's pages.
+
+        Scoped to a single browse call: a page kept for an earlier sub-query must not
+        drop its mirror from a later one, whose context only contains its own pages.
+        """
+        if not self.researcher.cfg.near_duplicate_filter:
+            return None
+        return NearDuplicateFilter(threshold=self.researcher.cfg.near_duplicate_threshold)
+
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
         Scrape content from a list of URLs.
@@ -33,20 +54,29 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
-        )
+        scraped_content, images = await self._scrape_single_flight(urls)
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
+        page_count = len(scraped_content)
+        duplicate_filter = self._new_duplicate_filter()
+        if duplicate_filter is not None:
+            scraped_content = duplicate_filter.filter(scraped_content)
 
         if self.researcher.verbose:
             await stream_output(
                 "logs",
                 "scraping_content",
-                f"📄 Scraped {len(scraped_content)} pages of content",
+                f"📄 Scraped {page_count} pages of content",
                 self.researcher.websocket,
             )
+            if page_count > len(scraped_content):
+                await stream_output(
+                    "logs",
+                    "dropping_duplicates",
+                    f"🧹 Skipped {page_count - len(scraped_content)} near-duplicate pages",
+                    self.researcher.websocket,
+                )
             await stream_output(
                 "logs",
                 "scraping_images",
@@ -64,6 +94,153 @@ class BrowserManager:
 
         return scraped_content
 
+    async def browse_urls_stream(self, urls: list[str]):
+        """
+        Scrape content from a list of URLs, yielding each page as soon as it is scraped.
+
+        Sources are recorded as pages arrive; images are selected once every page is in.
+
+        Args:
+            urls (list[str]): list of URLs to scrape.
+
+        Yields:
+            dict: scraped content of a single page.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "scraping_urls",
+                f"🌐 Scraping content from {len(urls)} URLs...",
+                self.researcher.websocket,
+            )
+
+        images = []
+        page_count = 0
+        duplicate_count = 0
+        duplicate_filter = self._new_duplicate_filter()
+        # aclosing: if our consumer stops early, the scrape is cancelled and its claims released now
+        async with aclosing(self._stream_single_flight(urls)) as pages:
+            async for page in pages:
+                page_count += 1
+                self.researcher.add_research_sources([page])
+                images.extend(page.get("image_urls", []))
+                if duplicate_filter is not None and duplicate_filter.find_duplicate(page) is not None:
+                    duplicate_count += 1
+                    continue
+                yield page
+
+        new_images = self.select_top_images(images, k=4)  # Select top 4 images
+        self.researcher.add_research_images(new_images)
+
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "scraping_content",
+                f"📄 Scraped {page_count} pages of content",
+                self.researcher.websocket,
+            )
+            if duplicate_count:
+                await stream_output(
+                    "logs",
+                    "dropping_duplicates",
+                    f"🧹 Skipped {duplicate_count} near-duplicate pages",
+                    self.researcher.websocket,
+                )
+            await stream_output(
+                "logs",
+                "scraping_images",
+                f"🖼️ Selected {len(new_images)} new images from {len(images)} total images",
+                self.researcher.websocket,
+                True,
+                new_images,
+            )
+            await stream_output(
+                "logs",
+                "scraping_complete",
+                f"🌐 Scraping complete",
+                self.researcher.websocket,
+            )
+
+    def _inflight_scrapes(self):
+        """The in-flight scrape registry this researcher shares, if single-flight is enabled."""
+        if self.researcher.inflight_scrapes is not None:
+            return self.researcher.inflight_scrapes
+        if self.researcher.cfg.scrape_single_flight == "process":
+            return get_process_inflight_scrapes()
+        return None
+
+    async def _scrape_single_flight(self, urls: list[str]) -> tuple[list[dict], list[dict]]:
+        """
+        Scrape the urls nobody else is scraping right now and join the scrapes of the rest.
+        """
+        registry = self._inflight_scrapes()
+        if registry is None:
+            return await scrape_urls(urls, self.researcher.cfg, self.worker_pool)
+
+        owned, joined = registry.claim(urls)
+        scraped_content, images = [], []
+        try:
+            if owned:
+                scraped_content, images = await scrape_urls(owned, self.researcher.cfg, self.worker_pool)
+            for page in scraped_content:
+                registry.resolve(page["url"], page)
+        finally:
+            registry.release(owned)
+
+        # Shielded so a cancelled waiter doesn't cancel the scrape for everyone else
+        for page in await asyncio.gather(*(asyncio.shield(future) for future in joined)):
+            if page:
+                scraped_content.append(page)
+                images.extend(page.get("image_urls", []))
+        return scraped_content, images
+
+    async def _stream_single_flight(self, urls: list[str]):
+        """
+        Streaming form of `_scrape_single_flight`: pages are yielded as soon as either our
+        own scrape or a joined one produces them.
+        """
+        registry = self._inflight_scrapes()
+        if registry is None:
+            async for page in scrape_urls_stream(urls, self.researcher.cfg, self.worker_pool):
+                yield page
+            return
+
+        owned, joined = registry.claim(urls)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def scrape_owned():
+            try:
+                if owned:
+                    async for page in scrape_urls_stream(owned, self.researcher.cfg, self.worker_pool):
+                        registry.resolve(page["url"], page)
+                        await queue.put(page)
+            finally:
+                registry.release(owned)
+                await queue.put(_DONE)
+
+        async def join(future):
+            try:
+                page = await asyncio.shield(future)
+                if page:
+                    await queue.put(page)
+            finally:
+                await queue.put(_DONE)
+
+        tasks = [asyncio.create_task(scrape_owned()), *(asyncio.create_task(join(f)) for f in joined)]
+        try:
+            finished = 0
+            while finished < len(tasks):
+                item = await queue.get()
+                if item is _DONE:
+                    finished += 1
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let the cancelled scrape release its claims before we return
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def select_top_images(self, images: list[dict], k: int = 2) -> list[str]:
         """
         Select most relevant images and remove duplicates based on image content.
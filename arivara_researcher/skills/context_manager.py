@@ -1,7 +1,10 @@
-import asyncio
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional
 
-from ..context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
+from ..context.compression import ContextCompressor, VectorstoreCompressor
+from ..context.pipeline import StreamingContextPipeline
+from ..context.written_sections import WrittenSectionIndex
+from ..utils.costs import estimate_embedding_cost
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
 from ..actions.utils import stream_output
 
 
@@ -24,12 +27,42 @@ class ContextManager:
             documents=pages,
             embeddings=self.researcher.memory.get_embeddings(),
             prompt_family=self.researcher.prompt_family,
+            chunk_store=self.researcher.chunk_store,
             **self.researcher.kwargs
         )
         return await context_compressor.async_get_context(
             query=query, max_results=10, cost_callback=self.researcher.add_costs
         )
 
+    async def get_similar_content_by_query_stream(self, query, page_stream):
+        """
+        Streaming variant of get_similar_content_by_query: pages are chunked and embedded
+        as they arrive from ``page_stream`` instead of after every scrape has finished.
+
+        Returns:
+            tuple[str, list[dict], dict]: the context, the pages consumed and per-stage pipeline stats
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "fetching_query_content",
+                f"📚 Getting relevant content based on query: {query}...",
+                self.researcher.websocket,
+            )
+
+        pipeline = StreamingContextPipeline(
+            embeddings=self.researcher.memory.get_embeddings(),
+            embed_batch_size=self.researcher.cfg.pipeline_embed_batch_size,
+            embed_workers=self.researcher.cfg.pipeline_embed_workers,
+            max_results=10,
+            chunk_store=self.researcher.chunk_store,
+        )
+        relevant_docs = await pipeline.run(query, page_stream)
+        if pipeline.pages:
+            self.researcher.add_costs(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=pipeline.pages))
+        context = self.researcher.prompt_family.pretty_print_docs(relevant_docs, 10)
+        return context, pipeline.pages, pipeline.get_stats()
+
     async def get_similar_content_by_query_with_vectorstore(self, query, filter):
         if self.researcher.verbose:
             await stream_output(
@@ -49,39 +82,39 @@ class ContextManager:
         current_subtopic: str,
         draft_section_titles: List[str],
         written_contents: List[Dict],
-        max_results: int = 10
+        max_results: int = 10,
+        written_index: Optional[WrittenSectionIndex] = None,
     ) -> List[str]:
         all_queries = [current_subtopic] + draft_section_titles
 
-        async def process_query(query: str) -> Set[str]:
-            return set(await self.__get_similar_written_contents_by_query(query, written_contents, **self.researcher.kwargs))
-
-        results = await asyncio.gather(*[process_query(query) for query in all_queries])
-        relevant_contents = set().union(*results)
+        results = await self.__get_similar_written_contents_by_queries(
+            all_queries, written_contents, written_index=written_index, **self.researcher.kwargs
+        )
+        relevant_contents = set().union(*map(set, results))
         relevant_contents = list(relevant_contents)[:max_results]
 
         return relevant_contents
 
-    async def __get_similar_written_contents_by_query(self,
-                                                      query: str,
-                                                      written_contents: List[Dict],
-                                                      similarity_threshold: float = 0.5,
-                                                      max_results: int = 10
-                                                      ) -> List[str]:
+    async def __get_similar_written_contents_by_queries(self,
+                                                        queries: List[str],
+                                                        written_contents: List[Dict],
+                                                        similarity_threshold: float = 0.5,
+                                                        max_results: int = 10,
+                                                        written_index: Optional[WrittenSectionIndex] = None,
+                                                        ) -> List[List[str]]:
         if self.researcher.verbose:
-            await stream_output(
-                "logs",
-                "fetching_relevant_written_content",
-                f"🔎 Getting relevant written content based on query: {query}...",
-                self.researcher.websocket,
-            )
+            for query in queries:
+                await stream_output(
+                    "logs",
+                    "fetching_relevant_written_content",
+                    f"🔎 Getting relevant written content based on query: {query}...",
+                    self.researcher.websocket,
+                )
 
-        written_content_compressor = WrittenContentCompressor(
-            documents=written_contents,
-            embeddings=self.researcher.memory.get_embeddings(),
-            similarity_threshold=similarity_threshold,
-            **self.researcher.kwargs
-        )
-        return await written_content_compressor.async_get_context(
-            query=query, max_results=max_results, cost_callback=self.researcher.add_costs
-        )
+        # Only sections written since the last lookup are embedded
+        if written_index is None:
+            written_index = WrittenSectionIndex(self.researcher.memory.get_embeddings())
+        new_sections = await written_index.sync(written_contents)
+        if new_sections:
+            self.researcher.add_costs(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=new_sections))
+        return await written_index.search(queries, similarity_threshold=similarity_threshold, max_results=max_results)
@@ -78,7 +78,10 @@ class DeepResearchSkill:
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=self.researcher.cfg.reasoning_effort,
             temperature=0.4,
-            token_tracker=token_tracker
+            token_tracker=token_tracker,
+            cache_site="deep_research_search_queries",
+            cache_query=query,
+            fallback=True,
         )
         
         # DEBUG: Log usage (user-requested debug output)
@@ -274,7 +277,9 @@ Format each question on a new line starting with 'Question: '"""}
                         visited_urls=self.visited_urls,
                         # Propagate MCP configuration to nested researchers
                         mcp_configs=self.researcher.mcp_configs,
-                        mcp_strategy=self.researcher.mcp_strategy
+                        mcp_strategy=self.researcher.mcp_strategy,
+                        inflight_scrapes=self.researcher.inflight_scrapes,
+                        chunk_store=self.researcher.chunk_store,
                     )
                     
                     # CRITICAL: Use the parent researcher's token_tracker instead of creating a new one
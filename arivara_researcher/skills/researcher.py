@@ -1,5 +1,4 @@
 import asyncio
-import random
 import logging
 import os
 from ..actions.utils import stream_output
@@ -7,7 +6,11 @@ from ..actions.query_processing import plan_research_outline, get_search_results
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
 from ..utils.enum import ReportSource, ReportType
 from ..utils.logging_config import get_json_handler
+from ..utils.pdf_ingest import get_pdf_ingestor
+from ..utils.urls import canonicalize_url, get_url_canonicalizer
 from ..actions.agent_creator import choose_agent
+from ..retrievers.cache import cached_search
+from ..retrievers.utils import normalize_retriever_name, reciprocal_rank_fusion
 
 
 class ResearchConductor:
@@ -121,6 +124,9 @@ class ResearchConductor:
         if has_mcp_retriever:
             self.logger.info("MCP retrievers configured and will be used with standard research flow")
 
+        get_pdf_ingestor(self.researcher.cfg)
+        get_url_canonicalizer(self.researcher.cfg)
+
         # Conduct research based on the source type
         if self.researcher.source_urls:
             self.logger.info("Using provided source URLs")
@@ -548,14 +554,19 @@ class ResearchConductor:
                     mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
             
             # Get web search context using non-MCP retrievers (if no scraped data provided)
-            if not scraped_data:
-                scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
-                self.logger.info(f"Scraped data size: {len(scraped_data)}")
-
-            # Get similar content based on scraped data
-            if scraped_data:
-                web_context = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
+            if not scraped_data and self.researcher.cfg.streaming_pipeline:
+                # Pages flow into chunking and embedding as each scrape finishes
+                web_context = await self._scrape_and_compress_streaming(sub_query, query_domains)
                 self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
+            else:
+                if not scraped_data:
+                    scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
+                    self.logger.info(f"Scraped data size: {len(scraped_data)}")
+
+                # Get similar content based on scraped data
+                if scraped_data:
+                    web_context = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
+                    self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
 
             # Combine MCP context with web context intelligently
             combined_context = self._combine_mcp_and_web_context(mcp_context, web_context, sub_query)
@@ -762,8 +773,13 @@ class ResearchConductor:
         """
 
         new_urls = []
+        # Compare canonical forms, so tracking params, mirrors and http/https variants of a
+        # page already scraped are skipped; visited_urls keeps the url as found for citations
+        visited = {canonicalize_url(url) for url in self.researcher.visited_urls}
         for url in url_set_input:
-            if url not in self.researcher.visited_urls:
+            canonical_url = canonicalize_url(url)
+            if canonical_url not in visited:
+                visited.add(canonical_url)
                 self.researcher.visited_urls.add(url)
                 new_urls.append(url)
                 if self.researcher.verbose:
@@ -779,38 +795,121 @@ class ResearchConductor:
         return new_urls
 
     async def _search_relevant_source_urls(self, query, query_domains: list | None = None):
-        new_search_urls = []
+        """
+        Searches the query with every configured (non-MCP) retriever concurrently.
+
+        Each retriever runs under its own deadline and may be hedged with a second request
+        when it is slow. Once RETRIEVER_MIN_URLS unique URLs have arrived the remaining
+        retrievers are abandoned. Results are merged with reciprocal-rank fusion.
+
+        Args:
+            query (str): The sub-query to search for.
+            query_domains (list, optional): Domains to restrict the search to.
+
+        Returns:
+            list[str]: New (not yet visited) URLs, best fused rank first.
+        """
         if query_domains is None:
             query_domains = []
 
-        # Iterate through the currently set retrievers
+        # Use the currently set retrievers
         # This allows the method to work when retrievers are temporarily modified
-        for retriever_class in self.researcher.retrievers:
-            # Skip MCP retrievers as they don't provide URLs for scraping
-            if "mcpretriever" in retriever_class.__name__.lower():
-                continue
-                
-            try:
-                # Instantiate the retriever with the sub-query
-                retriever = retriever_class(query, query_domains=query_domains)
+        # Skip MCP retrievers as they don't provide URLs for scraping
+        retrievers = [r for r in self.researcher.retrievers if "mcpretriever" not in r.__name__.lower()]
+        if not retrievers:
+            return []
+
+        min_urls = getattr(self.researcher.cfg, "retriever_min_urls", 0)
+        tasks = {
+            asyncio.create_task(self._search_with_deadline(retriever_class, query, query_domains)): retriever_class
+            for retriever_class in retrievers
+        }
 
-                # Perform the search using the current retriever
-                search_results = await asyncio.to_thread(
-                    retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
+        ranked_urls = {}
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                retriever_name = tasks[task].__name__
+                try:
+                    search_results = task.result()
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"{retriever_name} missed its deadline for query: {query}")
+                    continue
+                except Exception as e:
+                    self.logger.error(f"Error searching with {retriever_name}: {e}")
+                    continue
+                ranked_urls[retriever_name] = [url.get("href") for url in search_results if url.get("href")]
+
+            unique_urls = {canonicalize_url(url) for urls in ranked_urls.values() for url in urls}
+            if pending and min_urls and len(unique_urls) >= min_urls:
+                self.logger.info(
+                    f"Got {len(unique_urls)} URLs for '{query}', not waiting for "
+                    f"{[tasks[t].__name__ for t in pending]}"
                 )
+                break
 
-                # Collect new URLs from search results
-                search_urls = [url.get("href") for url in search_results if url.get("href")]
-                new_search_urls.extend(search_urls)
-            except Exception as e:
-                self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+        for task in pending:
+            task.cancel()
 
-        # Get unique URLs
-        new_search_urls = await self._get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
+        # Merge the rankings (variants of one page count as the same url) and keep only URLs we have not visited yet
+        fused_urls = reciprocal_rank_fusion(ranked_urls.values(), key=canonicalize_url)
+        new_search_urls = await self._get_new_urls(fused_urls)
 
         return new_search_urls
 
+    async def _search_with_deadline(self, retriever_class, query, query_domains):
+        """
+        Runs one retriever search under its deadline, hedging with a second request when
+        the first has not answered within RETRIEVER_HEDGE_DELAY seconds.
+        """
+        cfg = self.researcher.cfg
+        timeouts = {normalize_retriever_name(k): v for k, v in (getattr(cfg, "retriever_timeouts", None) or {}).items()}
+        timeout = timeouts.get(normalize_retriever_name(retriever_class.__name__), getattr(cfg, "retriever_timeout", 0))
+        hedge_delay = getattr(cfg, "retriever_hedge_delay", 0)
+
+        def search():
+            # Served from the search cache when fresh
+            return asyncio.to_thread(
+                cached_search,
+                retriever_class,
+                query,
+                query_domains=query_domains,
+                max_results=cfg.max_search_results_per_query,
+                cfg=cfg,
+            )
+
+        async def hedged_search():
+            primary = asyncio.ensure_future(search())
+            if not hedge_delay or hedge_delay <= 0:
+                return await primary
+
+            done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            self.logger.info(f"{retriever_class.__name__} slower than {hedge_delay}s, sending hedged request")
+            attempts = {primary, asyncio.ensure_future(search())}
+            first_error = None
+            try:
+                while attempts:
+                    done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                    for attempt in done:
+                        if attempt.exception() is not None:
+                            first_error = first_error or attempt.exception()
+                        elif attempt.result():
+                            return attempt.result()
+                if first_error is not None:
+                    raise first_error
+                return []
+            finally:
+                for attempt in attempts:
+                    attempt.cancel()
+
+        if timeout and timeout > 0:
+            return await asyncio.wait_for(hedged_search(), timeout=timeout)
+        return await hedged_search()
+
     async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None):
         """
         Runs a sub-query across multiple retrievers and scrapes the resulting URLs.
@@ -843,6 +942,44 @@ class ResearchConductor:
 
         return scraped_content
 
+    async def _scrape_and_compress_streaming(self, sub_query, query_domains: list | None = None):
+        """
+        Runs a sub-query across the retrievers and streams the scraped pages straight into
+        chunking and embedding, so the slowest URL no longer gates the whole sub-query.
+
+        Args:
+            sub_query (str): The sub-query to search for.
+
+        Returns:
+            str: The relevant context for the sub-query.
+        """
+        if query_domains is None:
+            query_domains = []
+
+        new_search_urls = await self._search_relevant_source_urls(sub_query, query_domains)
+
+        # Log the research process if verbose mode is on
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "researching",
+                f"🤔 Researching for relevant information across multiple sources...\n",
+                self.researcher.websocket,
+            )
+
+        page_stream = self.researcher.scraper_manager.browse_urls_stream(new_search_urls)
+        context, scraped_content, stats = await self.researcher.context_manager.get_similar_content_by_query_stream(
+            sub_query, page_stream
+        )
+        self.logger.info(f"Streaming pipeline stats for '{sub_query}': {stats}")
+        if self.json_handler:
+            self.json_handler.log_event("pipeline_stats", {"sub_query": sub_query, **stats})
+
+        if self.researcher.vector_store:
+            self.researcher.vector_store.load(scraped_content)
+
+        return context
+
     async def _search(self, retriever, query):
         """
         Perform a search using the specified retriever.
@@ -955,8 +1092,10 @@ class ResearchConductor:
         if not urls:
             return []
             
-        # Make sure we don't visit URLs we've already visited
-        new_urls = [url for url in urls if url not in self.researcher.visited_urls]
+        # Make sure we don't visit URLs we've already visited, in any of their variants
+        new_urls = get_url_canonicalizer().unique(
+            urls, {canonicalize_url(url) for url in self.researcher.visited_urls}
+        )
         
         # Return empty if no new URLs
         if not new_urls:
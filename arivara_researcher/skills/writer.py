@@ -57,29 +57,27 @@ class ReportGenerator:
 
         context = ext_context or self.researcher.context
         
-        # For deep research, allow much more context before truncating
-        # Deep research needs extensive context to generate comprehensive 20+ page reports
-        # API limit is 128k tokens total, so we can use 50k for context + 16k for output = 66k total
-        if self.researcher.report_type == "deep" or self.researcher.report_type == "DeepResearch":
-            max_tokens_threshold = 50000  # Allow 50k tokens for deep research context
-        else:
-            max_tokens_threshold = 20000  # Regular reports use 20k
-        
-        char_threshold = max_tokens_threshold * 4  # ~4 chars per token
-        
-        # Truncate context if it's a string and too large (to avoid token limit errors)
-        if isinstance(context, str) and len(context) > char_threshold:
-            from ..actions.report_generation import truncate_context_for_tokens, estimate_tokens
-            original_tokens = estimate_tokens(context)
+        # Fit the context into the report's token budget, keeping the most relevant sources
+        if isinstance(context, str):
+            from ..actions.report_generation import context_token_budget, estimate_tokens, pack_context_for_tokens
+            model = self.researcher.cfg.smart_llm_model
+            max_tokens_threshold = context_token_budget(self.researcher.report_type)
+            original_tokens = estimate_tokens(context, model)
             if original_tokens > max_tokens_threshold:
-                logger.warning(f"Context is very large ({original_tokens} tokens), truncating before report generation (threshold: {max_tokens_threshold})...")
-                context = truncate_context_for_tokens(context, max_tokens=max_tokens_threshold)
+                logger.warning(f"Context is very large ({original_tokens} tokens), packing before report generation (threshold: {max_tokens_threshold})...")
+                context = await pack_context_for_tokens(
+                    context,
+                    self.researcher.query,
+                    max_tokens_threshold,
+                    model=model,
+                    embeddings=self.researcher.memory.get_embeddings(),
+                )
                 if self.researcher.websocket:
                     try:
                         await self.researcher.websocket.send_json({
                             "type": "logs",
                             "content": "context_truncated",
-                            "output": f"⚠️ Research context is very large ({original_tokens} tokens). Truncating to {max_tokens_threshold} tokens to allow comprehensive report generation."
+                            "output": f"⚠️ Research context is very large ({original_tokens} tokens). Keeping the most relevant sources within {max_tokens_threshold} tokens to allow comprehensive report generation."
                         })
                     except:
                         pass
@@ -16,8 +16,41 @@ import os
 
 
 def get_llm(llm_provider, **kwargs):
-    from arivara_researcher.llm_provider import GenericLLMProvider
-    return GenericLLMProvider.from_provider(llm_provider, **kwargs)
+    """The shared provider for these settings, so clients and their connections are reused."""
+    from arivara_researcher.llm_provider.registry import get_provider_registry
+    return get_provider_registry().get(llm_provider, **kwargs)
+
+
+def _provider_kwargs(
+        model: str,
+        llm_provider: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        llm_kwargs: dict[str, Any] | None,
+        reasoning_effort: str | None,
+) -> dict[str, Any]:
+    """Keyword arguments of the provider for ``model``."""
+    provider_kwargs = {'model': model}
+
+    if llm_kwargs:
+        provider_kwargs.update(llm_kwargs)
+
+    if model in SUPPORT_REASONING_EFFORT_MODELS:
+        provider_kwargs['reasoning_effort'] = reasoning_effort
+
+    if model not in NO_SUPPORT_TEMPERATURE_MODELS:
+        provider_kwargs['temperature'] = temperature
+        provider_kwargs['max_tokens'] = max_tokens
+    else:
+        provider_kwargs['temperature'] = None
+        provider_kwargs['max_tokens'] = None
+
+    if llm_provider == "openai":
+        base_url = os.environ.get("OPENAI_BASE_URL", None)
+        if base_url:
+            provider_kwargs['openai_api_base'] = base_url
+
+    return provider_kwargs
 
 
 async def create_chat_completion(
@@ -32,6 +65,9 @@ async def create_chat_completion(
         cost_callback: callable = None,
         reasoning_effort: str | None = ReasoningEfforts.Medium.value,
         token_tracker: Any = None,
+        cache_site: str | None = None,
+        cache_query: str | None = None,
+        fallback: bool = False,
         **kwargs
 ) -> str:
     """Create a chat completion using the OpenAI API
@@ -48,6 +84,12 @@ async def create_chat_completion(
         cost_callback: Callback function for updating cost.
         reasoning_effort (str, optional): Reasoning effort for OpenAI's reasoning models. Defaults to 'low'.
         token_tracker: Optional TokenUsageTracker instance to track token usage.
+        cache_site (str, optional): Name of the call site, opting this call into the LLM response
+            cache (when it is enabled). Only for deterministic, non-streamed calls.
+        cache_query (str, optional): The variable part of the prompt (e.g. the user's query). Semantic
+            cache lookups compare only this text, against calls whose prompt is otherwise the same.
+        fallback (bool): Whether this non-critical call may be answered by the configured fallback
+            LLM (LLM_FALLBACK) when the primary one is unavailable. Defaults to False.
         **kwargs: Additional keyword arguments.
     Returns:
         str: The response from the chat completion.
@@ -62,25 +104,19 @@ async def create_chat_completion(
             f"Max tokens cannot be more than 32,000, but got {max_tokens}")
 
     # Get the provider from supported providers
-    provider_kwargs = {'model': model}
-
-    if llm_kwargs:
-        provider_kwargs.update(llm_kwargs)
-
-    if model in SUPPORT_REASONING_EFFORT_MODELS:
-        provider_kwargs['reasoning_effort'] = reasoning_effort
-
-    if model not in NO_SUPPORT_TEMPERATURE_MODELS:
-        provider_kwargs['temperature'] = temperature
-        provider_kwargs['max_tokens'] = max_tokens
-    else:
-        provider_kwargs['temperature'] = None
-        provider_kwargs['max_tokens'] = None
-
-    if llm_provider == "openai":
-        base_url = os.environ.get("OPENAI_BASE_URL", None)
-        if base_url:
-            provider_kwargs['openai_api_base'] = base_url
+    provider_kwargs = _provider_kwargs(model, llm_provider, temperature, max_tokens, llm_kwargs, reasoning_effort)
+
+    # Serve deterministic calls that opted in from the response cache
+    response_cache = None
+    if cache_site and not stream:
+        from ..llm_provider.response_cache import get_llm_response_cache
+        response_cache = get_llm_response_cache()
+        cache_params = {"llm_provider": llm_provider, **provider_kwargs}
+        cached = await response_cache.lookup(cache_site, model, messages, cache_params, cache_query)
+        if cached is not None:
+            if token_tracker is not None:
+                token_tracker.add_saved(cached["prompt_tokens"], cached["completion_tokens"])
+            return cached["response"]
 
     provider = get_llm(llm_provider, **provider_kwargs)
     response = ""
@@ -91,20 +127,36 @@ async def create_chat_completion(
     elif stream and websocket is not None:
         logging.info(f"create_chat_completion: stream=True, websocket type={type(websocket).__name__}")
     
-    # create response
-    for _ in range(10):  # maximum of 10 attempts
+    # create response (get_chat_response retries transient failures behind a circuit breaker)
+    try:
         response = await provider.get_chat_response(
             messages, stream, websocket, token_tracker=token_tracker, model_name=model, **kwargs
         )
+    except Exception as e:
+        from ..llm_provider.resilience import get_llm_resilience, is_retryable_error, CircuitOpenError
+        fallback_llm = get_llm_resilience().fallback_for(llm_provider, model) if fallback else None
+        if fallback_llm is None or not (isinstance(e, CircuitOpenError) or is_retryable_error(e)):
+            logging.error(f"Failed to get response from {llm_provider} API: {e}")
+            raise
+        fallback_provider, fallback_model = fallback_llm
+        logging.warning(f"{llm_provider}:{model} unavailable ({e}), falling back to {fallback_provider}:{fallback_model}")
+        provider = get_llm(fallback_provider, **_provider_kwargs(
+            fallback_model, fallback_provider, temperature, max_tokens, llm_kwargs, reasoning_effort
+        ))
+        response = await provider.get_chat_response(
+            messages, stream, websocket, token_tracker=token_tracker, model_name=fallback_model, **kwargs
+        )
+        # A fallback answer is not cached under the primary model's key
+        response_cache = None
 
-        if cost_callback:
-            llm_costs = estimate_llm_cost(str(messages), response)
-            cost_callback(llm_costs)
+    if cost_callback:
+        llm_costs = estimate_llm_cost(str(messages), response)
+        cost_callback(llm_costs)
 
-        return response
+    if response_cache is not None:
+        await response_cache.store(cache_site, model, messages, cache_params, response, cache_query)
 
-    logging.error(f"Failed to get response from {llm_provider} API")
-    raise RuntimeError(f"Failed to get response from {llm_provider} API")
+    return response
 
 
 async def construct_subtopics(
@@ -157,6 +209,21 @@ async def construct_subtopics(
             provider_kwargs['temperature'] = config.temperature
             provider_kwargs['max_tokens'] = config.smart_token_limit
 
+        # The chain is deterministic for a given prompt, so it can be served from the response cache
+        from ..llm_provider.response_cache import get_llm_response_cache
+        response_cache = get_llm_response_cache()
+        cache_messages = [{"role": "user", "content": prompt.format(
+            task=task, data=data, subtopics=subtopics, max_subtopics=config.max_subtopics
+        )}]
+        cache_params = {"llm_provider": config.smart_llm_provider, **provider_kwargs}
+        cached = await response_cache.lookup(
+            "construct_subtopics", config.smart_llm_model, cache_messages, cache_params, task
+        )
+        if cached is not None:
+            if token_tracker is not None:
+                token_tracker.add_saved(cached["prompt_tokens"], cached["completion_tokens"])
+            return Subtopics.model_validate_json(cached["response"])
+
         provider = get_llm(config.smart_llm_provider, **provider_kwargs)
 
         model = provider.llm
@@ -166,12 +233,22 @@ async def construct_subtopics(
         # Filter out non-LangChain kwargs before invoking
         chain_kwargs = {k: v for k, v in kwargs.items() if k not in ['researcher', 'token_tracker', 'model_name']}
 
-        output = await chain.ainvoke({
-            "task": task,
-            "data": data,
-            "subtopics": subtopics,
-            "max_subtopics": config.max_subtopics
-        }, **chain_kwargs)
+        from ..llm_provider import get_llm_governor, get_llm_resilience
+
+        async def invoke():
+            async with get_llm_governor().slot(config.smart_llm_provider, config.smart_llm_model, cache_messages):
+                return await chain.ainvoke({
+                    "task": task,
+                    "data": data,
+                    "subtopics": subtopics,
+                    "max_subtopics": config.max_subtopics
+                }, **chain_kwargs)
+
+        output = await get_llm_resilience().call(
+            config.smart_llm_provider,
+            invoke,
+            governor=get_llm_governor().governor(config.smart_llm_provider, config.smart_llm_model),
+        )
         
         # Track token usage from chain output
         if token_tracker is not None:
@@ -187,6 +264,10 @@ async def construct_subtopics(
             except Exception as e:
                 logging.getLogger(__name__).debug(f"Could not track token usage from construct_subtopics: {e}")
 
+        await response_cache.store(
+            "construct_subtopics", config.smart_llm_model, cache_messages, cache_params, output.model_dump_json(), task
+        )
+
         return output
 
     except Exception as e:
@@ -0,0 +1,263 @@
+"""
+Shared PDF ingestion.
+
+PDFs are downloaded with a byte cap straight into memory and opened from that buffer
+(local files are opened in place, which MuPDF reads lazily), so nothing is written to
+a temporary file. Text is extracted page by page and extraction stops as soon as a
+character budget is reached, so a 300-page PDF costs about as much as the pages that
+are actually kept. Large documents without a budget can have page ranges parsed in
+the shared process pool.
+"""
+import asyncio
+import functools
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import ClassVar, List, Optional, Tuple, Union
+
+import requests
+
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - PyMuPDF < 1.24.3 only ships the fitz module
+    import fitz as pymupdf
+
+logger = logging.getLogger(__name__)
+
+PdfSource = Union[bytes, bytearray, memoryview, str, os.PathLike]
+
+# Don't split documents into ranges shorter than this when parsing in parallel
+MIN_PAGES_PER_WORKER = 16
+
+
+@dataclass
+class PdfText:
+    """Text extracted from a PDF."""
+    title: str = ""
+    pages: List[Tuple[int, str]] = field(default_factory=list)
+    page_count: int = 0
+    truncated: bool = False
+
+    @property
+    def text(self) -> str:
+        """The extracted pages joined with blank lines."""
+        return "\n\n".join(text for _, text in self.pages)
+
+    def to_documents(self, source: str) -> list:
+        """One LangChain `Document` per non-empty page, like `PyMuPDFLoader` returns."""
+        from langchain_core.documents import Document
+
+        return [
+            Document(
+                page_content=text,
+                metadata={"source": source, "page": number, "total_pages": self.page_count, "title": self.title},
+            )
+            for number, text in self.pages
+        ]
+
+
+def open_pdf(source: PdfSource):
+    """
+    Open a PDF from bytes or a file path without copying it to disk.
+
+    A truncated download is repaired by MuPDF as far as possible, so the pages at the
+    start of the file usually remain readable.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return pymupdf.open(stream=bytes(source), filetype="pdf")
+    return pymupdf.open(os.fspath(source), filetype="pdf")
+
+
+def extract_pdf_text(
+    source: PdfSource,
+    max_chars: int = 0,
+    first_page: int = 0,
+    last_page: Optional[int] = None,
+) -> PdfText:
+    """
+    Extract text page by page until the character budget is used up.
+
+    Args:
+        source: PDF bytes or a file path
+        max_chars: Stop once this many characters were extracted (0 = no limit); the
+                   last page is cut to fit
+        first_page: Index of the first page to extract
+        last_page: Index one past the last page to extract (None = to the end)
+    """
+    with open_pdf(source) as doc:
+        result = PdfText(title=(doc.metadata or {}).get("title") or "", page_count=doc.page_count)
+        used = 0
+        stop = doc.page_count if last_page is None else min(last_page, doc.page_count)
+        for number in range(first_page, stop):
+            try:
+                text = doc.load_page(number).get_text().strip()
+            except Exception as e:
+                logger.debug(f"Failed to extract page {number} of PDF: {e}")
+                continue
+            if not text:
+                continue
+            if result.pages:
+                used += 2  # Blank line joining pages in `PdfText.text`
+            if max_chars and used + len(text) >= max_chars:
+                result.pages.append((number, text[: max_chars - used]))
+                result.truncated = True
+                break
+            result.pages.append((number, text))
+            used += len(text)
+        return result
+
+
+def extract_pdf_page(body: bytes, encoding, url: str, max_chars: int = 0) -> tuple:
+    """
+    Extracts (content, image_urls, title) from PDF bytes, in the shape the scrapers return.
+
+    Only plain bytes/strings cross the call boundary so it can run in a process pool.
+    """
+    try:
+        result = extract_pdf_text(body, max_chars=max_chars)
+        return result.text, [], result.title
+    except Exception as e:
+        print(f"Error loading PDF : {url} {e}")
+        return "", [], ""
+
+
+class PdfIngestor:
+    """
+    Singleton holding the PDF download and extraction limits.
+
+    Used by `PyMuPDFScraper`, the document loaders and the chat module's PDF service.
+    """
+
+    _instance: ClassVar['PdfIngestor'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the ingestor (only once)."""
+        if self._initialized:
+            return
+
+        self.max_bytes = 32 * 1024 * 1024
+        self.max_chars = 8000
+        self.page_workers = 0
+        self.timeout = 10.0
+        self._initialized = True
+
+    def configure(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_chars: int = 8000,
+        page_workers: int = 0,
+        timeout: float = 10.0,
+    ):
+        """
+        Configure the ingestor.
+
+        Args:
+            max_bytes: Downloads are cut off after this many bytes (0 = unlimited)
+            max_chars: Character budget for scraped PDFs (0 = whole document)
+            page_workers: Processes that parse page ranges of documents loaded without a
+                          budget (0 or 1 = parse inline)
+            timeout: Total seconds allowed for a download
+        """
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.page_workers = page_workers
+        self.timeout = timeout
+
+    def download(self, url: str, headers: Optional[dict] = None, session=None) -> bytes:
+        """
+        Download a PDF synchronously with the byte cap, for callers running in a worker thread.
+
+        Raises:
+            requests.RequestException: On connection, timeout or HTTP errors
+        """
+        getter = session.get if session is not None else requests.get
+        with getter(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                if self.max_bytes and size + len(chunk) > self.max_bytes:
+                    chunks.append(chunk[: self.max_bytes - size])
+                    logger.info(f"PDF {url} truncated at {self.max_bytes} bytes")
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+        return b"".join(chunks)
+
+    async def fetch(self, url: str, headers: Optional[dict] = None):
+        """
+        Download a PDF with the shared async HTTP client and the byte cap.
+
+        Returns:
+            FetchResult: Status, (possibly truncated) body and response headers
+        """
+        from ..scraper.http_client import get_http_client
+
+        result = await get_http_client().fetch(url, headers=headers, max_bytes=self.max_bytes, timeout=self.timeout)
+        if result.truncated:
+            logger.info(f"PDF {url} truncated at {self.max_bytes} bytes")
+        return result
+
+    async def extract(self, source: PdfSource, max_chars: Optional[int] = None) -> PdfText:
+        """
+        Extract text off the event loop.
+
+        Without a character budget, documents long enough are split into page ranges
+        that are parsed in the shared process pool.
+
+        Args:
+            source: PDF bytes or a file path
+            max_chars: Character budget (None = the configured budget, 0 = whole document)
+        """
+        max_chars = self.max_chars if max_chars is None else max_chars
+        if max_chars or self.page_workers <= 1:
+            return await asyncio.to_thread(extract_pdf_text, source, max_chars)
+
+        page_count, title = await asyncio.to_thread(_page_count_and_title, source)
+        if page_count < 2 * MIN_PAGES_PER_WORKER:
+            return await asyncio.to_thread(extract_pdf_text, source, 0)
+
+        from .workers import get_process_pool
+
+        workers = min(self.page_workers, page_count // MIN_PAGES_PER_WORKER)
+        step = -(-page_count // workers)
+        if isinstance(source, memoryview):
+            source = bytes(source)
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, functools.partial(extract_pdf_text, source, 0, start, start + step))
+            for start in range(0, page_count, step)
+        ))
+        return PdfText(
+            title=title,
+            pages=[page for part in parts for page in part.pages],
+            page_count=page_count,
+        )
+
+
+def _page_count_and_title(source: PdfSource) -> Tuple[int, str]:
+    with open_pdf(source) as doc:
+        return doc.page_count, (doc.metadata or {}).get("title") or ""
+
+
+# Singleton instance
+_pdf_ingestor = PdfIngestor()
+
+
+def get_pdf_ingestor(cfg=None) -> PdfIngestor:
+    """Get the PDF ingestor singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _pdf_ingestor.configure(
+            max_bytes=getattr(cfg, "pdf_max_bytes", 32 * 1024 * 1024),
+            max_chars=getattr(cfg, "pdf_max_chars", 8000),
+            page_workers=getattr(cfg, "pdf_parse_workers", 0),
+            timeout=getattr(cfg, "pdf_timeout", 10.0),
+        )
+    return _pdf_ingestor
@@ -1,25 +1,118 @@
 """
-Global rate limiter for scraper requests.
+Rate limiting for scraper requests.
 
-Ensures that SCRAPER_RATE_LIMIT_DELAY is enforced globally across ALL WorkerPools,
-not just per-pool. This prevents multiple concurrent researchers from overwhelming
-rate-limited APIs like Firecrawl.
+Each host or API provider (e.g. "firecrawl") gets its own token bucket, so a tight
+limit on one provider never delays requests to unrelated sites. Buckets refill at a
+configured rate up to a burst size and back off when the remote side answers
+429/503, recovering gradually as requests succeed again.
 """
 import asyncio
+import email.utils
+import logging
+import threading
 import time
-from typing import ClassVar
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, Optional
 
+logger = logging.getLogger(__name__)
 
-class GlobalRateLimiter:
+# Rate used for hosts that have no configured limit but start answering 429/503
+ADAPTIVE_DEFAULT_RATE = 1.0
+
+# Buckets kept before the least recently used one is dropped
+MAX_BUCKETS = 1024
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """
+    Token bucket that refills at ``rate`` tokens per second up to ``burst`` tokens.
+
+    Waiters reserve a token up front and sleep outside of any lock, so concurrent
+    callers are spaced out without serializing unrelated work.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0, min_rate: Optional[float] = None):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens and return how many seconds the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until ``amount`` tokens are available."""
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """Halve the refill rate and pause the bucket after a 429/503 response."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            # Drain the bucket so exactly one token is available once the pause is over
+            self.tokens = min(self.tokens, 1.0 - pause * self.rate)
+            self.blocked_until = max(self.blocked_until, now + pause)
+
+    def reward(self):
+        """Recover a tenth of the configured rate after a successful response."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": round(self.rate, 4),
+            "base_rate": self.base_rate,
+            "burst": self.burst,
+            "tokens": round(self.tokens, 2),
+            "blocked_for": round(max(0.0, self.blocked_until - time.monotonic()), 2),
+        }
+
+
+class RateLimitRegistry:
     """
-    Singleton global rate limiter.
+    Singleton registry of token buckets keyed by host or API provider name.
 
-    Ensures minimum delay between ANY scraper requests across the entire application,
-    regardless of how many WorkerPools or GPTResearcher instances are active.
+    Keys without a configured limit are not throttled until they answer 429/503. At most
+    ``MAX_BUCKETS`` buckets are kept; the least recently used one is dropped beyond that.
     """
 
-    _instance: ClassVar['GlobalRateLimiter'] = None
-    _lock: ClassVar[asyncio.Lock] = None
+    _instance: ClassVar['RateLimitRegistry'] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -28,66 +121,108 @@ class GlobalRateLimiter:
         return cls._instance
 
     def __init__(self):
-        """Initialize the global rate limiter (only once)."""
+        """Initialize the registry (only once)."""
         if self._initialized:
             return
 
-        self.last_request_time = 0.0
-        self.rate_limit_delay = 0.0
+        self.limits: Dict[str, Dict[str, float]] = {}
+        self.default_delay = 0.0
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
         self._initialized = True
 
-        # Create lock at class level to ensure it's shared across all instances
-        if GlobalRateLimiter._lock is None:
-            # Note: This will be properly initialized when first accessed in an async context
-            GlobalRateLimiter._lock = None
+    def configure(self, limits: Optional[Dict[str, Dict[str, float]]] = None, default_delay: float = 0.0):
+        """
+        Configure the registry.
 
-    @classmethod
-    def get_lock(cls):
-        """Get or create the async lock (must be called from async context)."""
-        if cls._lock is None:
-            cls._lock = asyncio.Lock()
-        return cls._lock
+        Buckets whose settings are unchanged keep their state (including any backoff).
 
-    def configure(self, rate_limit_delay: float):
+        Args:
+            limits: Per-key limits, e.g. {"firecrawl": {"rate": 0.16, "burst": 1}}; rate is requests/second
+            default_delay: Minimum seconds between requests to the same key when it has no
+                           explicit limit (0 = unlimited)
+        """
+        limits = {key.lower(): dict(spec) for key, spec in (limits or {}).items()}
+        with self._lock:
+            if limits == self.limits and default_delay == self.default_delay:
+                return
+            self.limits = limits
+            self.default_delay = default_delay
+            self._buckets.clear()
+
+    def _spec_for(self, key: str) -> Optional[Dict[str, float]]:
+        spec = self.limits.get(key)
+        if spec is not None:
+            return spec
+        if self.default_delay > 0:
+            return {"rate": 1.0 / self.default_delay, "burst": 1}
+        return None
+
+    def bucket(self, key: str, create: bool = False) -> Optional[TokenBucket]:
         """
-        Configure the global rate limit delay.
+        Get the bucket for ``key``.
 
         Args:
-            rate_limit_delay: Minimum seconds between requests (0 = no limit)
+            key: Host or provider name
+            create: Create an adaptive bucket even if the key has no configured limit
         """
-        self.rate_limit_delay = rate_limit_delay
+        key = key.lower()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets.move_to_end(key)
+                return bucket
+            spec = self._spec_for(key)
+            if spec is None and not create:
+                return None
+            spec = spec or {"rate": ADAPTIVE_DEFAULT_RATE, "burst": 1}
+            bucket = TokenBucket(float(spec["rate"]), float(spec.get("burst", 1)))
+            self._buckets[key] = bucket
+            if len(self._buckets) > MAX_BUCKETS:
+                self._buckets.popitem(last=False)
+            return bucket
+
+    async def acquire(self, key: Optional[str]):
+        """Wait for the bucket of ``key``, if it has one."""
+        if not key:
+            return
+        bucket = self.bucket(key)
+        if bucket is not None:
+            await bucket.acquire()
 
-    async def wait_if_needed(self):
+    def report(self, key: Optional[str], status: Optional[int], retry_after: Optional[str] = None):
         """
-        Wait if needed to enforce global rate limiting.
+        Feed a response status back into the bucket of ``key``.
 
-        This method ensures that regardless of how many WorkerPools are active,
-        the SCRAPER_RATE_LIMIT_DELAY is respected globally.
+        429 and 503 halve the bucket's rate and pause it (for Retry-After when given);
+        other successful responses slowly restore the configured rate.
         """
-        if self.rate_limit_delay <= 0:
-            return  # No rate limiting
-
-        lock = self.get_lock()
-        async with lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-
-            if time_since_last < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - time_since_last
-                await asyncio.sleep(sleep_time)
-
-            self.last_request_time = time.time()
+        if not key or status is None:
+            return
+        if status in (429, 503):
+            seconds = parse_retry_after(retry_after)
+            logger.info(f"Rate limited by {key} (HTTP {status}), backing off")
+            self.bucket(key, create=True).penalize(seconds)
+        elif status < 400:
+            bucket = self.bucket(key)
+            if bucket is not None:
+                bucket.reward()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current state of every bucket."""
+        with self._lock:
+            return {key: bucket.stats() for key, bucket in self._buckets.items()}
 
     def reset(self):
-        """Reset the rate limiter state (useful for testing)."""
-        self.last_request_time = 0.0
+        """Drop all buckets (useful for testing)."""
+        with self._lock:
+            self._buckets.clear()
 
 
 # Singleton instance
-_global_rate_limiter = GlobalRateLimiter()
-
+_rate_limit_registry = RateLimitRegistry()
 
-def get_global_rate_limiter() -> GlobalRateLimiter:
-    """Get the global rate limiter singleton instance."""
-    return _global_rate_limiter
 
+def get_rate_limit_registry() -> RateLimitRegistry:
+    """Get the rate limit registry singleton instance."""
+    return _rate_limit_registry
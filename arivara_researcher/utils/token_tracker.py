@@ -63,6 +63,10 @@ class TokenUsageTracker:
         self._completion_tokens = 0
         self._total_tokens = 0
         self._call_count = 0  # Track number of API calls
+        # Tokens not spent because a response was served from the LLM response cache
+        self._saved_prompt_tokens = 0
+        self._saved_completion_tokens = 0
+        self._cache_hits = 0
         
     def add(
         self,
@@ -130,6 +134,22 @@ class TokenUsageTracker:
                 f"(cumulative: {self._total_tokens})"
             )
     
+    def add_saved(self, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        """
+        Record a call answered from the LLM response cache and the tokens it saved.
+        
+        Args:
+            prompt_tokens: Prompt tokens the call would have used
+            completion_tokens: Completion tokens the call would have used
+        """
+        with self._lock:
+            self._saved_prompt_tokens += max(0, int(prompt_tokens or 0))
+            self._saved_completion_tokens += max(0, int(completion_tokens or 0))
+            self._cache_hits += 1
+            logger.debug(
+                f"TokenUsageTracker: Cache hit saved {prompt_tokens} prompt and {completion_tokens} completion tokens"
+            )
+    
     def reset(self) -> None:
         """Reset all counters for a new report run."""
         with self._lock:
@@ -137,6 +157,9 @@ class TokenUsageTracker:
             self._completion_tokens = 0
             self._total_tokens = 0
             self._call_count = 0
+            self._saved_prompt_tokens = 0
+            self._saved_completion_tokens = 0
+            self._cache_hits = 0
             logger.debug("TokenUsageTracker: Reset all counters")
     
     def summary(self) -> Dict[str, Any]:
@@ -149,7 +172,11 @@ class TokenUsageTracker:
                 "prompt_tokens": int,
                 "completion_tokens": int,
                 "total_tokens": int,
-                "call_count": int
+                "call_count": int,
+                "cache_hits": int,
+                "saved_prompt_tokens": int,
+                "saved_completion_tokens": int,
+                "saved_total_tokens": int
             }
         """
         with self._lock:
@@ -158,6 +185,10 @@ class TokenUsageTracker:
                 "completion_tokens": self._completion_tokens,
                 "total_tokens": self._total_tokens,
                 "call_count": self._call_count,
+                "cache_hits": self._cache_hits,
+                "saved_prompt_tokens": self._saved_prompt_tokens,
+                "saved_completion_tokens": self._saved_completion_tokens,
+                "saved_total_tokens": self._saved_prompt_tokens + self._saved_completion_tokens,
                 # For backwards compatibility with existing code
                 "total_prompt_tokens": self._prompt_tokens,
                 "total_completion_tokens": self._completion_tokens,
@@ -0,0 +1,60 @@
+"""
+Token counting with the model's own tokenizer.
+
+Encodings are loaded once per model and cached. Models tiktoken doesn't know fall back
+to ``o200k_base``; if no encoding can be loaded at all (tiktoken missing, or its BPE files
+unavailable offline) counts fall back to the ~4 characters per token heuristic.
+"""
+import functools
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"
+CHARS_PER_TOKEN = 4
+
+
+@functools.lru_cache(maxsize=32)
+def get_tokenizer(model: Optional[str] = None):
+    """The tiktoken encoding of ``model`` (None if no encoding can be loaded)."""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken is not installed, estimating tokens from characters")
+        return None
+    try:
+        if model:
+            # Provider prefixes such as "openai:gpt-4o" aren't part of the model name
+            return tiktoken.encoding_for_model(model.split(":")[-1])
+    except KeyError:
+        pass
+    except Exception as e:
+        logger.warning(f"Could not load the tokenizer of {model}: {e}")
+        return None
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"Could not load the {DEFAULT_ENCODING} tokenizer, estimating tokens from characters: {e}")
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Number of tokens ``text`` takes for ``model``."""
+    if not text:
+        return 0
+    encoding = get_tokenizer(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """The longest prefix of ``text`` that fits in ``max_tokens`` tokens."""
+    if max_tokens <= 0:
+        return ""
+    encoding = get_tokenizer(model)
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
@@ -0,0 +1,207 @@
+"""
+Canonical URL normalization.
+
+Search results for the same page often differ only in tracking parameters, fragments,
+trailing slashes, mobile/AMP variants or http vs https. `UrlCanonicalizer` maps all of
+them to one canonical form that is used as the page's identity when deduplicating urls
+across retrievers, keying the page cache and listing citations.
+"""
+import fnmatch
+import re
+from typing import Any, ClassVar, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from; glob patterns are allowed
+DEFAULT_STRIP_PARAMS = [
+    "utm_*",
+    "gclid",
+    "gclsrc",
+    "dclid",
+    "fbclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "_hsenc",
+    "_hsmi",
+    "mkt_tok",
+    "ref_src",
+    "ref_url",
+    "cmpid",
+    "ocid",
+    "spm",
+    "amp",
+]
+
+# Per-domain rules; a rule applies to the domain and all of its subdomains
+DEFAULT_DOMAIN_RULES = {
+    "youtube.com": {"keep_params": ["v", "list", "t"]},
+}
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+_MOBILE_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+_AMP_PATH_RE = re.compile(r"/amp(?:\.html?)?/?$|^/amp(?=/)", re.IGNORECASE)
+_AMP_CACHE_RE = re.compile(r"^/[cv]/(?:s/)?(.+)$")
+_DUPLICATE_SLASHES_RE = re.compile(r"/{2,}")
+
+
+class UrlCanonicalizer:
+    """
+    Singleton url canonicalizer.
+
+    The canonical form uses https, a lowercase host without "www."/"m."/"amp." prefixes
+    or default port, a path without AMP suffixes, duplicate or trailing slashes, a query
+    without tracking parameters and sorted by key, and no fragment.
+    """
+
+    _instance: ClassVar['UrlCanonicalizer'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the canonicalizer (only once)."""
+        if self._initialized:
+            return
+
+        self.configure()
+        self._initialized = True
+
+    def configure(
+        self,
+        strip_params: Optional[Iterable[str]] = None,
+        domain_rules: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """
+        Configure the canonicalizer.
+
+        Args:
+            strip_params: Query parameter names (or glob patterns) to drop; defaults to
+                          `DEFAULT_STRIP_PARAMS`
+            domain_rules: Extra rules keyed by domain, merged over `DEFAULT_DOMAIN_RULES`:
+                          "keep_params" (only these parameters survive), "strip_params"
+                          (dropped in addition to the global list), "keep_trailing_slash"
+                          and "lowercase_path" (booleans)
+        """
+        self.strip_params = list(DEFAULT_STRIP_PARAMS if strip_params is None else strip_params)
+        self.domain_rules = {
+            domain.lower().lstrip("."): dict(rule)
+            for domain, rule in {**DEFAULT_DOMAIN_RULES, **(domain_rules or {})}.items()
+        }
+        self._exact_params = {p.lower() for p in self.strip_params if not _is_pattern(p)}
+        self._param_patterns = [p.lower() for p in self.strip_params if _is_pattern(p)]
+
+    def rule_for(self, host: str) -> Dict[str, Any]:
+        """The domain rule for ``host`` or its closest parent domain."""
+        parts = host.split(".")
+        for i in range(len(parts) - 1):
+            rule = self.domain_rules.get(".".join(parts[i:]))
+            if rule is not None:
+                return rule
+        return {}
+
+    def _strip_param(self, name: str, rule: Dict[str, Any]) -> bool:
+        name = name.lower()
+        if name in self._exact_params or any(fnmatch.fnmatchcase(name, p) for p in self._param_patterns):
+            return True
+        return any(fnmatch.fnmatchcase(name, p.lower()) for p in rule.get("strip_params", ()))
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Return the canonical form of ``url``.
+
+        Strings that aren't http(s) urls (e.g. local file paths) are returned stripped but
+        otherwise unchanged.
+        """
+        url = url.strip()
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            return url
+
+        path = parts.path
+        # Google's AMP cache serves other sites' pages under /c/s/<host>/<path>
+        if parts.hostname.endswith(".cdn.ampproject.org"):
+            match = _AMP_CACHE_RE.match(path)
+            if match:
+                return self.canonicalize("https://" + match.group(1) + (f"?{parts.query}" if parts.query else ""))
+
+        host = parts.hostname.lower().rstrip(".")
+        for prefix in _MOBILE_PREFIXES:
+            if host.startswith(prefix) and host.count(".") > 1:
+                host = host[len(prefix):]
+                break
+        rule = self.rule_for(host)
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        netloc = host if port is None or str(port) in _DEFAULT_PORTS.values() else f"{host}:{port}"
+
+        if "amp" in path.lower():
+            path = _AMP_PATH_RE.sub("/", path)
+        path = _DUPLICATE_SLASHES_RE.sub("/", path)
+        if rule.get("lowercase_path"):
+            path = path.lower()
+        if not rule.get("keep_trailing_slash"):
+            path = path.rstrip("/")
+        path = path or "/"
+
+        keep = rule.get("keep_params")
+        params = [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if (key in keep if keep is not None else not self._strip_param(key, rule))
+        ]
+        query = urlencode(sorted(params))
+
+        # Hash-bang fragments address content in single-page apps, so they are kept
+        fragment = parts.fragment if parts.fragment.startswith("!") else ""
+        return urlunsplit(("https", netloc, path, query, fragment))
+
+    def unique(self, urls: Iterable[str], seen: Optional[set] = None) -> List[str]:
+        """
+        The urls whose canonical form isn't in ``seen`` (or earlier in ``urls``), in order.
+
+        Canonical forms of the returned urls are added to ``seen`` when it is given.
+        """
+        seen = set() if seen is None else seen
+        unique = []
+        for url in urls:
+            key = self.canonicalize(url)
+            if key not in seen:
+                seen.add(key)
+                unique.append(url)
+        return unique
+
+
+def _is_pattern(name: str) -> bool:
+    return any(char in name for char in "*?[")
+
+
+# Singleton instance
+_url_canonicalizer = UrlCanonicalizer()
+
+
+def get_url_canonicalizer(cfg=None) -> UrlCanonicalizer:
+    """Get the url canonicalizer singleton, applying settings from ``cfg`` when given."""
+    if cfg is not None:
+        _url_canonicalizer.configure(
+            strip_params=getattr(cfg, "url_strip_params", None),
+            domain_rules=getattr(cfg, "url_domain_rules", None),
+        )
+    return _url_canonicalizer
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of ``url`` under the current canonicalizer settings."""
+    return _url_canonicalizer.canonicalize(url)
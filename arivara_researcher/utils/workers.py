@@ -1,49 +1,110 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from .rate_limiter import get_global_rate_limiter
+from .rate_limiter import get_rate_limit_registry
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def get_process_pool(max_workers: int = 0) -> ProcessPoolExecutor:
+    """
+    Get the process pool shared by every WorkerPool, creating it on first use.
+
+    Worker processes are expensive to start, so there is one pool per process rather
+    than one per researcher. ``max_workers`` only applies when the pool is created.
+
+    Args:
+        max_workers: Number of worker processes (0 = one per available CPU)
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            # Forking a process that runs an event loop and worker threads is unsafe
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _process_pool = ProcessPoolExecutor(
+                max_workers=max_workers or available_cpus(), mp_context=context
+            )
+        return _process_pool
 
 
 class WorkerPool:
-    def __init__(self, max_workers: int, rate_limit_delay: float = 0.0):
+    def __init__(
+        self,
+        max_workers: int,
+        rate_limit_delay: float = 0.0,
+        parse_executor: str = "thread",
+        parse_workers: int = 0,
+        rate_limits: dict | None = None,
+    ):
         """
         Initialize WorkerPool with concurrency and rate limiting.
 
         Args:
             max_workers: Maximum number of concurrent workers
-            rate_limit_delay: Minimum seconds between requests GLOBALLY (0 = no limit)
-                             This delay is enforced across ALL WorkerPools to prevent
-                             overwhelming rate-limited APIs.
+            rate_limit_delay: Minimum seconds between requests to the same host or API
+                             provider (0 = no limit). Each host/provider has its own
+                             token bucket, so a slow limit for one never delays the others.
                              Example: 6.0 for 10 req/min (Firecrawl free tier)
+            parse_executor: Where CPU-bound HTML extraction runs: "thread" (this pool's
+                            executor) or "process" (a process pool shared by all WorkerPools)
+            parse_workers: Worker processes for the "process" executor (0 = one per CPU)
+            rate_limits: Per host/provider token buckets, e.g.
+                         {"firecrawl": {"rate": 0.16, "burst": 1}} (rate in requests/second)
 
         Note:
-            The rate_limit_delay is enforced GLOBALLY using a singleton rate limiter.
+            Rate limits are enforced by a singleton registry shared by every WorkerPool.
             This means if you have multiple GPTResearcher instances (e.g., in deep research),
-            they will all share the same rate limit, preventing API overload.
+            they will all share the same per-host limits, preventing API overload.
         """
         self.max_workers = max_workers
         self.rate_limit_delay = rate_limit_delay
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.semaphore = asyncio.Semaphore(max_workers)
+        if parse_executor not in ("thread", "process"):
+            raise ValueError(f"Unknown parse executor: {parse_executor}")
+        self.parse_executor_kind = parse_executor
+        self.parse_workers = parse_workers
+
+        # All WorkerPools share the same rate limit registry
+        get_rate_limit_registry().configure(rate_limits, default_delay=rate_limit_delay)
 
-        # Configure the global rate limiter
-        # All WorkerPools share the same rate limiter instance
-        global_limiter = get_global_rate_limiter()
-        global_limiter.configure(rate_limit_delay)
+    @property
+    def parse_executor(self) -> Executor:
+        """
+        Executor for CPU-bound extraction. Callables submitted to it must be picklable
+        (module-level functions) since it may be a process pool.
+        """
+        if self.parse_executor_kind == "process":
+            return get_process_pool(self.parse_workers)
+        return self.executor
 
     @asynccontextmanager
-    async def throttle(self):
+    async def throttle(self, key: str | None = None):
         """
-        Throttle requests with both concurrency limiting and GLOBAL rate limiting.
+        Throttle requests with both concurrency limiting and per-key rate limiting.
 
         - Semaphore controls concurrent operations within THIS pool (how many at once)
-        - Global rate limiter controls request frequency ACROSS ALL POOLS (global timing)
+        - The token bucket for ``key`` (a host or API provider) controls request frequency
+          to that key ACROSS ALL POOLS
+
+        The bucket is waited on before taking a worker slot, so requests held back by a
+        rate limit don't block requests to other hosts.
 
-        This ensures that even with multiple concurrent GPTResearcher instances
-        (e.g., in deep research), the total request rate stays within limits.
+        Args:
+            key: Host or API provider the request goes to (None = no rate limit)
         """
+        await get_rate_limit_registry().acquire(key)
         async with self.semaphore:
-            # Use global rate limiter (shared across all WorkerPools)
-            global_limiter = get_global_rate_limiter()
-            await global_limiter.wait_if_needed()
             yield
@@ -1,26 +1,36 @@
 """
 Wrapper for langchain vector store
 """
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional
 
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+if TYPE_CHECKING:
+    from ..context.chunk_store import ChunkStore
+
 class VectorStoreWrapper:
     """
     A Wrapper for LangchainVectorStore to handle Arivara-Researcher Document Type
     """
-    def __init__(self, vector_store : VectorStore):
+    def __init__(self, vector_store : VectorStore, chunk_store: Optional["ChunkStore"] = None):
         self.vector_store = vector_store
+        self.chunk_store = chunk_store
 
     def load(self, documents):
         """
         Load the documents into vector_store
         Translate to langchain doc type, split to chunks then load
         """
-        langchain_documents = self._create_langchain_documents(documents)
-        splitted_documents = self._split_documents(langchain_documents)
+        if self.chunk_store is not None:
+            splitted_documents = [
+                Document(page_content=chunk.text, metadata={"source": chunk.page["url"]})
+                for chunk in self.chunk_store.split(documents, chunk_size=1000, chunk_overlap=200)
+            ]
+        else:
+            langchain_documents = self._create_langchain_documents(documents)
+            splitted_documents = self._split_documents(langchain_documents)
         self.vector_store.add_documents(splitted_documents)
     
     def _create_langchain_documents(self, data: List[Dict[str, str]]) -> List[Document]:
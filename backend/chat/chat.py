@@ -2,6 +2,7 @@ from fastapi import WebSocket
 import uuid
 
 from arivara_researcher.utils.llm import get_llm
+from arivara_researcher.llm_provider import get_llm_governor, govern
 from arivara_researcher.memory import Memory
 from arivara_researcher.config.config import Config
 
@@ -29,6 +30,7 @@ class ChatAgentWithMemory:
     def create_agent(self):
         """Create React Agent Graph"""
         cfg = Config()
+        get_llm_governor(cfg)
 
         # Retrieve LLM using get_llm with settings from config
         provider = get_llm(
@@ -51,10 +53,12 @@ class ChatAgentWithMemory:
             self.vector_store = InMemoryVectorStore(self.embedding)
             self.vector_store.add_texts(documents)
 
-        # Create the React Agent Graph with the configured provider
+        # Create the React Agent Graph with the configured provider. Each of the agent's model
+        # calls takes its own slot of the process-wide governor; tool calls hold none
+        tools = [self.vector_store_tool(self.vector_store)]
         graph = create_react_agent(
-            provider,
-            tools=[self.vector_store_tool(self.vector_store)],
+            govern(provider.bind_tools(tools), cfg.smart_llm_provider, cfg.smart_llm_model),
+            tools=tools,
             checkpointer=MemorySaver()
         )
         
@@ -3,6 +3,7 @@ from typing import List, Dict, Set, Optional, Any
 from fastapi import WebSocket
 
 from arivara_researcher import Arivara_researcher
+from arivara_researcher.context.written_sections import WrittenSectionIndex
 
 
 class DetailedReport:
@@ -61,6 +62,8 @@ class DetailedReport:
         self.existing_headers: List[Dict] = []
         self.global_context: List[str] = []
         self.global_written_sections: List[str] = []
+        # Written sections are embedded once, as they are appended
+        self.written_sections_index = WrittenSectionIndex(self.arivara_researcher.memory.get_embeddings())
         self.global_urls: Set[str] = set(
             self.source_urls) if self.source_urls else set()
 
@@ -141,7 +144,9 @@ class DetailedReport:
             role=self.arivara_researcher.role,
             tone=self.tone,
             complement_source_urls=self.complement_source_urls,
-            source_urls=self.source_urls
+            source_urls=self.source_urls,
+            inflight_scrapes=self.arivara_researcher.inflight_scrapes,
+            chunk_store=self.arivara_researcher.chunk_store,
         )
 
         subtopic_assistant.context = list(set(self.global_context))
@@ -157,7 +162,8 @@ class DetailedReport:
             "text", "") for header in parse_draft_section_titles]
 
         relevant_contents = await subtopic_assistant.get_similar_written_contents_by_draft_section_titles(
-            current_subtopic_task, parse_draft_section_titles_text, self.global_written_sections
+            current_subtopic_task, parse_draft_section_titles_text, self.global_written_sections,
+            written_index=self.written_sections_index,
         )
 
         subtopic_report = await subtopic_assistant.write_report(self.existing_headers, relevant_contents)
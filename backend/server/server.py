@@ -20,6 +20,9 @@ from backend.server.server_utils import (
 from backend.server.websocket_manager import run_agent
 from backend.utils import write_md_to_word, write_md_to_pdf
 from arivara_researcher.utils.logging_config import setup_research_logging
+from arivara_researcher.config.config import Config
+from arivara_researcher.actions.web_scraping import configure_browser_pool
+from arivara_researcher.scraper import NoDriverScraper
 from arivara_researcher.utils.enum import Tone
 from backend.chat.chat import ChatAgentWithMemory
 
@@ -123,7 +126,22 @@ def startup_event():
     os.makedirs("outputs", exist_ok=True)
     app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
     # os.makedirs(DOC_PATH, exist_ok=True)  # Commented out to avoid creating the folder if not needed
-    
+
+
+@app.on_event("startup")
+async def prewarm_browser_pool():
+    """Start the configured number of headless browsers so the first scrape doesn't pay cold start."""
+    cfg = Config()
+    uses_browser = cfg.scraper == "nodriver" or (cfg.scraper == "tiered" and "nodriver" in cfg.scraper_tiers)
+    if cfg.browser_pool_prewarm <= 0 or not uses_browser:
+        return
+    configure_browser_pool(cfg)
+    try:
+        await NoDriverScraper.warm_up(cfg.browser_pool_prewarm)
+        logger.info(f"Pre-warmed {cfg.browser_pool_prewarm} browser(s)")
+    except Exception as e:
+        logger.warning(f"Failed to pre-warm browser pool: {e}")
+
 
 # Routes
 
@@ -206,6 +224,11 @@ async def generate_report(research_request: ResearchRequest, background_tasks: B
         return response
 
 
+@app.get("/api/browser-pool/stats")
+async def browser_pool_stats():
+    return NoDriverScraper.get_pool_stats()
+
+
 @app.get("/files/")
 async def list_files():
     if not os.path.exists(DOC_PATH):
@@ -0,0 +1,66 @@
+"""
+Thread vs process pool throughput for HTML extraction.
+
+Runs the BeautifulSoup extraction used by the "bs" scraper over the saved pages in
+``benchmarks/corpus`` with a thread pool (SCRAPER_PARSE_EXECUTOR="thread") and with the
+shared process pool (SCRAPER_PARSE_EXECUTOR="process"), and reports pages per second.
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from arivara_researcher.scraper.beautiful_soup.beautiful_soup import extract_page
+from arivara_researcher.utils.workers import WorkerPool, available_cpus
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+
+
+def load_corpus(corpus_dir: Path) -> list[tuple[str, bytes]]:
+    pages = [(f"https://example.com/{path.stem}", path.read_bytes()) for path in sorted(corpus_dir.glob("*.html"))]
+    if not pages:
+        raise SystemExit(f"No .html files found in {corpus_dir}")
+    return pages
+
+
+async def run(pool: WorkerPool, pages: list[tuple[str, bytes]], repeat: int) -> float:
+    loop = asyncio.get_running_loop()
+    executor = pool.parse_executor
+    # Warm up so process start-up isn't counted
+    await asyncio.gather(*(loop.run_in_executor(executor, extract_page, body, None, url) for url, body in pages))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        loop.run_in_executor(executor, extract_page, body, None, url)
+        for _ in range(repeat)
+        for url, body in pages
+    ))
+    elapsed = time.perf_counter() - started
+    assert all(content for content, _, _ in results)
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR, help="Directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=20, help="Times each page is extracted")
+    parser.add_argument("--threads", type=int, default=15, help="Thread pool size (MAX_SCRAPER_WORKERS)")
+    parser.add_argument("--processes", type=int, default=0, help="Process pool size (0 = one per CPU)")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    total = len(pages) * args.repeat
+    corpus_mb = sum(len(body) for _, body in pages) * args.repeat / 1e6
+    print(f"{len(pages)} pages x {args.repeat} = {total} extractions ({corpus_mb:.1f} MB), {available_cpus()} CPUs")
+
+    for kind in ("thread", "process"):
+        pool = WorkerPool(args.threads, parse_executor=kind, parse_workers=args.processes)
+        elapsed = await run(pool, pages, args.repeat)
+        print(f"{kind:>8}: {elapsed:7.2f}s  {total / elapsed:8.1f} pages/s  {corpus_mb / elapsed:6.2f} MB/s")
+        pool.executor.shutdown()
+        if kind == "process":
+            pool.parse_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
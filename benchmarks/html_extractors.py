@@ -0,0 +1,58 @@
+"""
+Throughput and output parity of the "bs" and "lxml" HTML extractors.
+
+Extracts every page in ``benchmarks/corpus`` with both engines, reports pages per second,
+and checks that the lxml extractor returns the same content, title and images as the
+BeautifulSoup one.
+"""
+import argparse
+import difflib
+import time
+from pathlib import Path
+
+from arivara_researcher.scraper.beautiful_soup.beautiful_soup import extract_page as bs_extract
+from arivara_researcher.scraper.lxml_scraper.lxml_scraper import extract_page as lxml_extract
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+EXTRACTORS = {"bs": bs_extract, "lxml": lxml_extract}
+
+
+def throughput(extract, pages: list[tuple[str, bytes]], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for url, body in pages:
+            extract(body, None, url)
+    return len(pages) * repeat / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_DIR, help="Directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=10, help="Times each page is extracted")
+    args = parser.parse_args()
+
+    pages = [(f"https://example.com/{path.stem}", path.read_bytes()) for path in sorted(args.corpus.glob("*.html"))]
+    if not pages:
+        raise SystemExit(f"No .html files found in {args.corpus}")
+
+    print(f"{'page':<24} {'content':>9} {'title':>6} {'images':>7}")
+    mismatches = 0
+    for url, body in pages:
+        expected = bs_extract(body, None, url)
+        actual = lxml_extract(body, None, url)
+        similarity = difflib.SequenceMatcher(None, expected[0], actual[0], autojunk=False).ratio()
+        same = [expected[0] == actual[0], expected[2] == actual[2], expected[1] == actual[1]]
+        mismatches += not all(same)
+        content = "same" if same[0] else f"{similarity:.1%}"
+        print(f"{url.rsplit('/', 1)[-1]:<24} {content:>9} {'same' if same[1] else 'diff':>6} {'same' if same[2] else 'diff':>7}")
+    print(f"parity: {len(pages) - mismatches}/{len(pages)} pages identical\n")
+
+    baseline = None
+    for name, extract in EXTRACTORS.items():
+        rate = throughput(extract, pages, args.repeat)
+        baseline = baseline or rate
+        print(f"{name:>6}: {rate:8.1f} pages/s  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
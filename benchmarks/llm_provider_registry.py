@@ -0,0 +1,103 @@
+"""
+Per-call overhead of building LLM providers versus reusing them from the registry.
+
+Two measurements are made. The first builds an OpenAI chat provider the old way
+(``GenericLLMProvider.from_provider`` on every call) and through the
+``ProviderRegistry``. The second sends chat completions to a local stub of the OpenAI API
+and counts the TCP connections each approach opens. Providers whose SDK already shares
+a default HTTP client (recent langchain-openai does) open the same number of connections
+either way. No API key or network access is needed. The stub serves plain HTTP on
+localhost, so the TLS handshakes a real endpoint adds on every new connection are not
+included in the timings.
+"""
+import argparse
+import asyncio
+import time
+
+from aiohttp import web
+
+from arivara_researcher.llm_provider import GenericLLMProvider, ProviderRegistry
+
+PROVIDER = "openai"
+PROVIDER_KWARGS = {"model": "gpt-4.1", "temperature": 0.4, "max_tokens": 4000, "openai_api_key": "sk-benchmark"}
+COMPLETION = {
+    "id": "chatcmpl-benchmark",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4.1",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+def time_construction(get_provider, calls: int) -> float:
+    """Average seconds to obtain a provider."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        get_provider(PROVIDER, **PROVIDER_KWARGS)
+    return (time.perf_counter() - started) / calls
+
+
+async def time_requests(get_provider, calls: int, base_url: str, connections: set) -> tuple[float, int]:
+    """Average seconds per chat completion and the TCP connections opened."""
+    connections.clear()
+    messages = [{"role": "user", "content": "ping"}]
+    started = time.perf_counter()
+    for _ in range(calls):
+        provider = get_provider(PROVIDER, openai_api_base=base_url, **PROVIDER_KWARGS)
+        await provider.llm.ainvoke(messages)
+    return (time.perf_counter() - started) / calls, len(connections)
+
+
+async def run_requests(calls: int):
+    connections = set()
+
+    async def completions(request):
+        connections.add(request.transport.get_extra_info("peername"))
+        return web.json_response(COMPLETION)
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}/v1"
+
+    registry = ProviderRegistry()
+    registry.clear()
+    try:
+        fresh = await time_requests(GenericLLMProvider.from_provider, calls, base_url, connections)
+        cached = await time_requests(registry.get, calls, base_url, connections)
+    finally:
+        await runner.cleanup()
+    return fresh, cached
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200, help="Providers built / requests sent per approach")
+    args = parser.parse_args()
+
+    registry = ProviderRegistry()
+    registry.clear()
+    # Warm up imports so they don't count against the first approach
+    GenericLLMProvider.from_provider(PROVIDER, **PROVIDER_KWARGS)
+
+    built = time_construction(GenericLLMProvider.from_provider, args.calls)
+    reused = time_construction(registry.get, args.calls)
+    print(f"{'approach':<22} {'get provider':>14}")
+    print(f"{'from_provider':<22} {built * 1e6:>11.0f} us")
+    print(f"{'registry':<22} {reused * 1e6:>11.0f} us")
+    print(f"speedup: {built / reused:.0f}x\n")
+
+    (fresh, fresh_conns), (cached, cached_conns) = asyncio.run(run_requests(args.calls))
+    print(f"{'approach':<22} {'per request':>14} {'connections':>12}")
+    print(f"{'from_provider':<22} {fresh * 1e3:>11.2f} ms {fresh_conns:>12}")
+    print(f"{'registry':<22} {cached * 1e3:>11.2f} ms {cached_conns:>12}")
+    print(f"saved per request: {(fresh - cached) * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Scrapes saved by canonical URL deduplication.
+
+Replays the retriever results saved in ``benchmarks/corpus/search_results.json`` as the
+sub-queries of one research run. URLs are deduplicated across retrievers and sub-queries
+by their raw string (the old behaviour) and by their canonical form. The benchmark then
+reports how many scrapes each approach issues and how fast canonicalization is.
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from arivara_researcher.retrievers.utils import reciprocal_rank_fusion
+from arivara_researcher.utils.urls import canonicalize_url
+
+RESULTS_FILE = Path(__file__).parent / "corpus" / "search_results.json"
+
+
+def count_scrapes(results: dict, key) -> dict[str, int]:
+    """Scrapes per sub-query when urls are deduplicated by ``key``, sharing one visited set."""
+    visited = set()
+    scrapes = {}
+    for query, ranked in results.items():
+        fused = reciprocal_rank_fusion(ranked.values(), key=key)
+        new_urls = [url for url in fused if key(url) not in visited]
+        visited.update(key(url) for url in new_urls)
+        scrapes[query] = len(new_urls)
+    return scrapes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--results", type=Path, default=RESULTS_FILE, help="JSON of {query: {retriever: [urls]}}")
+    parser.add_argument("--repeat", type=int, default=1000, help="Times every url is canonicalized for timing")
+    args = parser.parse_args()
+
+    results = json.loads(args.results.read_text())
+    raw = count_scrapes(results, key=lambda url: url)
+    canonical = count_scrapes(results, key=canonicalize_url)
+
+    print(f"{'query':<48} {'raw':>5} {'canonical':>10}")
+    for query in results:
+        print(f"{query[:48]:<48} {raw[query]:>5} {canonical[query]:>10}")
+    total_raw, total_canonical = sum(raw.values()), sum(canonical.values())
+    saved = total_raw - total_canonical
+    print(f"{'total':<48} {total_raw:>5} {total_canonical:>10}")
+    print(f"scrapes saved: {saved} ({saved / total_raw:.0%})\n")
+
+    urls = [url for ranked in results.values() for urls in ranked.values() for url in urls]
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for url in urls:
+            canonicalize_url(url)
+    elapsed = time.perf_counter() - started
+    print(f"canonicalize_url: {elapsed / (len(urls) * args.repeat) * 1e6:.1f} us/url")
+
+
+if __name__ == "__main__":
+    main()
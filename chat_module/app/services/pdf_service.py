@@ -4,6 +4,13 @@ import httpx
 from pypdf import PdfReader
 from io import BytesIO
 
+try:
+    # Shared ingestion from the researcher package: capped streaming download, in-memory
+    # PyMuPDF parsing and page-by-page extraction that stops at the character budget
+    from arivara_researcher.utils.pdf_ingest import get_pdf_ingestor
+except ImportError:  # chat module deployed without the researcher package
+    get_pdf_ingestor = None
+
 
 class PDFService:
     """
@@ -20,27 +27,21 @@ class PDFService:
             return ""
 
         combined_texts: List[str] = []
+        used = 0
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             for url in pdf_urls:
+                if used >= max_chars:
+                    break
                 try:
-                    resp = await client.get(url)
-                    resp.raise_for_status()
-                    pdf_bytes = resp.content
-
-                    reader = PdfReader(BytesIO(pdf_bytes))
-                    pages_text: List[str] = []
-                    for page in reader.pages:
-                        try:
-                            page_text = page.extract_text() or ""
-                        except Exception:
-                            page_text = ""
-                        if page_text:
-                            pages_text.append(page_text.strip())
-
-                    if pages_text:
-                        doc_text = "\n\n".join(pages_text)
+                    if get_pdf_ingestor is not None:
+                        doc_text = await self._extract_shared(url, max_chars - used)
+                    else:
+                        doc_text = await self._extract_pypdf(client, url)
+
+                    if doc_text:
                         combined_texts.append(f"PDF: {url}\n{doc_text}")
+                        used += len(combined_texts[-1])
                 except Exception as e:
                     # Skip PDFs that fail to download/parse, but continue with others
                     combined_texts.append(f"PDF: {url}\n[Failed to extract text: {e}]")
@@ -50,3 +51,29 @@ class PDFService:
             return full_text[: max_chars] + "\n\n[Truncated PDF content]"
         return full_text
 
+    @staticmethod
+    async def _extract_shared(url: str, budget: int) -> str:
+        """Download with the shared byte cap and extract only the pages that fit the budget."""
+        ingestor = get_pdf_ingestor()
+        result = await ingestor.fetch(url)
+        if result.status >= 400:
+            raise RuntimeError(f"HTTP {result.status} for {url}")
+        # One extra character so the caller still marks the combined text as truncated
+        pdf = await ingestor.extract(result.body, max_chars=budget + 1)
+        return pdf.text
+
+    @staticmethod
+    async def _extract_pypdf(client: httpx.AsyncClient, url: str) -> str:
+        resp = await client.get(url)
+        resp.raise_for_status()
+
+        reader = PdfReader(BytesIO(resp.content))
+        pages_text: List[str] = []
+        for page in reader.pages:
+            try:
+                page_text = page.extract_text() or ""
+            except Exception:
+                page_text = ""
+            if page_text:
+                pages_text.append(page_text.strip())
+        return "\n\n".join(pages_text)